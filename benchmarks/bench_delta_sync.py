@@ -0,0 +1,44 @@
+"""
+Delta sync benchmark — bytes on wire and CPU per burst vs shipping the whole state
+
+Run from repo root: python -m benchmarks.bench_delta_sync --entries 200000 --bursts 9
+"""
+
+import argparse
+import random
+import time
+
+from shards.delta_sync import ChunkIndex, LoopbackEndpoint, encode_value
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=200_000)
+    parser.add_argument("--bursts", type=int, default=9)
+    parser.add_argument("--edits", type=int, default=33, help="state edits between bursts")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    state = {
+        "kinetics_history": [round(rng.uniform(0, 100), 3) for _ in range(args.entries)],
+        "logistics_queue": [{"player": f"p{i}", "flavor": "butter"} for i in range(args.entries // 10)],
+    }
+    index, endpoint = ChunkIndex(), LoopbackEndpoint()
+    for burst in range(args.bursts):
+        if burst:
+            for _ in range(args.edits):
+                state["kinetics_history"][rng.randrange(args.entries)] = round(rng.uniform(0, 100), 3)
+            state["logistics_queue"].append({"player": f"p{burst}", "flavor": "gravy"})
+        cpu = time.process_time()
+        blobs = {key: encode_value(value) for key, value in state.items()}
+        for key, blob in blobs.items():
+            index.update(key, blob)
+        frame = index.take_delta() or b""
+        synced = endpoint.push(frame) == index.root() if frame else True
+        cpu_ms = (time.process_time() - cpu) * 1000
+        whole = sum(len(b) for b in blobs.values())
+        print(f"burst {burst}: {len(frame):>9} B on wire vs {whole:>9} B whole state  "
+              f"{cpu_ms:>7.1f} ms CPU  replica {'in sync' if synced else 'DIVERGED'}")
+
+if __name__ == "__main__":
+    main()
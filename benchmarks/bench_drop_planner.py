@@ -0,0 +1,45 @@
+"""
+Drop planner benchmark — multi-stop routes vs one drone round trip per drop
+
+Run from repo root: python -m benchmarks.bench_drop_planner --sizes 10000 33000 100000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from core.drone_pod import DronePod
+from core.drop_planner import DropPlanner
+from core.fleet_dispatcher import HOME_BASE
+
+def synthetic_destinations(n: int, seed: int) -> np.ndarray:
+    """Clustered city demand — neighbourhood hot spots plus uniform background, lat/lng rows"""
+    rng = np.random.default_rng(seed)
+    hubs = rng.uniform([-0.25, -0.35], [0.25, 0.35], size=(33, 2))
+    clustered = hubs[rng.integers(0, len(hubs), n)] + rng.normal(0, 0.01, size=(n, 2))
+    background = rng.uniform([-0.25, -0.35], [0.25, 0.35], size=(n, 2))
+    pick = rng.random(n) < 0.7
+    offsets = np.where(pick[:, None], clustered, background)
+    return offsets + np.array(HOME_BASE)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 33_000, 100_000])
+    parser.add_argument("--pods", type=int, default=333)
+    parser.add_argument("--max-stops", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    for n in args.sizes:
+        destinations = synthetic_destinations(n, args.seed)
+        planner = DropPlanner([DronePod() for _ in range(args.pods)], max_stops=args.max_stops)
+        t0 = time.perf_counter()
+        plan = planner.plan(destinations)
+        elapsed = time.perf_counter() - t0
+        print(f"{n:>7} drops  plan {elapsed * 1000:>7.1f} ms  {len(plan.routes):>6} routes  "
+              f"{plan.distance_km:>10.0f} km vs {plan.baseline_km:>10.0f} km single-drop  "
+              f"({plan.distance_km / plan.baseline_km:.1%} of baseline)")
+
+if __name__ == "__main__":
+    main()
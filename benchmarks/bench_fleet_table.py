@@ -0,0 +1,98 @@
+"""
+Fleet table benchmark — memory per pod and query / bulk-transition latency, struct-of-arrays
+table against a list of DronePod objects
+
+Run from repo root: python -m benchmarks.bench_fleet_table --pods 100000 --arms 33333
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from core.drone_pod import DronePod
+from core.fleet_table import FleetTable
+
+def allocated(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return obj, size
+
+def best_ms(fn, repeat: int = 9) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pods", type=int, default=100_000)
+    parser.add_argument("--arms", type=int, default=33_333)
+    parser.add_argument("--min-cycles", type=int, default=333)
+    parser.add_argument("--hours", type=float, default=6.0, help="route length the cooling window must still cover")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(args.seed)
+    elapsed = rng.uniform(0, 120, args.pods)
+    cycles = rng.integers(0, 1000, args.pods)
+    
+    def objects():
+        pods = [DronePod() for _ in range(args.pods)]
+        for pod, e, c in zip(pods, elapsed.tolist(), cycles.tolist()):
+            pod.cooling_elapsed_h, pod.reuse_cycle = e, c
+        return pods
+    
+    def table():
+        fleet = FleetTable(args.pods, args.arms)
+        fleet.pods.cooling_elapsed_h[:] = elapsed
+        fleet.pods.reuse_cycle[:] = cycles
+        return fleet
+    
+    pods, object_bytes = allocated(objects)
+    fleet, table_bytes = allocated(table)
+    print(f"{args.pods:,} pods — DronePod objects {object_bytes / args.pods:6.0f} B/pod, "
+          f"table {table_bytes / args.pods:4.0f} B/pod (columns {fleet.pods.nbytes / args.pods:.0f} B)")
+    
+    def object_query():
+        return [i for i, p in enumerate(pods)
+                if p.reuse_cycle > args.min_cycles and p.cool_hours - p.cooling_elapsed_h >= args.hours]
+    
+    def table_query():
+        return fleet.pods.query(args.min_cycles, args.hours)
+    
+    assert object_query() == table_query().tolist()
+    print(f"query 'cycles > {args.min_cycles}, ≥ {args.hours:g} h cooling left': "
+          f"objects {best_ms(object_query):7.2f} ms, table {best_ms(table_query):5.2f} ms "
+          f"({len(table_query()):,} pods)")
+    
+    ready = table_query()
+    t0 = time.perf_counter()
+    flying, arms = fleet.dispatch(len(ready), args.hours, args.min_cycles)
+    dispatch_ms = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    fleet.pods.advance(args.hours)
+    fleet.land(flying, arms)
+    land_ms = (time.perf_counter() - t0) * 1000
+    print(f"bulk dispatch {len(flying):,} pods + {len(arms):,} arms {dispatch_ms:.2f} ms, advance + land {land_ms:.2f} ms")
+    
+    def object_deploy():
+        for i in ready[:len(flying)].tolist():
+            pod = pods[i]
+            pod.reuse_cycle -= 1
+            pod.cooling_elapsed_h += args.hours
+            pod.deploy()
+    
+    t0 = time.perf_counter()
+    object_deploy()
+    print(f"object loop deploy of the same pods {(time.perf_counter() - t0) * 1000:.2f} ms")
+    print(fleet.status())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Instrumentation benchmark — per-call cost of a stage timer disabled vs enabled, and
+close_loop wall time with instrumentation off, on, and on with the sampling profiler
+
+Run from repo root: python -m benchmarks.bench_instrumentation --loops 333 --calls 333333
+"""
+
+import argparse
+import json
+import time
+
+from core.instrumentation import Histogram, Instrumentation, compare, shared_instruments
+from core.pyrolysis_recycle import PyrolysisRecycle
+
+def timer_ns(instruments, calls: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(calls):
+        with instruments.time("bench.stage"):
+            pass
+    return (time.perf_counter() - t0) / calls * 1e9
+
+def loops_ms(recycle, loops: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(loops):
+        recycle.close_loop()
+    return (time.perf_counter() - t0) / loops * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--loops", type=int, default=333)
+    parser.add_argument("--calls", type=int, default=333_333)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    t0 = time.perf_counter()
+    for _ in range(args.calls):
+        pass
+    empty_ns = (time.perf_counter() - t0) / args.calls * 1e9
+    print(f"empty loop            {empty_ns:6.0f} ns/iter")
+    print(f"timer disabled        {timer_ns(Instrumentation(enabled=False), args.calls):6.0f} ns/iter")
+    print(f"timer enabled         {timer_ns(Instrumentation(), args.calls):6.0f} ns/iter")
+    
+    shared = shared_instruments()
+    recycle = PyrolysisRecycle(drone_count=12, seed=args.seed)
+    shared.enabled = False
+    off = loops_ms(recycle, args.loops)
+    shared.enabled = True
+    on = loops_ms(recycle, args.loops)
+    shared.start_profiler(interval=0.001)
+    profiled = loops_ms(recycle, args.loops)
+    shared.stop_profiler()
+    print(f"close_loop off {off:.3f} ms, on {on:.3f} ms ({on / off - 1:+.1%}), "
+          f"profiled {profiled:.3f} ms ({profiled / off - 1:+.1%})")
+    
+    snapshot = json.loads(json.dumps(shared.snapshot()))  # as a synced shard would hold it
+    loop = Histogram.from_snapshot(snapshot["timers"]["recycle.close_loop"])
+    print(f"snapshot {len(json.dumps(snapshot)):,} B, close_loop p50 {loop.quantile(0.5) * 1000:.3f} ms "
+          f"p99 {loop.quantile(0.99) * 1000:.3f} ms, self-compare {compare(snapshot, snapshot)}")
+    print(shared.status())
+
+if __name__ == "__main__":
+    main()
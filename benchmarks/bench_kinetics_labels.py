@@ -0,0 +1,56 @@
+"""
+Kinetics labelling benchmark — degradation labels per second, memoized against recomputed
+
+Run from repo root: python -m benchmarks.bench_kinetics_labels --sachets 99999 --combos 9
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from core.kinetics_cache import shared_cache
+from core.mycelium_kinetics import MyceliumKinetics
+from core.seaweed_film_kinetics import SeaweedFilmKinetics
+from core.tetra_edible_degradation import TetraEdibleDegradation
+
+def label(seaweed, tetra, mycelium, temp_c: float) -> tuple:
+    return seaweed.full_degradation_report(), tetra.full_degradation_report(), mycelium.industrial_compost(temp_c)
+
+def label_uncached(seaweed, tetra, mycelium, temp_c: float) -> tuple:
+    return (SeaweedFilmKinetics.full_degradation_report.__wrapped__(seaweed),
+            TetraEdibleDegradation.full_degradation_report.__wrapped__(tetra),
+            MyceliumKinetics.industrial_compost.__wrapped__(mycelium, temp_c))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sachets", type=int, default=99_999)
+    parser.add_argument("--combos", type=int, default=9, help="distinct thickness / compost temperature combinations")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(args.seed)
+    thickness = np.round(rng.uniform(0.1, 0.5, args.combos), 2)
+    temps = np.round(rng.uniform(40, 65, args.combos), 1)
+    picks = rng.integers(args.combos, size=args.sachets).tolist()
+    models = [(SeaweedFilmKinetics(float(thickness[c])), TetraEdibleDegradation(float(thickness[c])),
+               MyceliumKinetics(), float(temps[c])) for c in range(args.combos)]
+    
+    for name, fn in (("recomputed", label_uncached), ("memoized", label)):
+        t0 = time.perf_counter()
+        for c in picks:
+            seaweed, tetra, mycelium, temp_c = models[c]
+            fn(seaweed, tetra, mycelium, temp_c)
+        elapsed = time.perf_counter() - t0
+        print(f"{name:<26} {args.sachets / elapsed:>12,.0f} labels/s")
+    
+    # Fresh model objects per sachet — parameters interned, so equal models still share entries
+    t0 = time.perf_counter()
+    for c in picks:
+        label(SeaweedFilmKinetics(float(thickness[c])), TetraEdibleDegradation(float(thickness[c])),
+              models[c][2], float(temps[c]))
+    print(f"{'memoized, fresh models':<26} {args.sachets / (time.perf_counter() - t0):>12,.0f} labels/s")
+    print(f"Shared cache: {shared_cache().info()}")
+
+if __name__ == "__main__":
+    main()
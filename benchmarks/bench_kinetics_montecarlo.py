@@ -0,0 +1,51 @@
+"""
+Kinetics Monte Carlo benchmark — samples/s per worker count, peak memory, sketch accuracy
+
+Run from repo root: python -m benchmarks.bench_kinetics_montecarlo --samples 100000000 --workers 1 4
+"""
+
+import argparse
+import resource
+import time
+
+import numpy as np
+
+from core.kinetics_montecarlo import KineticsMonteCarlo, QuantileSketch
+from core.mycelium_kinetics import MyceliumKinetics
+
+def peak_rss_mb(who=resource.RUSAGE_SELF) -> float:
+    return resource.getrusage(who).ru_maxrss / 1024  # KiB on Linux
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=33_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 3])
+    parser.add_argument("--chunk", type=int, default=1 << 18)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    engine = KineticsMonteCarlo(MyceliumKinetics())
+    print(f"Sketch: {QuantileSketch().nbytes / 1024:.0f} KiB, chunk {args.chunk:,} samples")
+    intervals = set()
+    for workers in args.workers:
+        t0 = time.perf_counter()
+        sketch = engine.run(args.samples, args.seed, args.chunk, workers)
+        elapsed = time.perf_counter() - t0
+        low, median, high = engine.interval(sketch)
+        intervals.add((low, median, high))
+        print(f"{workers:>2} workers: {args.samples / elapsed / 1e6:6.2f} M samples/s  "
+              f"median {median:.1f} d, 95% {low:.1f}–{high:.1f} d  "
+              f"peak RSS {peak_rss_mb():.0f} MB (workers {peak_rss_mb(resource.RUSAGE_CHILDREN):.0f} MB)")
+    print(f"Identical intervals across worker counts: {len(intervals) == 1}")
+    
+    # Sketch against exact quantiles on a sample that fits in memory
+    rng = np.random.default_rng(args.seed)
+    values = rng.lognormal(5, 0.4, 1_000_000)
+    sketch = QuantileSketch()
+    sketch.add(values)
+    qs = (0.025, 0.5, 0.975, 0.999)
+    worst = max(abs(s / e - 1) for s, e in zip(sketch.quantiles(qs), np.quantile(values, qs)))
+    print(f"Sketch vs exact quantiles: worst relative error {worst:.2%} (bound {sketch.relative_accuracy:.0%})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Order log benchmark — events written per minute (per-row and columnar), log size, a day's
+log reopened + filtered + aggregated, and replay speed against real time
+
+Run from repo root: python -m benchmarks.bench_order_log --events 3333333 --players 99999
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from core.cycle_pipeline import CyclePipeline
+from core.order_log import COLUMNS, CYCLE, OrderLog, OrderReplay
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=3_333_333, help="one day of orders")
+    parser.add_argument("--players", type=int, default=99_999)
+    parser.add_argument("--row-sample", type=int, default=333_333, help="events written one append() at a time")
+    parser.add_argument("--batch", type=int, default=33_333)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(args.seed)
+    n = args.events
+    t = np.sort(rng.uniform(0, 86400, n))
+    kind = rng.choice(3, n, p=(0.6, 0.33, 0.07)).astype(np.uint8)
+    flavor = np.array(["butter", "gravy", "chocolate"])[rng.integers(0, 3, n)].tolist()
+    player = [f"player{i}" for i in rng.zipf(1.3, n) % args.players]
+    vitamins = np.array(['{"D3":333}', '{"B12":2.4,"D3":600}', '{}'])[kind % 3].tolist()
+    lat, lng = rng.uniform(43.4, 43.9, n), rng.uniform(-79.7, -79.1, n)
+    outcome = (rng.random(n) < 0.01).astype(np.uint8)
+    latency = rng.gamma(3, 0.003, n)
+    path = os.path.join(tempfile.mkdtemp(), "orders.mol")
+    
+    log = OrderLog(path)
+    m = min(args.row_sample, n)
+    t0 = time.perf_counter()
+    for i in range(m):
+        log.append(t[i], kind[i], flavor[i], player[i], vitamins[i], lat[i], lng[i], outcome[i], latency[i])
+    row_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for start in range(m, n, args.batch):
+        end = min(start + args.batch, n)
+        log.append_many(t[start:end], kind[start:end], flavor[start:end], player[start:end], vitamins[start:end],
+                        lat[start:end], lng[start:end], outcome[start:end], latency[start:end])
+    log.close()
+    bulk_s = time.perf_counter() - t0
+    raw = n * sum(np.dtype(dtype).itemsize for _, dtype in COLUMNS)
+    print(f"append()       {m / row_s * 60 / 1e6:6.1f} M events/min")
+    print(f"append_many()  {(n - m) / bulk_s * 60 / 1e6:6.1f} M events/min")
+    print(f"{n:,} events → {os.path.getsize(path) / 1e6:.1f} MB on disk ({raw / 1e6:.1f} MB raw columns)")
+    
+    t0 = time.perf_counter()
+    log = OrderLog(path)
+    open_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    hourly = log.aggregate("time", bucket_s=3600)
+    by_flavor = log.aggregate("flavor", kinds=[CYCLE])
+    evening = log.select(["player", "latency"], start=18 * 3600, end=21 * 3600, flavors=["chocolate"])
+    query_s = time.perf_counter() - t0
+    peak = max(hourly.values(), key=lambda bucket: bucket["orders"])
+    print(f"reopen {open_s * 1000:.0f} ms, hourly + flavor aggregates + evening filter {query_s * 1000:.0f} ms — "
+          f"peak hour {peak['orders']:,} orders, {len(by_flavor)} flavors, {len(evening['player']):,} evening chocolate orders")
+    
+    replay = OrderReplay(log, kinds=[CYCLE], start=12 * 3600, end=13 * 3600)
+    report = replay.to_pipeline(CyclePipeline(workers={"recycle": 3}))
+    print(f"replay: {report['replayed']:,} cycles of one hour through the pipeline in {report['wall_s']:.2f} s "
+          f"({report['speedup']:,.0f}× real time)")
+    print(log.status())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Shard boot benchmark — cold import + boot_offline, and first speak() latency, each in a fresh interpreter
+
+Run from repo root: python -m benchmarks.bench_shard_boot --runs 9
+Without the voices packages installed, a seeded synthetic pack of the same shape is generated.
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BOOT = """
+import time
+t0 = time.perf_counter()
+from shards.shard_builder import build_shard
+shard = build_shard()
+shard.boot_offline()
+print((time.perf_counter() - t0) * 1000)
+"""
+
+EAGER = """
+import importlib, time
+t0 = time.perf_counter()
+for name in ("voices.skins.eternal_warmth", "voices.mythic_lattice_pack"):
+    importlib.import_module(name)
+try:
+    importlib.import_module("core.logistics_controller")
+except ImportError:  # partial tree — import what the controller pulls in
+    for name in ("core.cycle_pipeline", "core.fleet_dispatcher"):
+        importlib.import_module(name)
+print((time.perf_counter() - t0) * 1000)
+"""
+
+SPEAK = """
+import time
+from shards.shard_builder import build_shard
+shard = build_shard(flavor_pack={flavor_pack})
+t0 = time.perf_counter()
+shard.speak("Eternal thriving flows through your call, mate.", culture_key="norse")
+print((time.perf_counter() - t0) * 1000)
+"""
+
+def synthetic_pack(root: str, archetypes: int, phrases: int, seed: int):
+    """voices/skins/eternal_warmth.py + voices/mythic_lattice_pack.py with seeded phrase tables"""
+    rng = random.Random(seed)
+    words = ["mercy", "thriving", "lattice", "warmth", "eternal", "harmony", "joy", "abundance", "sky", "grandma"]
+    os.makedirs(os.path.join(root, "voices", "skins"))
+    with open(os.path.join(root, "voices", "skins", "eternal_warmth.py"), "w") as f:
+        f.write("COMFORT = [\n")
+        f.writelines(f"    {' '.join(rng.choices(words, k=9))!r},\n" for _ in range(phrases))
+        f.write("]\n\nclass EternalWarmth:\n    def speak(self, text):\n"
+                "        return f\"{COMFORT[len(text) % len(COMFORT)]} — {text}\"\n")
+    with open(os.path.join(root, "voices", "mythic_lattice_pack.py"), "w") as f:
+        f.write("ARCHETYPES = {\n")
+        for a in range(archetypes):
+            f.write(f"    'archetype_{a}': [\n")
+            f.writelines(f"        {' '.join(rng.choices(words, k=9))!r},\n" for _ in range(phrases))
+            f.write("    ],\n")
+        f.write("}\nARCHETYPES['norse'] = ARCHETYPES['archetype_0']\n\n"
+                "def summon_mythic(culture_key, text):\n"
+                "    lines = ARCHETYPES[culture_key]\n"
+                "    return f\"{lines[len(text) % len(lines)]} — {text}\"\n")
+
+def timed(code: str, env: dict, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", code], env=env, cwd=REPO,
+                             capture_output=True, text=True, check=True)
+        samples.append(float(out.stdout.split()[-1]))
+    return statistics.median(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=9)
+    parser.add_argument("--archetypes", type=int, default=21)
+    parser.add_argument("--phrases", type=int, default=333)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [REPO]
+        if importlib.util.find_spec("voices") is None:
+            synthetic_pack(os.path.join(tmp, "packs"), args.archetypes, args.phrases, args.seed)
+            paths.append(os.path.join(tmp, "packs"))
+            print(f"voices not installed — synthetic pack: {args.archetypes} archetypes × {args.phrases} phrases")
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(paths), XDG_CACHE_HOME=os.path.join(tmp, "cache"))
+        cache = os.path.join(tmp, "cache", "mercyos", "voice_packs.mpk")
+        
+        timed(EAGER, env, 1)  # warm __pycache__ so both paths compare against compiled bytecode
+        eager = timed(EAGER, env, args.runs)
+        boot = timed(BOOT, env, args.runs)
+        plain = timed(SPEAK.format(flavor_pack=False), env, args.runs)
+        cold = timed(SPEAK.format(flavor_pack=True), env, 1)  # builds the pack cache
+        warm = timed(SPEAK.format(flavor_pack=True), env, args.runs)
+        print(f"boot (import + build_shard + boot_offline): {boot:8.2f} ms   eager imports (old boot): {eager:8.2f} ms")
+        print(f"first speak, pack cache warm (mmap):        {warm:8.2f} ms   cache build: {cold:8.2f} ms")
+        print(f"first speak, no pack cache (import):        {plain:8.2f} ms   cache file: {os.path.getsize(cache)} B")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Solar poller benchmark — cycle latency and tick lag as the charge-controller count grows,
+for natively async controllers and for blocking ones read on the poller's thread pool
+
+Run from repo root: python -m benchmarks.bench_solar_poller --devices 1 9 33 99 333 --ticks 33
+"""
+
+import argparse
+import asyncio
+
+import numpy as np
+
+from hardware.solar_sources import AsyncSolarPoller, SimulatedSource
+
+async def measure(devices: int, blocking: bool, args):
+    sources = [SimulatedSource(f"mppt-{d}", latency_s=args.latency_ms / 1000, jitter_s=args.jitter_ms / 1000,
+                               seed=args.seed + d, blocking=blocking) for d in range(devices)]
+    poller = AsyncSolarPoller(sources, interval_s=args.interval_ms / 1000, timeout_s=args.timeout_ms / 1000,
+                              ring_capacity=args.ticks)
+    try:
+        await poller.run(cycles=args.ticks)
+    finally:
+        poller.close()
+    return poller
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--devices", type=int, nargs="+", default=[1, 9, 33, 99, 333])
+    parser.add_argument("--ticks", type=int, default=33)
+    parser.add_argument("--interval-ms", type=float, default=100.0)
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="simulated VE.Direct / BLE round trip")
+    parser.add_argument("--jitter-ms", type=float, default=9.0)
+    parser.add_argument("--timeout-ms", type=float, default=60.0)
+    parser.add_argument("--modes", nargs="+", choices=("async", "blocking"), default=["async", "blocking"],
+                        help="blocking = read() sleeps on a pool thread, like a serial driver")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    for mode, devices in ((mode, devices) for mode in args.modes for devices in args.devices):
+        poller = asyncio.run(measure(devices, mode == "blocking", args))
+        cycle = np.asarray(poller.cycle_latency) * 1000
+        lag = np.asarray(poller.tick_lag) * 1000
+        sequential = devices * args.latency_ms
+        print(f"{mode:>8} {devices:>4} devices: cycle p50 {np.percentile(cycle, 50):6.1f} ms  p99 {np.percentile(cycle, 99):6.1f} ms  "
+              f"tick lag p99 {np.percentile(lag, 99):5.2f} ms  timeouts {sum(poller.timeouts.values()):>3}  "
+              f"missed {poller.missed_ticks}  (sequential ≈ {sequential:,.0f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Tyranny gate benchmark — MB/s scanned against a blocklist of thousands of terms
+
+Run from repo root: python -m benchmarks.bench_tyranny_gate --terms 3333 --megabytes 33
+"""
+
+import argparse
+import random
+import string
+import time
+
+from shards.tyranny_gate import TyrannyGate
+
+def synthetic_text(rng: random.Random, size: int) -> str:
+    """Mixed-case prose-like text — word lengths 2..9, spaces and punctuation"""
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9))) for _ in range(9_000)]
+    out, total = [], 0
+    while total < size:
+        word = rng.choice(words)
+        if rng.random() < 0.1:
+            word = word.capitalize()
+        out.append(word)
+        total += len(word) + 1
+    return " ".join(out)[:size]
+
+def rate(label: str, seconds: float, size: int):
+    print(f"{label:<34} {size / 1e6 / seconds:9.1f} MB/s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--terms", type=int, default=3333)
+    parser.add_argument("--megabytes", type=float, default=33)
+    parser.add_argument("--batch", type=int, default=33_000, help="small payloads in the batch run")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    terms = {"".join(rng.choices(string.ascii_lowercase, k=rng.randint(9, 15))) for _ in range(args.terms)}
+    text = synthetic_text(rng, int(args.megabytes * 1e6))
+    blob = text.encode()
+    gate = TyrannyGate(terms)
+    
+    t0 = time.perf_counter()
+    gate.compile()
+    print(f"{len(gate)} terms compiled in {(time.perf_counter() - t0) * 1000:.0f} ms")
+    
+    for label, data in (("str", text), ("bytes", blob), ("memoryview", memoryview(blob))):
+        t0 = time.perf_counter()
+        hit = gate.blocked(data)
+        rate(f"single pass, {label} (hit={hit})", time.perf_counter() - t0, len(blob))
+    
+    payloads = [text[i:i + 333] for i in range(0, min(len(text), args.batch * 333), 333)]
+    size = sum(map(len, payloads))
+    t0 = time.perf_counter()
+    gate.blocked_many(payloads)
+    rate(f"blocked_many, {len(payloads)} × 333 B", time.perf_counter() - t0, size)
+    t0 = time.perf_counter()
+    [gate.blocked(p) for p in payloads]
+    rate(f"blocked() loop, {len(payloads)} × 333 B", time.perf_counter() - t0, size)
+    
+    # Old gate shape: lower() copy + one substring scan per term — sampled, it is slow
+    sample = text[:333_000]
+    t0 = time.perf_counter()
+    lowered = sample.lower()
+    any(term in lowered for term in terms)
+    rate("lower() + per-term scan (old)", time.perf_counter() - t0, len(sample))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Benchmark harness — seeded synthetic workloads at fixed scales, one fresh process each,
+throughput / latency percentiles / peak RSS to JSON, regressions flagged against a baseline
+
+Run from repo root: python -m benchmarks.harness --scale small --out bench.json
+Compare:            python -m benchmarks.harness --scale small --compare bench.json
+Everything runs offline — SimulatedDroneController and LinkedStarlinkSync stand in for the
+fleet and the sky link.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import platform
+import random
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+SCALES = {"small": 1, "medium": 9, "large": 99}
+
+def _timed(calls) -> tuple:
+    """Run each zero-arg call, timing it — (seconds, [latency s], [result])"""
+    latencies, results = [], []
+    start = time.perf_counter()
+    for call in calls:
+        t0 = time.perf_counter()
+        results.append(call())
+        latencies.append(time.perf_counter() - t0)
+    return time.perf_counter() - start, latencies, results
+
+def kinetics_stack(scale: int, seed: int) -> dict:
+    """Laminate stack over batches of environment readings"""
+    from core.kinetics_registry import default_registry
+    rng = np.random.default_rng(seed)
+    stack = default_registry().stack([("mycelium_biopolymer", 1.0), ("tetra_edible", 0.3), ("seaweed_algae", 0.2)])
+    batches = []
+    for _ in range(33 * scale):
+        n = 3333
+        batches.append({"temp_c": rng.uniform(10, 40, n), "rh_percent": rng.uniform(40, 100, n),
+                        "ph": rng.uniform(5, 8, n), "lux": rng.uniform(0, 500, n),
+                        "o2_percent": rng.uniform(15, 21, n), "pressure_kpa": rng.uniform(95, 105, n)})
+    seconds, latencies, _ = _timed(lambda env=env: stack.days_to_degrade("soil", env) for env in batches)
+    return {"ops": 3333 * len(batches), "seconds": seconds, "latencies": latencies}
+
+def kinetics_reports(scale: int, seed: int) -> dict:
+    """Label reports for a seeded mix of film thicknesses — what the printer asks per sachet"""
+    from core.seaweed_film_kinetics import SeaweedFilmKinetics
+    from core.tetra_edible_degradation import TetraEdibleDegradation
+    rng = random.Random(seed)
+    thicknesses = [round(rng.uniform(0.1, 0.5), 2) for _ in range(3333 * scale)]
+    models = (SeaweedFilmKinetics, TetraEdibleDegradation)
+    seconds, latencies, _ = _timed(lambda i=i, t=t: models[i % 2](t).full_degradation_report()
+                                   for i, t in enumerate(thicknesses))
+    return {"ops": len(thicknesses), "seconds": seconds, "latencies": latencies}
+
+def tag_sweep(scale: int, seed: int) -> dict:
+    """Multi-drone sweeps — fragments tagged into the tag store"""
+    from core.pyrolysis_recycle import PyrolysisRecycle
+    recycle = PyrolysisRecycle(drone_count=12, seed=seed)
+    seconds, latencies, _ = _timed(recycle.drone_sweep_simulation for _ in range(99 * scale))
+    return {"ops": recycle.collected_fragments, "seconds": seconds, "latencies": latencies,
+            "extra": {"tags": len(recycle.tag_database)}}
+
+def recycle_batch(scale: int, seed: int) -> dict:
+    """Tag read + purity verify + reclaim, 100 fragments a batch"""
+    from core.pyrolysis_recycle import PyrolysisRecycle
+    recycle = PyrolysisRecycle(seed=seed)
+    batches = 333 * scale
+    recycle.generate_tags(100 * batches)
+    recycle.collected_fragments += 100 * batches
+    seconds, latencies, _ = _timed(recycle.process_batch for _ in range(batches))
+    return {"ops": 100 * batches, "seconds": seconds, "latencies": latencies,
+            "extra": {"energy_kwh": recycle.energy_used_kwh}}
+
+def full_cycle(scale: int, seed: int) -> dict:
+    """LogisticsController.full_cycle — print, fly, hand off, close the loop, over a simulated fleet"""
+    from benchmarks.stand_ins import SimulatedDroneController
+    from core.logistics_controller import LogisticsController
+    from core.pyrolysis_recycle import PyrolysisRecycle
+    rng = random.Random(seed)
+    controller = LogisticsController(drone_fleet=SimulatedDroneController(seed=seed))
+    controller.recycle = PyrolysisRecycle(seed=seed)  # seeded tag draws — the default reactor is unseeded
+    flavors = ("butter", "gravy", "chocolate")
+    orders = [(rng.choice(flavors), {"D": rng.choice((600, 1000)), "B12": 2.4},
+               {"lat": 43.65 + rng.uniform(-0.2, 0.2), "lng": -79.38 + rng.uniform(-0.3, 0.3)})
+              for _ in range(333 * scale)]
+    seconds, latencies, _ = _timed(lambda order=order: controller.full_cycle(*order) for order in orders)
+    return {"ops": len(orders), "seconds": seconds, "latencies": latencies}
+
+def dispatch(scale: int, seed: int) -> dict:
+    """Gel drops through FleetDispatcher over a simulated fleet — latency from the shared start, queue waits included"""
+    from benchmarks.stand_ins import SimulatedDroneController
+    from core.fleet_dispatcher import FleetDispatcher
+    from core.pyrolysis_recycle import PyrolysisRecycle
+    rng = random.Random(seed)
+    dests = [{"lat": 43.65 + rng.uniform(-0.2, 0.2), "lng": -79.38 + rng.uniform(-0.3, 0.3)} for _ in range(333 * scale)]
+    
+    latencies = []
+    
+    async def run():
+        dispatcher = FleetDispatcher(SimulatedDroneController(0.001, 0.0003, seed), PyrolysisRecycle(seed=seed), 12)
+        async with dispatcher:
+            futures = []
+            for i, dest in enumerate(dests):
+                future = await dispatcher.submit(f"player{i}", dest)
+                future.add_done_callback(lambda _: latencies.append(time.perf_counter() - start))
+                futures.append(future)
+            await asyncio.gather(*futures)
+    
+    start = time.perf_counter()
+    asyncio.run(run())
+    return {"ops": len(dests), "seconds": time.perf_counter() - start, "latencies": latencies}
+
+def shard_sync(scale: int, seed: int) -> dict:
+    """Shard edits then a burst — chunked diff, delta frame, loopback replica apply"""
+    from benchmarks.stand_ins import LinkedStarlinkSync
+    from shards.shard_builder import MercyOSShard
+    rng = random.Random(seed)
+    shard = MercyOSShard()
+    history = [round(rng.uniform(0, 100), 3) for _ in range(33_333 * scale)]
+    shard.kinetics_history = history
+    sync = LinkedStarlinkSync(shard)
+    sync.burst_sync()  # first burst ships everything — not what the field repeats
+    wire = []
+    
+    def burst():
+        for _ in range(33):
+            history[rng.randrange(len(history))] = round(rng.uniform(0, 100), 3)
+        shard.mark_dirty("kinetics_history")
+        status = sync.burst_sync()
+        wire.append(sync.last_burst["bytes_on_wire"])
+        return status
+    
+    seconds, latencies, _ = _timed(burst for _ in range(99))
+    return {"ops": len(latencies), "seconds": seconds, "latencies": latencies,
+            "extra": {"bytes_on_wire_mean": sum(wire) / len(wire), "state_bytes": len(sync.index.blobs["kinetics_history"])}}
+
+WORKLOADS = {fn.__name__: fn for fn in (kinetics_stack, kinetics_reports, tag_sweep, recycle_batch,
+                                        full_cycle, dispatch, shard_sync)}
+
+def _run_workload(name: str, scale: int, seed: int) -> dict:
+    """Child-process entry — fresh interpreter, so ru_maxrss is this workload's peak"""
+    run = WORKLOADS[name](scale, seed)
+    latencies = np.asarray(run["latencies"]) * 1000
+    p50, p90, p99 = np.percentile(latencies, (50, 90, 99)) if len(latencies) else (np.nan,) * 3
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "ops": run["ops"],
+        "seconds": run["seconds"],
+        "throughput_per_s": run["ops"] / max(run["seconds"], 1e-9),
+        "latency_ms": {"p50": float(p50), "p90": float(p90), "p99": float(p99),
+                       "max": float(latencies.max()) if len(latencies) else None},
+        "peak_rss_mb": peak_kb / (1024 * 1024 if sys.platform == "darwin" else 1024),
+        "extra": run.get("extra", {}),
+    }
+
+def run_suite(names, scale_name: str, seed: int) -> dict:
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for name in names:
+        with ProcessPoolExecutor(1, mp_context=context) as pool:
+            results[name] = pool.submit(_run_workload, name, SCALES[scale_name], seed).result()
+        r = results[name]
+        print(f"{name:17s} {r['throughput_per_s']:>14,.0f} ops/s  p50 {r['latency_ms']['p50']:8.3f} ms  "
+              f"p99 {r['latency_ms']['p99']:8.3f} ms  peak RSS {r['peak_rss_mb']:6.1f} MB")
+    return {"meta": {"scale": scale_name, "seed": seed, "python": platform.python_version(),
+                     "machine": platform.machine(), "taken": time.time()},
+            "results": results}
+
+def compare(baseline: dict, current: dict, tolerance: float = 0.15, latency_tolerance: float = 0.33) -> list:
+    """[(workload, metric, baseline, current, change)] past tolerance — throughput down, p99 / RSS up"""
+    regressions = []
+    for name, now in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            continue
+        checks = (("throughput_per_s", before["throughput_per_s"], now["throughput_per_s"], -1, tolerance),
+                  ("p99_ms", before["latency_ms"]["p99"], now["latency_ms"]["p99"], 1, latency_tolerance),
+                  ("peak_rss_mb", before["peak_rss_mb"], now["peak_rss_mb"], 1, tolerance))
+        for metric, old, new, worse, limit in checks:
+            if not old:
+                continue
+            change = (new - old) / old
+            if change * worse > limit:
+                regressions.append((name, metric, old, new, change))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=SCALES, default="small")
+    parser.add_argument("--only", nargs="*", choices=sorted(WORKLOADS), help="workloads to run (default: all)")
+    parser.add_argument("--out", help="write results JSON here")
+    parser.add_argument("--compare", metavar="BASELINE", help="flag regressions against a stored results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="throughput drop / RSS growth allowed")
+    parser.add_argument("--latency-tolerance", type=float, default=0.33, help="p99 growth allowed — noisier")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    report = run_suite(args.only or list(WORKLOADS), args.scale, args.seed)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"results → {args.out}")
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if (baseline["meta"]["scale"], baseline["meta"]["seed"]) != (args.scale, args.seed):
+            print(f"warning: baseline ran scale {baseline['meta']['scale']} seed {baseline['meta']['seed']}")
+        regressions = compare(baseline, report, args.tolerance, args.latency_tolerance)
+        for name, metric, old, new, change in regressions:
+            print(f"REGRESSION {name} {metric}: {old:,.3f} → {new:,.3f} ({change:+.1%})")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions against {args.compare}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+StandIns-Pinnacle — Offline Fleet + Uplink Stand-Ins for Benchmarks
+MercyLogistics Pinnacle Ultramasterpiece — Jan 19 2026
+
+Local, seeded replacements for hardware we cannot reach from a bench:
+- SimulatedDroneController — StarlinkDroneController command/telemetry surface, simulated link latency
+- LinkedStarlinkSync — StarlinkSync with the sky always up and no heartbeat gate, LoopbackEndpoint by default
+"""
+
+import random
+import threading
+import time
+
+from shards.delta_sync import LoopbackEndpoint
+from shards.starlink_sync import StarlinkSync
+
+class SimulatedDroneController:
+    def __init__(self, latency_s: float = 0.003, jitter_s: float = 0.001, seed: int = 0):
+        self.latency_s = latency_s      # command round-trip over the sky link
+        self.jitter_s = jitter_s
+        self.rng = random.Random(seed)
+        self.drops = 0
+        self._lock = threading.Lock()
+    
+    def command_drop(self, drone_id: int, destination: dict, payload: str) -> str:
+        with self._lock:
+            delay = self.latency_s + self.rng.uniform(-self.jitter_s, self.jitter_s)
+            self.drops += 1
+        time.sleep(max(0.0, delay))
+        return f"Drone {drone_id} dropped {payload} at {destination.get('lat')},{destination.get('lng')}"
+    
+    def telemetry_sync(self) -> str:
+        return f"Simulated fleet — {self.drops} drops commanded."
+
+class LinkedStarlinkSync(StarlinkSync):
+    def __init__(self, shard, endpoint=None, chunk_size: int = 4096, gate=None):
+        super().__init__(shard, endpoint or LoopbackEndpoint(chunk_size), chunk_size, gate)
+        self.ping_interval = 0      # every call bursts
+    
+    def is_online(self) -> bool:
+        return True
@@ -0,0 +1,259 @@
+"""
+CyclePipeline-Pinnacle — Staged Print → Fly → Hand-Off → Recycle Pipeline
+MercyLogistics Pinnacle Ultramasterpiece — Jan 19 2026
+
+Streams many orders through the full cycle at once:
+- Four stages, each with its own bounded queue and worker count
+- Thread workers by default, process pool per stage for CPU-bound stages
+- Each recycle worker runs its own sweep crew — the recycle stage scales on its own
+- Per-stage throughput, utilisation and queue-depth metrics — bottleneck at a glance
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from core.gel_printer import GelPrinter
+from core.drone_pod import DronePod
+from core.robot_hand_off import RobotHandOff
+from core.pyrolysis_recycle import PyrolysisRecycle
+
+STAGES = ("print", "fly", "handoff", "recycle")
+
+_DONE = object()
+
+class StageMetrics:
+    __slots__ = ("name", "workers", "processed", "errors", "busy_s", "depth_max", "depth_total", "depth_samples")
+    
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.processed = 0
+        self.errors = 0
+        self.busy_s = 0.0
+        self.depth_max = 0
+        self.depth_total = 0
+        self.depth_samples = 0
+    
+    def snapshot(self, elapsed_s: float) -> dict:
+        elapsed_s = max(elapsed_s, 1e-9)
+        return {
+            "workers": self.workers,
+            "processed": self.processed,
+            "errors": self.errors,
+            "throughput_per_s": self.processed / elapsed_s,
+            "busy_s": self.busy_s,
+            "utilisation": self.busy_s / (elapsed_s * self.workers),
+            "queue_depth_max": self.depth_max,
+            "queue_depth_mean": self.depth_total / self.depth_samples if self.depth_samples else 0.0,
+        }
+
+class CyclePipeline:
+    def __init__(self, controller=None, workers: dict = None, queue_size: int = 64, processes=()):
+        self.controller = controller
+        self.workers = {stage: 1 for stage in STAGES}
+        self.workers.update(workers or {})
+        self.queue_size = queue_size
+        self.processes = set(processes)  # stages run in a process pool instead of threads
+        unknown = (set(self.workers) | self.processes) - set(STAGES)
+        if unknown:
+            raise ValueError(f"Unknown pipeline stages: {sorted(unknown)}")
+        self.metrics = {stage: StageMetrics(stage, self.workers[stage]) for stage in STAGES}
+        self.elapsed_s = 0.0
+        self._lock = threading.Lock()
+    
+    def _components(self):
+        if self.controller is None:
+            return GelPrinter(), DronePod(), RobotHandOff(), PyrolysisRecycle()
+        c = self.controller
+        return c.printer, c.drone, c.robot, c.recycle
+    
+    def _stage_fns(self):
+        printer, drone, robot, recycle = self._components()
+        crews = [recycle] + [PyrolysisRecycle(recycle.drone_count) for _ in range(self.workers["recycle"] - 1)]
+        return {
+            "print": lambda order, worker: printer.print_sachet(order["flavor"], order["vitamins"]),
+            "fly": lambda order, worker: drone.deploy(),
+            "handoff": lambda order, worker: robot.transfer(order["sachet_id"]),
+            "recycle": lambda order, worker: crews[worker].close_loop(),
+        }
+    
+    def stream(self, orders):
+        """Yield (index, result) as orders complete — completion order, not submission order.
+        
+        Metrics and elapsed_s restart with each call. Stopping iteration early shuts the
+        stage threads down; an exception raised by the orders iterable is re-raised here
+        once the orders already accepted have drained.
+        """
+        self.metrics = {stage: StageMetrics(stage, self.workers[stage]) for stage in STAGES}
+        self.elapsed_s = 0.0
+        fns = self._stage_fns()
+        queues = [queue.Queue(self.queue_size) for _ in STAGES]
+        results = queue.Queue()
+        stop = threading.Event()   # consumer gone — every thread exits at its next queue operation
+        feed_error = []
+        pools = {stage: ProcessPoolExecutor(self.workers[stage]) for stage in self.processes}
+        remaining = dict(self.workers)  # live workers per stage, last one out forwards shutdown
+        
+        def put(i, item):
+            q = queues[i]
+            while True:
+                if stop.is_set():
+                    return
+                try:
+                    q.put(item, timeout=0.05)
+                    break
+                except queue.Full:
+                    continue
+            m = self.metrics[STAGES[i]]
+            depth = q.qsize()
+            with self._lock:
+                m.depth_total += depth
+                m.depth_samples += 1
+                if depth > m.depth_max:
+                    m.depth_max = depth
+        
+        def work(i, worker):
+            stage = STAGES[i]
+            m = self.metrics[stage]
+            while True:
+                item = queues[i].get()
+                if stop.is_set():
+                    return
+                if item is _DONE:
+                    with self._lock:
+                        remaining[stage] -= 1
+                        last = remaining[stage] == 0
+                    if last:
+                        if i + 1 < len(STAGES):
+                            for _ in range(self.workers[STAGES[i + 1]]):
+                                queues[i + 1].put(_DONE)
+                        else:
+                            results.put(_DONE)
+                    return
+                index, order, steps = item
+                t0 = time.perf_counter()
+                try:
+                    if stage in pools:
+                        step = pools[stage].submit(_run_in_process, stage, order).result()
+                    else:
+                        step = fns[stage](order, worker)
+                except Exception as exc:
+                    with self._lock:
+                        m.errors += 1
+                    results.put((index, f"Cycle halted at {stage}: {exc}"))
+                    continue
+                busy = time.perf_counter() - t0
+                with self._lock:
+                    m.processed += 1
+                    m.busy_s += busy
+                steps = steps + (step,)
+                if i + 1 < len(STAGES):
+                    put(i + 1, (index, order, steps))
+                else:
+                    results.put((index, "Cycle complete: " + " → ".join(steps)))
+        
+        def feed():
+            try:
+                for index, order in enumerate(orders):
+                    if stop.is_set():
+                        return
+                    try:
+                        order = _normalise(order, index)
+                    except (TypeError, ValueError) as exc:
+                        results.put((index, f"Order rejected: {exc}"))
+                        continue
+                    put(0, (index, order, ()))
+            except Exception as exc:
+                feed_error.append(exc)  # the orders iterable itself failed — consumer re-raises it
+            finally:
+                for _ in range(self.workers[STAGES[0]]):
+                    put(0, _DONE)
+        
+        threads = [threading.Thread(target=feed, name="pipeline-feed", daemon=True)]
+        for i, stage in enumerate(STAGES):
+            threads += [threading.Thread(target=work, args=(i, w), name=f"pipeline-{stage}-{w}", daemon=True)
+                        for w in range(self.workers[stage])]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        try:
+            while True:
+                item = results.get()
+                if item is _DONE:
+                    break
+                self.elapsed_s = time.perf_counter() - start
+                yield item
+            if feed_error:
+                raise feed_error[0]
+        finally:
+            self.elapsed_s = time.perf_counter() - start
+            stop.set()
+            # Wake anything blocked on a full or empty stage queue, then let the threads exit
+            while any(t.is_alive() for t in threads):
+                for q in queues:
+                    while True:
+                        try:
+                            q.get_nowait()
+                        except queue.Empty:
+                            break
+                    try:
+                        q.put_nowait(_DONE)
+                    except queue.Full:
+                        pass
+                for t in threads:
+                    t.join(0.01)
+            for pool in pools.values():
+                pool.shutdown()
+    
+    def run(self, orders) -> list:
+        """All results in submission order"""
+        done = sorted(self.stream(orders))
+        return [result for _, result in done]
+    
+    def report(self) -> dict:
+        return {stage: m.snapshot(self.elapsed_s) for stage, m in self.metrics.items()}
+    
+    def bottleneck(self) -> str:
+        return max(STAGES, key=lambda stage: self.metrics[stage].busy_s / self.metrics[stage].workers)
+    
+    def status(self) -> str:
+        report = self.report()
+        stages = " | ".join(f"{stage} {r['throughput_per_s']:.0f}/s q≤{r['queue_depth_max']}"
+                            for stage, r in report.items())
+        return f"Pipeline: {stages} — bottleneck {self.bottleneck()}."
+
+def _normalise(order, index: int) -> dict:
+    """Accept dict orders or (flavor, vitamins, destination) tuples"""
+    if not isinstance(order, dict):
+        flavor, vitamins, destination = order
+        order = {"flavor": flavor, "vitamins": vitamins, "destination": destination}
+    else:
+        order = dict(order)
+    order.setdefault("sachet_id", f"sachet-{index + 1:03d}")
+    return order
+
+_process_components = {}
+
+def _run_in_process(stage: str, order: dict) -> str:
+    # One component set per worker process, built on first use
+    if not _process_components:
+        _process_components.update(print=GelPrinter(), fly=DronePod(), handoff=RobotHandOff(),
+                                   recycle=PyrolysisRecycle())
+    component = _process_components[stage]
+    if stage == "print":
+        return component.print_sachet(order["flavor"], order["vitamins"])
+    if stage == "fly":
+        return component.deploy()
+    if stage == "handoff":
+        return component.transfer(order["sachet_id"])
+    return component.close_loop()
+
+# Integration test
+if __name__ == "__main__":
+    orders = [("butter", {"D3": 333}, {"lat": 43.65, "lng": -79.38})] * 3000
+    pipeline = CyclePipeline(workers={"recycle": 3})
+    results = pipeline.run(orders)
+    print(f"{len(results)} cycles in {pipeline.elapsed_s:.2f}s")
+    print(pipeline.status())
@@ -8,6 +8,8 @@ Carbon lattice pod — Peltier cooled, flower-open, RF-tagged return
 class DronePod:
     def __init__(self):
         self.cool_temp = 4      # °C for 96 h
+        self.cool_hours = 96    # Peltier hold window per charge
+        self.cooling_elapsed_h = 0.0  # hours since last base recharge
         self.open_style = "flower"  # petal deploy
         self.reuse_cycle = 1000
     
@@ -0,0 +1,158 @@
+"""
+DropPlanner-Pinnacle — Multi-Stop MercyGel Route Planner
+MercyLogistics Pinnacle Ultramasterpiece — Jan 19 2026
+
+Plans a window of pending drops instead of one drone per drop:
+- Grid index over local km coordinates, serpentine cell walk keeps groups compact
+- Groups of ≤ max_stops ordered nearest-neighbour from base, vectorized across all groups
+- Routes assigned to pods within their cooling window (4°C / 96 h), reuse-cycle budget and the
+  planning horizon — work that would finish past it is deferred to the next window
+- Every route returns to base — Peltier recharge, fragments unloaded
+"""
+
+import heapq
+import math
+
+import numpy as np
+
+from core.fleet_dispatcher import HOME_BASE
+
+EARTH_RADIUS_KM = 6371.0
+
+class Route:
+    __slots__ = ("pod", "stops", "distance_km", "duration_h")
+    
+    def __init__(self, pod: int, stops: np.ndarray, distance_km: float, duration_h: float):
+        self.pod = pod                  # index into the planner's pods
+        self.stops = stops              # drop indices in flight order
+        self.distance_km = distance_km  # base → stops → base
+        self.duration_h = duration_h
+    
+    def __repr__(self):
+        return f"Route(pod={self.pod}, stops={len(self.stops)}, {self.distance_km:.1f} km, {self.duration_h:.2f} h)"
+
+class DropPlan:
+    def __init__(self, routes: list, unassigned: np.ndarray, baseline_km: float):
+        self.routes = routes
+        self.unassigned = unassigned    # drop indices no pod could take this window
+        self.baseline_km = baseline_km  # one round trip per drop, the old behaviour
+    
+    @property
+    def distance_km(self) -> float:
+        return sum(r.distance_km for r in self.routes)
+    
+    def status(self) -> str:
+        saved = 1 - self.distance_km / self.baseline_km if self.baseline_km else 0.0
+        return (f"Drop plan: {len(self.routes)} routes, {len(self.unassigned)} deferred, "
+                f"{self.distance_km:.0f} km vs {self.baseline_km:.0f} km single-drop ({saved:.0%} saved).")
+
+class DropPlanner:
+    def __init__(self, pods: list, base: tuple = HOME_BASE, max_stops: int = 12, cell_km: float = 3.0,
+                 speed_kmh: float = 60.0, stop_minutes: float = 3.0, horizon_h: float = 24.0):
+        self.pods = pods                # DronePod instances (cool_hours, cooling_elapsed_h, reuse_cycle)
+        self.base = base
+        self.max_stops = max_stops      # sachets per pod load
+        self.cell_km = cell_km
+        self.speed_kmh = speed_kmh
+        self.stop_minutes = stop_minutes  # descend, flower open, hand-off
+        self.horizon_h = horizon_h      # planning window — no pod is booked past it
+    
+    def project(self, destinations) -> np.ndarray:
+        """lat/lng → local km (x east, y north) around base; dicts or an (n, 2) lat/lng array"""
+        if isinstance(destinations, np.ndarray):
+            lat, lng = destinations[:, 0], destinations[:, 1]
+        else:
+            lat = np.fromiter((d["lat"] for d in destinations), dtype=np.float64)
+            lng = np.fromiter((d["lng"] for d in destinations), dtype=np.float64)
+        scale = math.radians(1) * EARTH_RADIUS_KM
+        x = (lng - self.base[1]) * scale * math.cos(math.radians(self.base[0]))
+        y = (lat - self.base[0]) * scale
+        return np.column_stack((x, y))
+    
+    def group(self, xy: np.ndarray) -> np.ndarray:
+        """Serpentine walk over grid cells — returns drop indices, neighbours adjacent"""
+        cx = np.floor(xy[:, 0] / self.cell_km).astype(np.int64)
+        cy = np.floor(xy[:, 1] / self.cell_km).astype(np.int64)
+        odd = (cy & 1).astype(bool)
+        # Reverse x on odd rows so consecutive cells touch
+        walk_x = np.where(odd, -cx, cx)
+        walk_fine = np.where(odd, -xy[:, 0], xy[:, 0])
+        return np.lexsort((walk_fine, walk_x, cy))
+    
+    def order_routes(self, xy: np.ndarray, groups: np.ndarray) -> np.ndarray:
+        """Nearest-neighbour from base within every group at once — groups is (g, max_stops), -1 padded"""
+        g, s = groups.shape
+        valid = groups >= 0
+        pts = xy[np.where(valid, groups, 0)]                     # (g, s, 2)
+        pos = np.zeros((g, 2))                                   # every route starts at base
+        visited = ~valid
+        order = np.full((g, s), -1, dtype=np.int64)
+        rows = np.arange(g)
+        for step in range(s):
+            d = np.hypot(pts[..., 0] - pos[:, None, 0], pts[..., 1] - pos[:, None, 1])
+            d[visited] = np.inf
+            nxt = np.argmin(d, axis=1)
+            live = np.isfinite(d[rows, nxt])
+            order[live, step] = groups[rows[live], nxt[live]]
+            visited[rows[live], nxt[live]] = True
+            pos[live] = pts[rows[live], nxt[live]]
+        return order
+    
+    def plan(self, destinations) -> DropPlan:
+        xy = self.project(destinations)
+        n = len(xy)
+        baseline_km = float(2 * np.hypot(xy[:, 0], xy[:, 1]).sum())
+        walk = self.group(xy)
+        g = -(-n // self.max_stops)
+        groups = np.full(g * self.max_stops, -1, dtype=np.int64)
+        groups[:n] = walk
+        order = self.order_routes(xy, groups.reshape(g, self.max_stops))
+        
+        # Route length: base → stops → base, padded slots repeat the last stop (zero legs)
+        valid = order >= 0
+        last = valid.sum(axis=1) - 1
+        filled = np.where(valid, order, order[np.arange(g), last][:, None])
+        pts = xy[filled]
+        legs = np.hypot(*np.diff(pts, axis=1).transpose(2, 0, 1)).sum(axis=1)
+        distance = legs + np.hypot(*pts[:, 0].T) + np.hypot(*pts[:, -1].T)
+        duration = distance / self.speed_kmh + valid.sum(axis=1) * self.stop_minutes / 60.0
+        return self.assign(order, distance, duration, baseline_km)
+    
+    def assign(self, order: np.ndarray, distance: np.ndarray, duration: np.ndarray, baseline_km: float) -> DropPlan:
+        """Longest routes first onto the least-busy pod that can hold the cold chain"""
+        # (busy hours, pod) heap; each pod recharges its cooling at base between routes
+        heap = [(0.0, i) for i, pod in enumerate(self.pods) if pod.reuse_cycle > 0]
+        heapq.heapify(heap)
+        cycles = [pod.reuse_cycle for pod in self.pods]
+        first_window = [pod.cool_hours - pod.cooling_elapsed_h for pod in self.pods]
+        flown = [False] * len(self.pods)  # first route flies on the pod's current charge, later ones after a recharge
+        routes, deferred, parked = [], [], []
+        for r in np.argsort(-duration, kind="stable").tolist():
+            hours = float(duration[r])
+            if heap and heap[0][0] + hours > self.horizon_h:
+                deferred.append(r)  # even the least-busy pod would run past the horizon
+                continue
+            while heap:
+                busy, pod = heapq.heappop(heap)
+                window = self.pods[pod].cool_hours if flown[pod] else first_window[pod]
+                if hours <= window and busy + hours <= self.horizon_h:
+                    break
+                parked.append((busy, pod))  # can't hold this route cold or in the window, may fit a shorter one
+            else:
+                deferred.append(r)
+                heap = parked
+                heapq.heapify(heap)
+                parked = []
+                continue
+            stops = order[r][order[r] >= 0]
+            routes.append(Route(pod, stops, float(distance[r]), hours))
+            cycles[pod] -= 1
+            flown[pod] = True
+            if cycles[pod] > 0:
+                heapq.heappush(heap, (busy + hours, pod))
+            for item in parked:
+                heapq.heappush(heap, item)
+            parked = []
+        unassigned = (np.concatenate([order[r][order[r] >= 0] for r in deferred])
+                      if deferred else np.empty(0, dtype=np.int64))
+        return DropPlan(routes, unassigned, baseline_km)
@@ -0,0 +1,170 @@
+"""
+EnergyScheduler-Pinnacle — Solar-Aware Print + Pyrolysis Throttling
+MercyLogistics Pinnacle Ultramasterpiece — Jan 19 2026
+
+Heavy loads follow the sun instead of the clock:
+- Live budget from solar telemetry — surplus (panel − node load) banked as credit Wh,
+  nothing banked while the battery sits under the SOC floor
+- Printer orders queue and run as one batch once the credit covers them
+- Pyrolysis process_batch deferred until a batch is both full and affordable
+- Predicted vs metered energy per cycle — per-unit estimates learned as batches run
+"""
+
+import time
+from collections import deque
+
+from core.gel_printer import recipe_key, validate_recipe
+
+class EnergyScheduler:
+    def __init__(self, recycle, printer, soc_floor: float = 42.0, reserve_w: float = 0.0,
+                 max_credit_wh: float = 3333.0, max_gap_s: float = 126.0, defer: bool = True,
+                 reclaim_batch: int = 100, learn_rate: float = 0.33):
+        self.recycle = recycle              # PyrolysisRecycle
+        self.printer = printer              # GelPrinter
+        self.soc_floor = soc_floor          # % — below it surplus charges the battery, jobs wait
+        self.reserve_w = reserve_w          # headroom kept for the node itself
+        self.max_credit_wh = max_credit_wh  # banked surplus cap — the battery is finite
+        self.max_gap_s = max_gap_s          # longer telemetry silences bank nothing
+        self.defer = defer                  # False runs jobs on arrival, shortfall counted as deficit
+        self.reclaim_batch = reclaim_batch  # fragments per process_batch run
+        self.learn_rate = learn_rate
+        self.estimate_wh = {                # per unit — sachet printed, fragment fed to the reactor
+            "print": printer.energy_per_sachet * 1000,
+            "reclaim": recycle.energy_per_100 * 1000 / 100,
+        }
+        self.orders = deque()               # (submitted t, flavor, vitamins)
+        self.credit_wh = 0.0
+        self.harvested_wh = 0.0             # surplus banked over the run
+        self.deficit_wh = 0.0               # energy drawn beyond the banked surplus
+        self.surplus_w = 0.0
+        self.soc = 100.0
+        self.printed = 0
+        self.rejected = 0                   # orders failing recipe validation
+        self.reclaimed = 0                  # fragments through the reactor
+        self.waits = deque(maxlen=100_000)  # seconds, order submitted → printed
+        self.cycles = deque(maxlen=10_000)  # per-cycle predicted vs actual records
+        self._last_t = None
+    
+    def submit(self, flavor: str, vitamins: dict, t: float = None):
+        self.orders.append((time.time() if t is None else t, flavor, vitamins))
+    
+    def feed(self, t: float, panel_watts: float, soc: float, load_watts: float) -> list:
+        """One telemetry sample — bank the surplus since the last one, then run what it affords"""
+        dt = 0.0 if self._last_t is None else t - self._last_t
+        if dt > self.max_gap_s or dt < 0:
+            dt = 0.0
+        self._last_t = t
+        self.surplus_w = panel_watts - load_watts - self.reserve_w
+        self.soc = soc
+        if self.surplus_w > 0 and soc >= self.soc_floor:
+            banked = min(self.surplus_w * dt / 3600, self.max_credit_wh - self.credit_wh)
+            if banked > 0:
+                self.credit_wh += banked
+                self.harvested_wh += banked
+        return self.step(t)
+    
+    def feed_monitor(self, monitor, t: float = None) -> list:
+        """Poll a SolarMonitor and feed its reading"""
+        monitor.poll()
+        return self.feed(time.time() if t is None else t, monitor.panel_watts, monitor.battery_soc, monitor.load_watts)
+    
+    def step(self, t: float = None) -> list:
+        """Run every queued job the budget covers — printer orders first, then full reactor batches"""
+        t = time.time() if t is None else t
+        ran = []
+        if self.defer and self.soc < self.soc_floor:
+            return ran
+        if self.orders:
+            per_sachet = self.estimate_wh["print"]
+            if not self.defer or per_sachet <= 0:
+                count = len(self.orders)  # unmetered printer — nothing to budget
+            else:
+                count = min(len(self.orders), int(self.credit_wh // per_sachet))
+            if count:
+                ran.append(self._print(count, t))
+        batch = self.reclaim_batch
+        while self.recycle.collected_fragments >= batch:
+            if self.defer and self.credit_wh < self.estimate_wh["reclaim"] * batch:
+                break
+            ran.append(self._reclaim(batch, t))
+        return ran
+    
+    def _print(self, count: int, t: float) -> dict:
+        predicted = count * self.estimate_wh["print"]
+        printed = 0
+        for _ in range(count):
+            submitted, flavor, vitamins = self.orders.popleft()
+            try:
+                validate_recipe(*recipe_key(flavor, vitamins))
+                self.printer.print_sachet(flavor, vitamins)
+            except ValueError:
+                self.rejected += 1
+                continue
+            printed += 1
+            self.waits.append(t - submitted)
+        self.printed += printed
+        # Rejected orders never reach the nozzle — only printed sachets draw energy or teach the estimate
+        return self._record("print", printed, predicted, printed * self.printer.energy_per_sachet * 1000, t)
+    
+    def _reclaim(self, batch_size: int, t: float) -> dict:
+        predicted = batch_size * self.estimate_wh["reclaim"]
+        before = self.recycle.energy_used_kwh
+        self.recycle.process_batch(batch_size)
+        self.reclaimed += batch_size
+        return self._record("reclaim", batch_size, predicted, (self.recycle.energy_used_kwh - before) * 1000, t)
+    
+    def _record(self, job: str, units: int, predicted_wh: float, actual_wh: float, t: float) -> dict:
+        self.credit_wh -= actual_wh
+        if self.credit_wh < 0:
+            self.deficit_wh -= self.credit_wh
+            self.credit_wh = 0.0
+        # Metered energy per unit pulls the next prediction toward reality — a cycle with no units teaches nothing
+        if units:
+            estimate = self.estimate_wh[job]
+            self.estimate_wh[job] = estimate + self.learn_rate * (actual_wh / units - estimate)
+        cycle = {"t": t, "job": job, "units": units, "predicted_wh": predicted_wh, "actual_wh": actual_wh,
+                 "surplus_w": self.surplus_w, "soc": self.soc}
+        self.cycles.append(cycle)
+        return cycle
+    
+    def energy_report(self) -> dict:
+        """Predicted vs actual per job kind, throughput per kWh used and per kWh harvested"""
+        by_job = {}
+        for cycle in self.cycles:
+            job = by_job.setdefault(cycle["job"], {"cycles": 0, "units": 0, "predicted_wh": 0.0, "actual_wh": 0.0})
+            job["cycles"] += 1
+            job["units"] += cycle["units"]
+            job["predicted_wh"] += cycle["predicted_wh"]
+            job["actual_wh"] += cycle["actual_wh"]
+        for job in by_job.values():
+            job["error_pct"] = (job["predicted_wh"] - job["actual_wh"]) / job["actual_wh"] * 100 if job["actual_wh"] else 0.0
+        used_kwh = sum(job["actual_wh"] for job in by_job.values()) / 1000
+        units = self.printed + self.reclaimed
+        return {
+            "by_job": by_job,
+            "used_kwh": used_kwh,
+            "harvested_kwh": self.harvested_wh / 1000,
+            "deficit_kwh": self.deficit_wh / 1000,
+            "units": units,
+            "units_per_kwh": units / used_kwh if used_kwh else 0.0,
+            "queued": len(self.orders),
+        }
+    
+    def status(self) -> str:
+        return (f"Energy scheduler: {self.credit_wh:.0f} Wh credit, surplus {self.surplus_w:.0f} W at {self.soc:.0f}% SOC, "
+                f"{len(self.orders)} orders waiting, {self.printed} printed, {self.reclaimed} reclaimed — sun-paced mercy.")
+
+# Integration test
+if __name__ == "__main__":
+    from core.gel_printer import GelPrinter
+    from core.pyrolysis_recycle import PyrolysisRecycle
+    
+    scheduler = EnergyScheduler(PyrolysisRecycle(seed=42), GelPrinter())
+    scheduler.recycle.drone_sweep_simulation()
+    for i in range(99):
+        scheduler.submit("butter", {"D3": 333}, t=i)
+    for t in range(0, 3 * 3600, 33):
+        scheduler.feed(t, 1800.0, 88.0, 333.0)
+    print(scheduler.status())
+    for job, report in scheduler.energy_report()["by_job"].items():
+        print(f"{job}: predicted {report['predicted_wh']:.0f} Wh, actual {report['actual_wh']:.0f} Wh")
@@ -0,0 +1,160 @@
+"""
+FleetDispatcher-Pinnacle — Async MercyGel Drop Dispatch
+MercyLogistics Pinnacle Ultramasterpiece — Jan 19 2026
+
+Event-peak reward drops across the whole fleet:
+- Bounded request queue — submit() waits when full (backpressure), try_submit() refuses
+- Per-drone worker tasks — every pod flies, not just drone 0
+- Least-loaded or nearest pod assignment, per-drone queue depth cap (each drone flies one drop at a time)
+- Drop command and fragment reclaim overlapped per request
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+HOME_BASE = (43.65, -79.38)  # lat, lng — Toronto default, matches drone_ui
+
+class DropRequest:
+    __slots__ = ("player_id", "destination", "flavor", "boss", "submitted", "future")
+    
+    def __init__(self, player_id: str, destination: dict, flavor: str, boss: bool, future):
+        self.player_id = player_id
+        self.destination = destination
+        self.flavor = flavor
+        self.boss = boss
+        self.submitted = time.perf_counter()
+        self.future = future
+
+class FleetDispatcher:
+    def __init__(self, fleet, recycle, drone_count: int = 8, queue_size: int = 1024,
+                 strategy: str = "least_loaded", max_queued: int = 3):
+        if strategy not in ("least_loaded", "nearest"):
+            raise ValueError(f"Unknown dispatch strategy: {strategy}")
+        self.fleet = fleet                  # StarlinkDroneController or stand-in
+        self.recycle = recycle              # PyrolysisRecycle
+        self.drone_count = drone_count
+        self.strategy = strategy
+        self.max_queued = max_queued        # drops assigned per drone (flying + waiting) — excess held in the bounded queue
+        self.queue = asyncio.Queue(queue_size)
+        self.drone_queues = [asyncio.Queue() for _ in range(drone_count)]
+        self.load = [0] * drone_count
+        self.positions = [HOME_BASE] * drone_count
+        self.completed = 0
+        self.rejected = 0
+        self.latencies = deque(maxlen=100_000)  # seconds, submit → delivered
+        self._slot_free = asyncio.Event()
+        self._executor = ThreadPoolExecutor(max_workers=drone_count, thread_name_prefix="drone")
+        self._tasks = []
+    
+    async def start(self):
+        self._tasks = [asyncio.create_task(self._route())]
+        self._tasks += [asyncio.create_task(self._worker(d)) for d in range(self.drone_count)]
+        return self
+    
+    async def stop(self):
+        """Drain every queued drop, then stop the workers"""
+        await self.queue.join()
+        for q in self.drone_queues:
+            await q.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._executor.shutdown(wait=False)
+    
+    async def __aenter__(self):
+        return await self.start()
+    
+    async def __aexit__(self, *exc):
+        await self.stop()
+    
+    async def submit(self, player_id: str, destination: dict, flavor: str = "butter", boss: bool = False):
+        """Queue a drop — waits while the queue is full; returns a future for the status"""
+        request = DropRequest(player_id, destination, flavor, boss, asyncio.get_running_loop().create_future())
+        await self.queue.put(request)
+        return request.future
+    
+    def try_submit(self, player_id: str, destination: dict, flavor: str = "butter", boss: bool = False):
+        """Queue a drop without waiting — None when the queue is full"""
+        request = DropRequest(player_id, destination, flavor, boss, asyncio.get_running_loop().create_future())
+        try:
+            self.queue.put_nowait(request)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return None
+        return request.future
+    
+    def _pick(self, destination: dict):
+        free = [d for d in range(self.drone_count) if self.load[d] < self.max_queued]
+        if not free:
+            return None
+        target = (destination.get("lat", HOME_BASE[0]), destination.get("lng", HOME_BASE[1]))
+        if self.strategy == "nearest":
+            return min(free, key=lambda d: (distance_km(self.positions[d], target), self.load[d]))
+        return min(free, key=lambda d: (self.load[d], distance_km(self.positions[d], target)))
+    
+    async def _route(self):
+        while True:
+            request = await self.queue.get()
+            drone = self._pick(request.destination)
+            while drone is None:
+                self._slot_free.clear()
+                await self._slot_free.wait()
+                drone = self._pick(request.destination)
+            self.load[drone] += 1
+            self.drone_queues[drone].put_nowait(request)
+            self.queue.task_done()
+    
+    async def _worker(self, drone: int):
+        loop = asyncio.get_running_loop()
+        queue = self.drone_queues[drone]
+        while True:
+            request = await queue.get()
+            outcome = None  # status string, or the exception that stopped the drop
+            try:
+                payload = f"MercyGel-{request.flavor}"
+                if asyncio.iscoroutinefunction(self.fleet.command_drop):
+                    drop = asyncio.ensure_future(self.fleet.command_drop(drone, request.destination, payload))
+                else:
+                    drop = loop.run_in_executor(self._executor, self.fleet.command_drop,
+                                                drone, request.destination, payload)
+                # Reclaim while the drone is in the air — the drop is awaited even if reclaim fails
+                prefix = "boss_gel" if request.boss else "gel"
+                try:
+                    self.recycle.collect_fragment(f"{prefix}_{request.player_id}")
+                finally:
+                    status = await drop
+                if request.boss:
+                    outcome = f"{status} — boss reward {request.flavor} dispatched — joy restored."
+                else:
+                    outcome = f"{status} — {request.flavor} abundance delivered."
+                self.completed += 1
+            except Exception as exc:
+                outcome = exc
+            finally:
+                if not request.future.done():
+                    if isinstance(outcome, str):
+                        request.future.set_result(outcome)
+                    elif outcome is not None:
+                        request.future.set_exception(outcome)
+                    else:
+                        request.future.cancel()  # worker cancelled mid-drop
+                self.latencies.append(time.perf_counter() - request.submitted)
+                self.positions[drone] = (request.destination.get("lat", HOME_BASE[0]),
+                                         request.destination.get("lng", HOME_BASE[1]))
+                self.load[drone] -= 1
+                self._slot_free.set()
+                queue.task_done()
+    
+    def status(self):
+        return (f"Dispatch: {self.completed} delivered, {self.rejected} refused, "
+                f"{self.queue.qsize()} queued, load {self.load} — mercy flows.")
+
+def distance_km(a: tuple, b: tuple) -> float:
+    """Equirectangular distance — accurate to <1% over city-scale drops"""
+    lat = math.radians((a[0] + b[0]) / 2)
+    dx = math.radians(b[1] - a[1]) * math.cos(lat)
+    dy = math.radians(b[0] - a[0])
+    return 6371.0 * math.hypot(dx, dy)
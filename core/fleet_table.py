@@ -0,0 +1,256 @@
+"""
+FleetTable-Pinnacle — Struct-of-Arrays Pod + Hand-Off Arm State
+MercyLogistics Pinnacle Ultramasterpiece — Jan 19 2026
+
+Tens of thousands of pods and arms without an object each:
+- One NumPy column per DronePod / RobotHandOff attribute, defaults read from the classes
+- __slots__ views (PodView, ArmView) — same attribute names, duck-type with DronePod for
+  DropPlanner and friends, no per-pod dict
+- Vectorized queries — pods with reuse cycles left whose cooling window still holds
+- Bulk transitions — deploy, land, recharge, transfer, release on index arrays; arms stay busy
+  from hand-off until their pod lands, so repeated dispatches never double-book one
+"""
+
+import numpy as np
+
+from core.drone_pod import DronePod
+from core.robot_hand_off import RobotHandOff
+
+DOCKED, IN_FLIGHT, RETIRED = 0, 1, 2
+IDLE, BUSY = 0, 1
+
+class _Column:
+    """View attribute backed by one table column"""
+    __slots__ = ("name", "cast")
+    
+    def __init__(self, name: str, cast=float):
+        self.name = name
+        self.cast = cast
+    
+    def __get__(self, view, owner):
+        if view is None:
+            return self
+        return self.cast(getattr(view.table, self.name)[view.index])
+    
+    def __set__(self, view, value):
+        getattr(view.table, self.name)[view.index] = value
+
+class _CodedColumn(_Column):
+    """String attribute stored as a uint8 code into the table's vocabulary"""
+    
+    def __get__(self, view, owner):
+        if view is None:
+            return self
+        return view.table.vocab[self.name][getattr(view.table, self.name)[view.index]]
+    
+    def __set__(self, view, value):
+        getattr(view.table, self.name)[view.index] = view.table.code(self.name, value)
+
+class _Table:
+    COLUMNS = ()  # (name, dtype, coded) — bookkeeping columns missing on the template start at 0
+    
+    def __init__(self, count: int = 0, template=None):
+        template = template or self._template()
+        self.count = count
+        self.vocab = {}
+        for name, dtype, coded in self.COLUMNS:
+            default = getattr(template, name, 0)
+            setattr(self, name, np.full(count, self.code(name, default) if coded else default, dtype=dtype))
+    
+    def __len__(self):
+        return self.count
+    
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name, _, _ in self.COLUMNS)
+    
+    def code(self, name: str, value: str) -> int:
+        words = self.vocab.setdefault(name, [])
+        if value not in words:
+            if len(words) == 255:
+                raise ValueError(f"Too many distinct {name} values")
+            words.append(value)
+        return words.index(value)
+    
+    def grow(self, extra: int, template=None):
+        """Append extra rows filled from template (class defaults when None)"""
+        template = template or self._template()
+        for name, dtype, coded in self.COLUMNS:
+            default = getattr(template, name, 0)
+            column = np.full(extra, self.code(name, default) if coded else default, dtype=dtype)
+            setattr(self, name, np.concatenate((getattr(self, name), column)))
+        self.count += extra
+    
+    def __getitem__(self, index: int):
+        if not -self.count <= index < self.count:
+            raise IndexError(index)
+        return self.VIEW(self, index % self.count)
+    
+    def __iter__(self):
+        return (self.VIEW(self, i) for i in range(self.count))
+
+class PodView:
+    __slots__ = ("table", "index")
+    
+    cool_temp = _Column("cool_temp", int)
+    cool_hours = _Column("cool_hours")
+    cooling_elapsed_h = _Column("cooling_elapsed_h")
+    open_style = _CodedColumn("open_style")
+    reuse_cycle = _Column("reuse_cycle", int)
+    state = _Column("state", int)
+    
+    def __init__(self, table, index: int):
+        self.table = table
+        self.index = index
+    
+    def deploy(self, hours: float = 0.0):
+        if not len(self.table.deploy(np.array([self.index]), hours)):
+            return f"Pod {self.index} grounded — already flying, retired or out of reuse cycles."
+        return DronePod.deploy(self)
+
+class PodTable(_Table):
+    COLUMNS = (("cool_temp", np.int8, False), ("cool_hours", np.float32, False),
+               ("cooling_elapsed_h", np.float32, False), ("open_style", np.uint8, True),
+               ("reuse_cycle", np.int32, False), ("state", np.uint8, False), ("deployments", np.uint32, False))
+    VIEW = PodView
+    
+    @staticmethod
+    def _template():
+        return DronePod()
+    
+    @classmethod
+    def from_pods(cls, pods) -> "PodTable":
+        pods = list(pods)
+        table = cls(len(pods))
+        for name, _, coded in cls.COLUMNS:
+            if name in ("state", "deployments"):
+                continue
+            values = [getattr(p, name) for p in pods]
+            getattr(table, name)[:] = [table.code(name, v) for v in values] if coded else values
+        return table
+    
+    def query(self, min_cycles: int = 0, hours_needed: float = 0.0, state: int = DOCKED) -> np.ndarray:
+        """Pods (state, default docked) with more than min_cycles reuse cycles left and at least
+        hours_needed of their cooling window unspent"""
+        mask = self.reuse_cycle > min_cycles
+        mask &= (self.cool_hours - self.cooling_elapsed_h) >= hours_needed
+        mask &= self.cooling_elapsed_h < self.cool_hours
+        if state is not None:
+            mask &= self.state == state
+        return np.flatnonzero(mask)
+    
+    def deploy(self, pods, hours: float = 0.0) -> np.ndarray:
+        """Docked pods with cycles left take off — returns the indices that did"""
+        pods = np.asarray(pods, dtype=np.intp)
+        pods = pods[(self.state[pods] == DOCKED) & (self.reuse_cycle[pods] > 0)]
+        self.state[pods] = IN_FLIGHT
+        self.reuse_cycle[pods] -= 1
+        self.deployments[pods] += 1
+        self.cooling_elapsed_h[pods] += hours
+        return pods
+    
+    def advance(self, hours: float):
+        """Cooling clock runs on every pod in flight"""
+        self.cooling_elapsed_h[self.state == IN_FLIGHT] += hours
+    
+    def land(self, pods, recharge: bool = True) -> np.ndarray:
+        """In-flight pods dock — spent pods retire, the rest recharge their Peltier window"""
+        pods = np.asarray(pods, dtype=np.intp)
+        pods = pods[self.state[pods] == IN_FLIGHT]
+        self.state[pods] = np.where(self.reuse_cycle[pods] > 0, DOCKED, RETIRED)
+        if recharge:
+            self.cooling_elapsed_h[pods] = 0.0
+        return pods
+    
+    def status(self) -> str:
+        counts = np.bincount(self.state, minlength=3)
+        return (f"Pod table: {self.count} pods ({self.nbytes / max(self.count, 1):.0f} B each) — {counts[DOCKED]} docked, "
+                f"{counts[IN_FLIGHT]} flying, {counts[RETIRED]} retired, {int(self.reuse_cycle.sum())} cycles left.")
+
+class ArmView:
+    __slots__ = ("table", "index")
+    
+    blade_precision = _Column("blade_precision")
+    seal_temp = _Column("seal_temp", int)
+    grip_force = _CodedColumn("grip_force")
+    state = _Column("state", int)
+    transfers = _Column("transfers", int)
+    
+    def __init__(self, table, index: int):
+        self.table = table
+        self.index = index
+    
+    def transfer(self, sachet_id: str):
+        if not len(self.table.transfer(np.array([self.index]))):
+            return f"Arm {self.index} busy — sachet {sachet_id} waits for the next idle arm."
+        return RobotHandOff.transfer(self, sachet_id)
+    
+    def verify_integrity(self):
+        return RobotHandOff.verify_integrity(self)
+
+class ArmTable(_Table):
+    COLUMNS = (("blade_precision", np.float32, False), ("seal_temp", np.int16, False),
+               ("grip_force", np.uint8, True), ("state", np.uint8, False), ("transfers", np.uint32, False))
+    VIEW = ArmView
+    
+    @staticmethod
+    def _template():
+        return RobotHandOff()
+    
+    def idle(self) -> np.ndarray:
+        return np.flatnonzero(self.state == IDLE)
+    
+    def transfer(self, arms) -> np.ndarray:
+        """Idle arms take one cut/seal hand-off each and stay busy until released — returns the arms that did"""
+        arms = np.asarray(arms, dtype=np.intp)
+        arms = arms[self.state[arms] == IDLE]
+        self.state[arms] = BUSY
+        self.transfers[arms] += 1
+        return arms
+    
+    def release(self, arms) -> np.ndarray:
+        """Busy arms free for the next hand-off — returns the arms released"""
+        arms = np.asarray(arms, dtype=np.intp)
+        arms = arms[self.state[arms] == BUSY]
+        self.state[arms] = IDLE
+        return arms
+    
+    def status(self) -> str:
+        return (f"Arm table: {self.count} arms ({self.nbytes / max(self.count, 1):.0f} B each), "
+                f"{int(self.transfers.sum())} transfers, {len(self.idle())} idle.")
+
+class FleetTable:
+    def __init__(self, pods: int = 0, arms: int = 0):
+        self.pods = PodTable(pods)
+        self.arms = ArmTable(arms)
+    
+    def dispatch(self, count: int, hours: float, min_cycles: int = 0) -> tuple:
+        """Up to count docked pods that can hold a route of hours take off; one idle arm per pod
+        stages its sachet — returns (pods, arms)"""
+        pods = self.pods.query(min_cycles, hours)[:count]
+        arms = self.arms.idle()[:len(pods)]
+        pods = self.pods.deploy(pods[:len(arms)], hours)
+        return pods, self.arms.transfer(arms[:len(pods)])
+    
+    def land(self, pods, arms, recharge: bool = True) -> tuple:
+        """Dispatched pods dock and the arms that staged their sachets free up — returns (pods, arms)"""
+        return self.pods.land(pods, recharge), self.arms.release(arms)
+    
+    def status(self) -> str:
+        return f"{self.pods.status()} {self.arms.status()}"
+
+# Integration test
+if __name__ == "__main__":
+    import time
+    
+    fleet = FleetTable(pods=100_000, arms=33_333)
+    fleet.pods.cooling_elapsed_h[:] = np.random.default_rng(42).uniform(0, 120, 100_000)
+    t0 = time.perf_counter()
+    ready = fleet.pods.query(min_cycles=500, hours_needed=6.0)
+    print(f"{len(ready)} pods ready in {(time.perf_counter() - t0) * 1000:.2f} ms")
+    pods, arms = fleet.dispatch(9_999, hours=6.0)
+    print(f"Dispatched {len(pods)} pods with {len(arms)} arms")
+    fleet.pods.advance(6.0)
+    fleet.land(pods, arms)
+    print(fleet.pods[int(pods[0])].deploy(), fleet.arms[0].transfer("sachet-001"))
+    print(fleet.status())
@@ -4,13 +4,64 @@ MercyLogistics Pinnacle Ultramasterpiece — Jan 17 2026
 
 Prints MercyGel at 8°C, flash-freeze -42°C in 4 s
 Zero preservative, zero headspace
+Batch runs (print_batch): recipes validated + labelled once, cached in a bounded LRU
 """
 
+import functools
+from numbers import Real
+
 class GelPrinter:
-    def __init__(self):
+    def __init__(self, recipe_cache_size: int = 333):
         self.temp_fill = 8      # °C
         self.freeze_temp = -42  # °C
         self.freeze_time = 4    # seconds
+        self.energy_per_sachet = 0.012  # kWh — 8 °C fill chill + -42 °C flash freeze
+        self.recipe_cache_size = recipe_cache_size
+        self._recipe_label = functools.lru_cache(maxsize=recipe_cache_size)(self._format_recipe)
     
     def print_sachet(self, flavor: str, vitamins: dict):
         return f"{flavor} MercyGel printed — {vitamins} balanced, sealed, ready."
+    
+    def print_batch(self, orders):
+        """Lazily print a stream of orders — (flavor, vitamins) tuples or dicts with those keys.
+        
+        Each label is byte-identical to print_sachet's. Recipes are validated (ValueError for an
+        empty/non-string flavor or a negative/non-numeric dose) and labelled once per recipe key
+        in the LRU, so repeats anywhere in the stream reuse the work. Orders are not regrouped by
+        recipe — the stream stays lazy and in order, nothing is buffered.
+        """
+        last = label = None
+        for order in orders:
+            key = recipe_key(*_unpack(order))
+            if key != last:
+                try:
+                    label = self._recipe_label(key)
+                except TypeError:
+                    validate_recipe(*key)  # unhashable dose — report it as the invalid dose it is
+                    raise
+                last = key
+            yield label
+    
+    def recipe_cache_info(self):
+        return self._recipe_label.cache_info()
+    
+    def _format_recipe(self, key: tuple) -> str:
+        flavor, vitamins = key
+        validate_recipe(flavor, vitamins)
+        return self.print_sachet(flavor, dict(vitamins))
+
+def recipe_key(flavor: str, vitamins: dict) -> tuple:
+    """Recipe key — vitamins in the caller's order, since the label prints them in that order"""
+    return (flavor, tuple(vitamins.items()))
+
+def validate_recipe(flavor: str, vitamins: tuple):
+    if not isinstance(flavor, str) or not flavor:
+        raise ValueError(f"Flavor must be a non-empty string, got {flavor!r}")
+    for name, dose in vitamins:
+        if not isinstance(dose, Real) or dose < 0:
+            raise ValueError(f"Vitamin {name!r} dose must be a non-negative number, got {dose!r}")
+
+def _unpack(order):
+    if isinstance(order, dict):
+        return order["flavor"], order["vitamins"]
+    return order
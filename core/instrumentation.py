@@ -0,0 +1,326 @@
+"""
+Instrumentation-Pinnacle — Hot-Path Timers, Counters, Histograms + Sampling Profiler
+MercyLogistics Pinnacle Ultramasterpiece — Jan 19 2026
+
+Where the time goes in the logistics loop, per field node:
+- Stage timers (context manager) and counters — full_cycle, mercy_gel_drop, close_loop, burst_sync
+- Log-bucket histograms — any quantile within relative_accuracy, merged across nodes by adding buckets
+- Disabled mode — one flag check, a shared no-op timer, nothing recorded
+- Optional sampling profiler — a daemon thread counting collapsed stacks of one thread
+- snapshot() — plain JSON-able dict a shard persists and burst-syncs like any attribute;
+  merge() and compare() line field nodes up against each other
+"""
+
+import math
+import sys
+import threading
+import time
+
+class Histogram:
+    """Log-bucket counts — bucket i holds (gamma^(i-1), gamma^i]; zero and negative values counted apart"""
+    __slots__ = ("gamma", "_log_gamma", "buckets", "zero", "count", "total", "min", "max")
+    
+    def __init__(self, relative_accuracy: float = 0.02):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zero = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def observe(self, value: float):
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value <= 0:
+            self.zero += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+    
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = self.zero
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                value = 2 * self.gamma ** index / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+    
+    def merge(self, other: "Histogram") -> "Histogram":
+        if other.gamma != self.gamma:
+            raise ValueError("Histograms must share relative accuracy to merge")
+        for index, n in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + n
+        self.zero += other.zero
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+    
+    def snapshot(self) -> dict:
+        empty = not self.count
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": None if empty else self.min,
+            "max": None if empty else self.max,
+            "p50": None if empty else self.quantile(0.5),
+            "p90": None if empty else self.quantile(0.9),
+            "p99": None if empty else self.quantile(0.99),
+            "gamma": self.gamma,
+            "zero": self.zero,
+            "buckets": sorted(self.buckets.items()),  # [[index, count]] — survives a JSON round trip
+        }
+    
+    @classmethod
+    def from_snapshot(cls, data: dict) -> "Histogram":
+        histogram = cls()
+        histogram.gamma = data["gamma"]
+        histogram._log_gamma = math.log(histogram.gamma)
+        histogram.buckets = {int(index): n for index, n in data["buckets"]}
+        histogram.zero = data["zero"]
+        histogram.count = data["count"]
+        histogram.total = data["sum"]
+        histogram.min = math.inf if data["min"] is None else data["min"]
+        histogram.max = -math.inf if data["max"] is None else data["max"]
+        return histogram
+
+class _Timer:
+    __slots__ = ("histogram", "lock", "start")
+    
+    def __init__(self, histogram: Histogram, lock):
+        self.histogram = histogram
+        self.lock = lock
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        with self.lock:
+            self.histogram.observe(elapsed)
+        return False
+
+class _NullTimer:
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+
+_NULL_TIMER = _NullTimer()
+
+class SamplingProfiler:
+    """Daemon thread sampling one thread's stack every interval — collapsed 'file:func;...' counts"""
+    
+    def __init__(self, interval: float = 0.005, thread_id: int = None, depth: int = 33):
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.depth = depth
+        self.stacks = {}
+        self.samples = 0
+        self._lock = threading.Lock()  # sampler writes, snapshot() readers copy
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def start(self) -> "SamplingProfiler":
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="instrumentation-profiler", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                return  # profiled thread exited
+            names = []
+            while frame is not None and len(names) < self.depth:
+                code = frame.f_code
+                names.append(f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_name}")
+                frame = frame.f_back
+            stack = ";".join(reversed(names))
+            with self._lock:
+                self.stacks[stack] = self.stacks.get(stack, 0) + 1
+                self.samples += 1
+    
+    def top(self, n: int = 33) -> list:
+        """[[stack, samples]] — heaviest first"""
+        with self._lock:
+            stacks = list(self.stacks.items())
+        return [list(item) for item in sorted(stacks, key=lambda item: -item[1])[:n]]
+
+class Instrumentation:
+    def __init__(self, enabled: bool = True, relative_accuracy: float = 0.02, node: str = None):
+        self.enabled = enabled
+        self.relative_accuracy = relative_accuracy
+        self.node = node                # field node name carried in every snapshot
+        self.counters = {}
+        self.timers = {}                # stage → Histogram of seconds
+        self.histograms = {}            # metric → Histogram of values
+        self.profiler = None
+        self.started = time.time()
+        self._lock = threading.Lock()
+    
+    def _histogram(self, table: dict, name: str) -> Histogram:
+        histogram = table.get(name)
+        if histogram is None:
+            histogram = table.setdefault(name, Histogram(self.relative_accuracy))
+        return histogram
+    
+    def time(self, stage: str):
+        """with instruments.time("cycle.print"): ... — elapsed seconds into the stage's timer"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self._histogram(self.timers, stage), self._lock)
+    
+    def count(self, name: str, n: int = 1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+    
+    def observe(self, name: str, value: float):
+        if not self.enabled:
+            return
+        histogram = self._histogram(self.histograms, name)
+        with self._lock:
+            histogram.observe(value)
+    
+    def start_profiler(self, interval: float = 0.005, thread_id: int = None) -> SamplingProfiler:
+        """Sample the calling thread (or thread_id) until stop_profiler — stacks land in snapshot()"""
+        self.stop_profiler()
+        self.profiler = SamplingProfiler(interval, thread_id).start()
+        return self.profiler
+    
+    def stop_profiler(self):
+        if self.profiler is not None:
+            self.profiler.stop()
+    
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.timers.clear()
+            self.histograms.clear()
+            self.started = time.time()
+        self.stop_profiler()  # sampler thread joined, not left running detached
+        self.profiler = None
+    
+    def snapshot(self) -> dict:
+        with self._lock:
+            data = {
+                "node": self.node,
+                "started": self.started,
+                "taken": time.time(),
+                "counters": dict(self.counters),
+                "timers": {name: h.snapshot() for name, h in self.timers.items()},
+                "histograms": {name: h.snapshot() for name, h in self.histograms.items()},
+            }
+        if self.profiler is not None:
+            data["profile"] = {"interval": self.profiler.interval, "samples": self.profiler.samples,
+                               "stacks": self.profiler.top()}
+        return data
+    
+    def merge(self, snapshot: dict) -> "Instrumentation":
+        """Fold another node's snapshot in — fleet-wide view from synced shards.
+        
+        All-or-nothing: every incoming histogram is checked against ours (or our accuracy, for
+        names we haven't seen) before anything is added.
+        """
+        incoming = {kind: {name: Histogram.from_snapshot(data) for name, data in snapshot.get(kind, {}).items()}
+                    for kind in ("timers", "histograms")}
+        gamma = Histogram(self.relative_accuracy).gamma
+        with self._lock:
+            tables = {"timers": self.timers, "histograms": self.histograms}
+            for kind, histograms in incoming.items():
+                for name, histogram in histograms.items():
+                    mine = tables[kind].get(name)
+                    if histogram.gamma != (gamma if mine is None else mine.gamma):
+                        raise ValueError(f"{kind} {name!r}: histograms must share relative accuracy to merge")
+            for name, n in snapshot.get("counters", {}).items():
+                self.counters[name] = self.counters.get(name, 0) + n
+            for kind, histograms in incoming.items():
+                table = tables[kind]
+                for name, histogram in histograms.items():
+                    if name in table:
+                        table[name].merge(histogram)
+                    else:
+                        table[name] = histogram
+        return self
+    
+    def persist(self, shard, attribute: str = "instrumentation") -> dict:
+        """Snapshot onto a shard attribute — dirty-tracked, so the next burst ships it"""
+        data = self.snapshot()
+        setattr(shard, attribute, data)
+        return data
+    
+    def status(self) -> str:
+        if not self.enabled:
+            return "Instrumentation off — hot path untouched."
+        slowest = max(self.timers.items(), key=lambda item: item[1].total, default=None)
+        slowest = f", most time in {slowest[0]} ({slowest[1].total * 1000:.1f} ms)" if slowest else ""
+        return (f"Instrumentation: {len(self.timers)} stages timed, {sum(self.counters.values())} events counted, "
+                f"{len(self.histograms)} histograms{slowest}.")
+
+def compare(baseline: dict, other: dict, quantile: str = "p50") -> dict:
+    """Per-stage ratio other / baseline at quantile (p50, p90, p99) — field node against reference"""
+    ratios = {}
+    for name, data in other.get("timers", {}).items():
+        reference = baseline.get("timers", {}).get(name)
+        if reference and reference.get(quantile) and data.get(quantile) is not None:
+            ratios[name] = data[quantile] / reference[quantile]
+    return ratios
+
+_shared = Instrumentation(enabled=False)  # off until a node opts in — hot paths pay one flag check
+
+def shared_instruments() -> Instrumentation:
+    return _shared
+
+def set_enabled(enabled: bool = True, node: str = None) -> Instrumentation:
+    _shared.enabled = enabled
+    if node is not None:
+        _shared.node = node
+    return _shared
+
+# Integration test
+if __name__ == "__main__":
+    from core.instrumentation import set_enabled  # the instance instrumented modules share
+    from core.pyrolysis_recycle import PyrolysisRecycle
+    
+    recycle = PyrolysisRecycle(drone_count=12, seed=42)
+    instruments = set_enabled(True, node="field-node-1")
+    instruments.start_profiler(interval=0.001)
+    for _ in range(99):
+        recycle.close_loop()
+    instruments.stop_profiler()
+    snapshot = instruments.snapshot()
+    loop = snapshot["timers"]["recycle.close_loop"]
+    print(f"close_loop p50 {loop['p50'] * 1000:.3f} ms, p99 {loop['p99'] * 1000:.3f} ms over {loop['count']} loops")
+    print(f"tags processed p50 {snapshot['histograms']['recycle.tags_processed']['p50']:.0f} per batch")
+    print(f"profiler: {snapshot['profile']['samples']} samples, top stack {snapshot['profile']['stacks'][0][0][-66:]}")
+    print(instruments.status())
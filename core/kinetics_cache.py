@@ -0,0 +1,135 @@
+"""
+KineticsCache-Pinnacle — Memoized Degradation Reports + Time-to-Degrade
+MercyLogistics Pinnacle Ultramasterpiece — Jan 19 2026
+
+Labelling asks the same few questions for every sachet printed:
+- CachedKinetics mixin — model parameters interned to a small token, dropped on any attribute set
+- One shared LRU across every model instance — same thickness / medium, same entry
+- @cached_kinetics on report and compost-time methods — key is (method, params token, typed args)
+- No interpolated environment-factor tables — combined_environment_factor_batch is already
+  faster than a NumPy table lookup over the same readings, and exact
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+
+_MISSING = object()
+
+class KineticsCache:
+    def __init__(self, maxsize: int = 333):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+    
+    def info(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+_shared = KineticsCache()
+_tokens = {}          # params tuple → token, shared so equal models share cache entries
+_tokens_lock = threading.Lock()
+_TOKEN_LIMIT = 4096   # distinct parameter sets remembered — past it, start over (old entries age out)
+_counter = iter(range(1, 1 << 62))
+
+def shared_cache() -> KineticsCache:
+    return _shared
+
+def set_cache_size(maxsize: int):
+    global _shared
+    _shared = KineticsCache(maxsize)
+
+def _token(params: tuple) -> int:
+    with _tokens_lock:
+        token = _tokens.get(params)
+        if token is None:
+            if len(_tokens) >= _TOKEN_LIMIT:
+                _tokens.clear()
+            token = _tokens[params] = next(_counter)
+        return token
+
+class CachedKinetics:
+    """Mixin — public attributes are the cache key; setting any of them invalidates it.
+    
+    In-place mutation of a mutable attribute is not seen — reassign instead.
+    """
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            self.__dict__.pop("_params_token", None)
+    
+    def params_token(self):
+        """Small int standing for (class, public attributes) — None when a value is unhashable"""
+        token = self.__dict__.get("_params_token", _MISSING)
+        if token is _MISSING:
+            # type(v) in the key — 1 == 1.0 and hash alike, but needn't compute alike
+            params = (type(self),) + tuple((k, type(v), v) for k, v in self.__dict__.items() if not k.startswith("_"))
+            try:
+                token = _token(params)
+            except TypeError:
+                token = None
+            self.__dict__["_params_token"] = token
+        return token
+
+def cached_kinetics(method):
+    """Memoize a CachedKinetics method in the shared LRU — positional/keyword args must be hashable"""
+    name = method.__qualname__
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        token = self.params_token()
+        if token is None:
+            return method(self, *args, **kwargs)
+        types = tuple(map(type, args))  # args keyed by type too, same as the params token
+        if kwargs:
+            key = (name, token, args, types, tuple((k, type(v), v) for k, v in kwargs.items()))
+        else:
+            key = (name, token, args, types)
+        cache = _shared
+        value = cache.get(key)
+        if value is _MISSING:
+            value = method(self, *args, **kwargs)
+            cache.put(key, value)
+        return value
+    return wrapper
+
+# Integration test
+if __name__ == "__main__":
+    from core.kinetics_cache import shared_cache  # the copy the models use
+    from core.mycelium_kinetics import MyceliumKinetics
+    from core.seaweed_film_kinetics import SeaweedFilmKinetics
+    
+    film = SeaweedFilmKinetics(0.2)
+    film.full_degradation_report()
+    film.full_degradation_report()
+    film.M0 = 0.3
+    print(film.full_degradation_report().splitlines()[0])
+    print(f"Industrial compost: {MyceliumKinetics().industrial_compost()} days")
+    print(f"Shared cache: {shared_cache().info()}")
@@ -0,0 +1,116 @@
+"""
+KineticsIntegrator-Pinnacle — Time-Varying Environment Degradation Integrator
+MercyLogistics Pinnacle Ultramasterpiece — Jan 19 2026
+
+Streaming ∫k(t)dt for packages under real daily cycles:
+- dM/dt = -k(t)M → M(t) = M0 × exp(-∫k dt)
+- Trapezoid rule between readings — O(1) per reading, no replay from t=0
+- Per-sample arrays — 100k packages tracked live, one vectorized step per reading
+- Mycelium rates from environment readings, seaweed/tetra rates per medium
+"""
+
+import math
+
+import numpy as np
+
+from core.mycelium_kinetics import ENVIRONMENT_FIELDS
+
+SECONDS_PER_DAY = 86400.0
+
+class KineticsIntegrator:
+    def __init__(self, n_samples: int = 1, initial_amount=100.0,
+                 seconds_per_unit: float = SECONDS_PER_DAY, rate_fn=None):
+        self.n_samples = n_samples
+        self.seconds_per_unit = seconds_per_unit  # k is per day (mycelium, soil) or per second (saliva, water)
+        self.rate_fn = rate_fn                    # env → k array, used by observe()
+        
+        self.M0 = np.array(np.broadcast_to(np.asarray(initial_amount, dtype=np.float64), (n_samples,)))
+        self.exposure = np.zeros(n_samples)       # running ∫k dt (dimensionless)
+        self.last_t = np.full(n_samples, np.nan)  # seconds, NaN = no reading yet
+        self.last_k = np.zeros(n_samples)
+    
+    @classmethod
+    def for_mycelium(cls, model, n_samples: int = 1, base_k: float = None):
+        """k(t) = base_k × combined environment factor, base_k per day (industrial by default)"""
+        if base_k is None:
+            base_k = model.k_industrial_base
+        
+        def rate_fn(env):
+            return model.adjusted_rate_batch(base_k, *(env[name] for name in ENVIRONMENT_FIELDS))
+        return cls(n_samples, model.M0, SECONDS_PER_DAY, rate_fn)
+    
+    @classmethod
+    def for_seaweed(cls, film, n_samples: int = 1, medium: str = "soil"):
+        """k(t) from a per-sample medium — soil decays in days, water/saliva/gastric in seconds"""
+        seconds_per_unit = SECONDS_PER_DAY if medium == "soil" else 1.0
+        k = getattr(film, f"k_{medium}")
+        
+        def rate_fn(env):
+            return np.asarray(env.get("k", k), dtype=np.float64)
+        return cls(n_samples, film.M0, seconds_per_unit, rate_fn)
+    
+    def update(self, sample: int, timestamp: float, k: float) -> float:
+        """O(1) incremental step for one sample — returns its running exposure"""
+        last_t = self.last_t[sample]
+        if not math.isnan(last_t):
+            if timestamp < last_t:
+                raise ValueError(f"Reading at {timestamp} is earlier than the last one ({last_t}) for sample {sample}")
+            dt = (timestamp - last_t) / self.seconds_per_unit
+            self.exposure[sample] += 0.5 * (self.last_k[sample] + k) * dt
+        self.last_t[sample] = timestamp
+        self.last_k[sample] = k
+        return self.exposure[sample]
+    
+    def update_batch(self, timestamps, k, samples=None):
+        """Vectorized step — samples is an index array (each index at most once) or None for all"""
+        if samples is None:
+            samples = slice(None)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        k = np.asarray(k, dtype=np.float64)
+        last_t = self.last_t[samples]
+        if np.any(timestamps < last_t):  # NaN (no reading yet) compares False
+            raise ValueError("Readings must not go back in time — a timestamp is earlier than its sample's last")
+        dt = (timestamps - last_t) / self.seconds_per_unit
+        step = 0.5 * (self.last_k[samples] + k) * dt
+        self.exposure[samples] += np.where(np.isnan(last_t), 0.0, step)
+        self.last_t[samples] = timestamps
+        self.last_k[samples] = k
+    
+    def observe(self, timestamp, env, samples=None):
+        """One (timestamp, environment) reading — env columns are scalars or per-sample arrays"""
+        self.update_batch(timestamp, self.rate_fn(env), samples)
+    
+    def consume(self, readings, samples=None):
+        """Drain an iterator of (timestamp, environment) readings"""
+        for timestamp, env in readings:
+            self.observe(timestamp, env, samples)
+        return self
+    
+    def reset(self, samples, initial_amount=None):
+        """Recycle slots for newly tracked packages"""
+        self.exposure[samples] = 0.0
+        self.last_t[samples] = np.nan
+        self.last_k[samples] = 0.0
+        if initial_amount is not None:
+            self.M0[samples] = initial_amount
+    
+    def remaining(self, samples=None) -> np.ndarray:
+        """M(t) = M0 × exp(-∫k dt) — remaining mass (g) or thickness (mm)"""
+        if samples is None:
+            samples = slice(None)
+        return self.M0[samples] * np.exp(-self.exposure[samples])
+    
+    def degraded(self, threshold: float, samples=None) -> np.ndarray:
+        return self.remaining(samples) <= threshold
+
+# Integration test
+if __name__ == "__main__":
+    from core.mycelium_kinetics import MyceliumKinetics
+    
+    bays = 100_000
+    tracker = KineticsIntegrator.for_mycelium(MyceliumKinetics(), bays)
+    hours = np.arange(0, 24 * 30)
+    readings = ((h * 3600.0, {"temp_c": 55.0 + 8.0 * np.sin(2 * np.pi * h / 24), "rh_percent": 92.0, "ph": 7.0,
+                              "lux": 50.0, "o2_percent": 21.0, "pressure_kpa": 101.3}) for h in hours)
+    tracker.consume(readings)
+    print(f"{bays} bays after 30 days — mean remaining {tracker.remaining().mean():.2f} g")
@@ -0,0 +1,220 @@
+"""
+KineticsMonteCarlo-Pinnacle — Parallel Uncertainty Engine for Degradation Times
+MercyLogistics Pinnacle Ultramasterpiece — Jan 19 2026
+
+Confidence intervals instead of point estimates:
+- Uncertain parameters (base k, Q10, Gaussian widths, thickness) and environment noise
+  sampled per chunk, evaluated through the models' own batch formulas
+- One SeedSequence child per chunk — same samples, same intervals, whatever the worker count
+- Chunks spread over a process pool, a bounded number in flight
+- Degradation times streamed into a mergeable log-bucket quantile sketch — 1% relative
+  accuracy, fixed size, so 10⁸ samples run in constant memory
+"""
+
+import copy
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.mycelium_kinetics import ENVIRONMENT_FIELDS, MyceliumKinetics
+from core.seaweed_film_kinetics import SeaweedFilmKinetics
+from core.tetra_edible_degradation import TetraEdibleDegradation
+
+class QuantileSketch:
+    """Log-bucket counts (DDSketch-style) — any quantile within relative_accuracy, merge by adding counts"""
+    
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-9, max_value: float = 1e12):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.offset = math.floor(math.log(min_value) / self._log_gamma)
+        self.counts = np.zeros(math.ceil(math.log(max_value) / self._log_gamma) - self.offset + 1, dtype=np.int64)
+        self.infinite = 0       # k == 0 — never degrades
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    @property
+    def nbytes(self) -> int:
+        return self.counts.nbytes
+    
+    def add(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        finite = np.isfinite(values)
+        if not finite.all():
+            self.infinite += int(np.count_nonzero(values == np.inf))
+            values = values[finite]
+        if not len(values):
+            return
+        index = np.ceil(np.log(np.maximum(values, 1e-300)) / self._log_gamma).astype(np.int64) - self.offset
+        np.clip(index, 0, len(self.counts) - 1, out=index)
+        self.counts += np.bincount(index, minlength=len(self.counts))
+        self.count += len(values)
+        self.total += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+    
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        if other.gamma != self.gamma or other.offset != self.offset or len(other.counts) != len(self.counts):
+            raise ValueError("Sketches must share relative accuracy and value range to merge")
+        self.counts += other.counts
+        self.infinite += other.infinite
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+    
+    @property
+    def mean(self) -> float:
+        """Mean of the finite samples"""
+        return self.total / self.count if self.count else math.nan
+    
+    def quantile(self, q: float) -> float:
+        n = self.count + self.infinite
+        if not n:
+            return math.nan
+        rank = q * (n - 1)
+        if rank >= self.count:
+            return math.inf
+        bucket = int(np.searchsorted(np.cumsum(self.counts), rank, side="right"))
+        value = 2 * self.gamma ** (bucket + self.offset) / (self.gamma + 1)
+        return min(max(value, self.min), self.max)
+    
+    def quantiles(self, qs) -> list:
+        return [self.quantile(q) for q in qs]
+
+# Default uncertainty per model — attribute → ("lognormal", σ of log) | ("normal", relative sd) | ("uniform", relative half-width)
+MYCELIUM_UNCERTAINTY = {
+    "k_industrial_base": ("lognormal", 0.2),
+    "k_home_base": ("lognormal", 0.2),
+    "k_soil_base": ("lognormal", 0.3),
+    "Q10": ("normal", 0.1),
+    "humidity_width": ("normal", 0.1),
+    "ph_width": ("normal", 0.1),
+    "microbial_temp_width": ("normal", 0.1),
+    "microbial_rh_width": ("normal", 0.1),
+}
+SEAWEED_UNCERTAINTY = {
+    "M0": ("uniform", 0.1),
+    "k_water": ("lognormal", 0.2),
+    "k_saliva": ("lognormal", 0.2),
+    "k_gastric": ("lognormal", 0.2),
+    "k_soil": ("lognormal", 0.3),
+}
+TETRA_UNCERTAINTY = {
+    "thickness": ("uniform", 0.1),
+    "saliva_rate": ("lognormal", 0.15),
+    "gastric_rate": ("lognormal", 0.15),
+    "microbial_rate": ("lognormal", 0.3),
+}
+
+# Industrial compost defaults of MyceliumKinetics.industrial_compost, absolute sd per reading
+INDUSTRIAL_ENVIRONMENT = {"temp_c": 60.0, "rh_percent": 95.0, "ph": 7.0, "lux": 50.0, "o2_percent": 21.0, "pressure_kpa": 101.3}
+ENVIRONMENT_NOISE = {"temp_c": 3.0, "rh_percent": 3.0, "ph": 0.3, "lux": 20.0, "o2_percent": 1.5, "pressure_kpa": 1.0}
+
+def _mycelium_times(model, env: dict, setting: str, threshold: float) -> np.ndarray:
+    factor = model.combined_environment_factor_batch(*(env[name] for name in ENVIRONMENT_FIELDS))
+    return np.log(model.M0 / threshold) / (getattr(model, f"k_{setting}_base") * factor)
+
+def _seaweed_times(model, env: dict, setting: str, threshold: float) -> np.ndarray:
+    return np.log(model.M0 / threshold) / getattr(model, f"k_{setting}")
+
+_TETRA_RATES = {"saliva": "saliva_rate", "gastric": "gastric_rate", "soil": "microbial_rate"}
+
+def _tetra_times(model, env: dict, setting: str, threshold: float) -> np.ndarray:
+    return model.thickness / getattr(model, _TETRA_RATES[setting])
+
+# model class → (evaluator, default setting, default threshold, default uncertainty)
+MODELS = {
+    MyceliumKinetics: (_mycelium_times, "industrial", 5.0, MYCELIUM_UNCERTAINTY),
+    SeaweedFilmKinetics: (_seaweed_times, "soil", 0.01, SEAWEED_UNCERTAINTY),
+    TetraEdibleDegradation: (_tetra_times, "soil", None, TETRA_UNCERTAINTY),
+}
+
+def _sample(nominal: float, spec: tuple, rng: np.random.Generator, n: int) -> np.ndarray:
+    kind, spread = spec
+    if kind == "lognormal":
+        return nominal * np.exp(rng.normal(0.0, spread, n))
+    if kind == "normal":
+        return nominal * np.maximum(rng.normal(1.0, spread, n), 1e-3)  # parameters stay positive
+    if kind == "uniform":
+        return nominal * rng.uniform(1 - spread, 1 + spread, n)
+    raise ValueError(f"Unknown distribution: {kind}")
+
+def _run_chunk(engine: "KineticsMonteCarlo", n: int, seed: np.random.SeedSequence) -> QuantileSketch:
+    """One chunk, in a worker or inline — sampled model copy through the model's batch formula"""
+    rng = np.random.default_rng(seed)
+    sampled = copy.copy(engine.model)
+    for attr, spec in engine.uncertainty.items():
+        setattr(sampled, attr, _sample(getattr(engine.model, attr), spec, rng, n))
+    env = {name: engine.environment[name] + engine.environment_noise.get(name, 0.0) * rng.standard_normal(n)
+           for name in engine.environment}
+    with np.errstate(divide="ignore"):
+        times = engine.evaluator(sampled, env, engine.setting, engine.threshold)
+    sketch = engine.new_sketch()
+    sketch.add(np.broadcast_to(times, (n,)))
+    return sketch
+
+class KineticsMonteCarlo:
+    def __init__(self, model, uncertainty: dict = None, setting: str = None, threshold: float = None,
+                 environment: dict = None, environment_noise: dict = None, relative_accuracy: float = 0.01):
+        evaluator, default_setting, default_threshold, default_uncertainty = MODELS[type(model)]
+        self.model = model
+        self.evaluator = evaluator
+        self.setting = setting or default_setting      # mycelium compost kind, film medium
+        self.threshold = default_threshold if threshold is None else threshold
+        self.uncertainty = dict(default_uncertainty if uncertainty is None else uncertainty)
+        if isinstance(model, MyceliumKinetics):
+            self.environment = dict(INDUSTRIAL_ENVIRONMENT, **(environment or {}))
+            self.environment_noise = dict(ENVIRONMENT_NOISE if environment_noise is None else environment_noise)
+        else:
+            self.environment, self.environment_noise = {}, {}
+        self.relative_accuracy = relative_accuracy
+    
+    def new_sketch(self) -> QuantileSketch:
+        return QuantileSketch(self.relative_accuracy)
+    
+    def run(self, samples: int, seed: int = 42, chunk_size: int = 1 << 18, workers: int = 1) -> QuantileSketch:
+        """samples degradation times, chunked — workers > 1 spreads chunks over a process pool"""
+        sizes = [chunk_size] * (samples // chunk_size) + ([samples % chunk_size] if samples % chunk_size else [])
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        result = self.new_sketch()
+        if workers <= 1:
+            for n, child in zip(sizes, seeds):
+                result.merge(_run_chunk(self, n, child))
+            return result
+        with ProcessPoolExecutor(workers) as pool:
+            # A sliding window of futures — memory stays flat however many chunks there are
+            pending, chunks = [], iter(zip(sizes, seeds))
+            for n, child in chunks:
+                pending.append(pool.submit(_run_chunk, self, n, child))
+                if len(pending) >= 2 * workers:
+                    result.merge(pending.pop(0).result())
+            for future in pending:
+                result.merge(future.result())
+        return result
+    
+    def interval(self, sketch: QuantileSketch, confidence: float = 0.95) -> tuple:
+        tail = (1 - confidence) / 2
+        return sketch.quantile(tail), sketch.quantile(0.5), sketch.quantile(1 - tail)
+    
+    def report(self, sketch: QuantileSketch, confidence: float = 0.95) -> str:
+        low, median, high = self.interval(sketch, confidence)
+        unit = "days" if isinstance(self.model, MyceliumKinetics) or self.setting == "soil" else "s"
+        return (f"{type(self.model).__name__} {self.setting}: median {median:.1f} {unit}, "
+                f"{confidence:.0%} interval {low:.1f}–{high:.1f} {unit} over {sketch.count + sketch.infinite:,} samples "
+                f"— mercy measured, not promised.")
+
+# Integration test
+if __name__ == "__main__":
+    import time
+    
+    for model in (MyceliumKinetics(), SeaweedFilmKinetics(0.2), TetraEdibleDegradation(0.3)):
+        engine = KineticsMonteCarlo(model)
+        t0 = time.perf_counter()
+        sketch = engine.run(1_000_000)
+        print(f"{engine.report(sketch)} ({time.perf_counter() - t0:.2f} s)")
+    print(f"Point estimate: industrial compost {MyceliumKinetics().industrial_compost()} days")
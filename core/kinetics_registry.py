@@ -0,0 +1,211 @@
+"""
+KineticsRegistry-Pinnacle — One Protocol for Every Degradation Model + Compiled Laminate Stacks
+MercyLogistics Pinnacle Ultramasterpiece — Jan 19 2026
+
+Seaweed (exponential, seconds and days), tetra-edible (linear) and mycelium (environment
+factors) behind one protocol:
+- KineticsAdapter.term(medium, thickness, residual) → (constant s, coefficient s, factor model)
+  — a layer's time to degrade is constant + coefficient / environment factor, in seconds
+- Registry maps laminate material names and model classes to adapters
+- LayerStack — a laminate evaluated as one model over a batch of environments; compiled once per
+  stack + medium into a constant plus one term per distinct environment model, then cached
+"""
+
+import abc
+import math
+
+import numpy as np
+
+from core.kinetics_cache import KineticsCache
+from core.mycelium_kinetics import ENVIRONMENT_FIELDS, MyceliumKinetics
+from core.seaweed_film_kinetics import SeaweedFilmKinetics
+from core.tetra_edible_degradation import TetraEdibleDegradation
+
+SECONDS_PER_DAY = 86400.0
+MYCELIUM_G_PER_MM = 100.0  # shell mass per mm of wall — the default 100 g model is a 1 mm shell
+
+class KineticsAdapter(abc.ABC):
+    """Common protocol — subclasses wrap one model class"""
+    media = ()
+    
+    def __init__(self, model):
+        self.model = model
+    
+    @abc.abstractmethod
+    def term(self, medium: str, thickness: float = None, residual: float = None) -> tuple:
+        """(constant s, coefficient s, factor model or None) — infinite constant for unsupported media.
+        
+        thickness defaults to the model's own; residual is the fraction left at "degraded",
+        None keeps the model's native threshold so single layers match its point estimates.
+        """
+
+class SeaweedAdapter(KineticsAdapter):
+    media = ("water", "saliva", "gastric", "soil")
+    
+    def term(self, medium, thickness=None, residual=None):
+        if medium not in self.media:
+            return math.inf, 0.0, None
+        m = self.model
+        thickness = m.M0 if thickness is None else thickness
+        threshold = 0.01 if residual is None else residual * thickness  # native: 0.01 mm left
+        k = getattr(m, f"k_{medium}")
+        if k == 0 or thickness <= threshold:
+            return (math.inf if k == 0 else 0.0), 0.0, None
+        seconds = math.log(thickness / threshold) / k
+        return (seconds * SECONDS_PER_DAY if medium == "soil" else seconds), 0.0, None
+
+class TetraAdapter(KineticsAdapter):
+    media = ("saliva", "gastric", "soil")
+    _RATES = {"saliva": ("saliva_rate", 1.0), "gastric": ("gastric_rate", 1.0), "soil": ("microbial_rate", SECONDS_PER_DAY)}
+    
+    def term(self, medium, thickness=None, residual=None):
+        if medium not in self.media:
+            return math.inf, 0.0, None
+        attr, seconds_per_unit = self._RATES[medium]
+        rate = getattr(self.model, attr)
+        thickness = self.model.thickness if thickness is None else thickness
+        remaining = thickness * (1 - (residual or 0.0))  # native: fully dissolved
+        return (remaining / rate * seconds_per_unit if rate else math.inf), 0.0, None
+
+class MyceliumAdapter(KineticsAdapter):
+    media = ("industrial", "home", "soil")
+    
+    def term(self, medium, thickness=None, residual=None):
+        if medium not in self.media:
+            return math.inf, 0.0, None
+        m = self.model
+        if thickness is not None and not thickness > 0:
+            raise ValueError(f"Mycelium layer thickness must be positive, got {thickness!r}")
+        mass = m.M0 if thickness is None else thickness * MYCELIUM_G_PER_MM
+        fraction = 5.0 / mass if residual is None else residual  # native: 5 g left
+        base_k = getattr(m, f"k_{medium}_base")
+        if base_k == 0:
+            return math.inf, 0.0, None
+        if fraction >= 1:
+            return 0.0, 0.0, None  # already at the threshold
+        return 0.0, -math.log(fraction) / base_k * SECONDS_PER_DAY, m
+
+class KineticsRegistry:
+    def __init__(self):
+        self.materials = {}   # material name → (model factory(thickness), adapter class)
+        self.adapters = {}    # model class → adapter class
+        self._compiled = KineticsCache(maxsize=33)
+    
+    def register(self, material: str, model_cls, adapter_cls, factory=None):
+        """factory(thickness) builds the model for a layer — model_cls(thickness) by default"""
+        self.materials[material] = (factory or model_cls, adapter_cls)
+        self.adapters[model_cls] = adapter_cls
+    
+    def adapter(self, model) -> KineticsAdapter:
+        for cls in type(model).__mro__:
+            if cls in self.adapters:
+                return self.adapters[cls](model)
+        raise KeyError(f"No kinetics adapter registered for {type(model).__name__}")
+    
+    def layer(self, material, thickness: float = None) -> tuple:
+        """(adapter, thickness) from a material name or a model instance"""
+        if isinstance(material, str):
+            if material not in self.materials:
+                raise KeyError(f"Unknown laminate material: {material}")
+            factory, adapter_cls = self.materials[material]
+            return adapter_cls(factory(thickness) if thickness is not None else factory()), thickness
+        return self.adapter(material), thickness
+    
+    def stack(self, layers, mode: str = "series", residual: float = None) -> "LayerStack":
+        return LayerStack([self.layer(*spec) if isinstance(spec, tuple) else self.layer(spec) for spec in layers],
+                          self, mode, residual)
+
+class CompiledStack:
+    """constant + Σ coefficient / factor(env) (series) or max(...) (parallel) — one factor pass per model"""
+    
+    def __init__(self, constant: float, terms: list, mode: str):
+        self.constant = constant
+        self.terms = terms    # [(coefficient s, factor model)]
+        self.mode = mode
+    
+    def __call__(self, environments=None, n: int = None) -> np.ndarray:
+        if not self.terms:
+            if n is None:
+                n = 1 if environments is None else len(environments[ENVIRONMENT_FIELDS[0]])
+            return np.full(n, self.constant)  # no environment term — still one value per row
+        result = None
+        for coefficient, model in self.terms:
+            factor = model.combined_environment_factor_batch(*(environments[name] for name in ENVIRONMENT_FIELDS))
+            with np.errstate(divide="ignore"):
+                term = coefficient / factor
+            result = term if result is None else (result + term if self.mode == "series" else np.maximum(result, term))
+        return result + self.constant if self.mode == "series" else np.maximum(result, self.constant)
+
+class LayerStack:
+    """Laminate as one model — series: layers degrade one after another from the exposed face;
+    parallel: every layer exposed at once (shredded, milled)"""
+    
+    def __init__(self, layers: list, registry: KineticsRegistry, mode: str = "series", residual: float = None):
+        if mode not in ("series", "parallel"):
+            raise ValueError(f"Unknown stack mode: {mode}")
+        self.layers = layers  # [(adapter, thickness or None)]
+        self.registry = registry
+        self.mode = mode
+        self.residual = residual
+    
+    def _key(self, medium: str):
+        parts = []
+        for adapter, thickness in self.layers:
+            token = adapter.model.params_token()
+            if token is None:
+                return None
+            parts.append((type(adapter), token, thickness))
+        return (medium, self.mode, self.residual, tuple(parts))
+    
+    def compile(self, medium: str) -> CompiledStack:
+        key = self._key(medium)
+        compiled = self.registry._compiled.get(key) if key is not None else None
+        if isinstance(compiled, CompiledStack):
+            return compiled
+        series = self.mode == "series"
+        constant = 0.0 if series else -math.inf
+        grouped = {}  # environment layers sharing one model's factor parameters fold into one term
+        for adapter, thickness in self.layers:
+            fixed, coefficient, model = adapter.term(medium, thickness, self.residual)
+            constant = constant + fixed if series else max(constant, fixed)
+            if model is not None:
+                group = model.params_token() or id(model)
+                previous = grouped.get(group, (0.0 if series else -math.inf, model))[0]
+                grouped[group] = (previous + coefficient if series else max(previous, coefficient), model)
+        compiled = CompiledStack(constant, list(grouped.values()), self.mode)
+        if key is not None:
+            self.registry._compiled.put(key, compiled)
+        return compiled
+    
+    def time_to_degrade(self, medium: str, environments=None, n: int = None) -> np.ndarray:
+        """Seconds until the laminate is degraded, one per environment row"""
+        return self.compile(medium)(environments, n)
+    
+    def days_to_degrade(self, medium: str, environments=None, n: int = None) -> np.ndarray:
+        return self.time_to_degrade(medium, environments, n) / SECONDS_PER_DAY
+
+_default = KineticsRegistry()
+_default.register("seaweed_algae", SeaweedFilmKinetics, SeaweedAdapter)
+_default.register("tetra_edible", TetraEdibleDegradation, TetraAdapter)
+_default.register("mycelium_biopolymer", MyceliumKinetics, MyceliumAdapter,
+                  factory=lambda thickness=None: MyceliumKinetics() if thickness is None
+                  else MyceliumKinetics(thickness * MYCELIUM_G_PER_MM))
+
+def default_registry() -> KineticsRegistry:
+    return _default
+
+# Integration test
+if __name__ == "__main__":
+    from core.kinetics_registry import default_registry  # the instance other modules share
+    
+    registry = default_registry()
+    stack = registry.stack([("mycelium_biopolymer", 1.0), ("tetra_edible", 0.3), ("seaweed_algae", 0.2)])
+    rng = np.random.default_rng(42)
+    n = 100_000
+    env = {"temp_c": rng.uniform(10, 40, n), "rh_percent": rng.uniform(40, 100, n), "ph": rng.uniform(5, 8, n),
+           "lux": rng.uniform(0, 500, n), "o2_percent": rng.uniform(15, 21, n), "pressure_kpa": rng.uniform(95, 105, n)}
+    days = stack.days_to_degrade("soil", env)
+    print(f"Laminate in soil: median {np.median(days):.1f} days, 5–95% {np.percentile(days, 5):.1f}–{np.percentile(days, 95):.1f}")
+    print(f"Laminate in saliva: {stack.time_to_degrade('saliva')[0]} s — mycelium shell never dissolves")
+    print(f"Seaweed alone, saliva: {registry.stack(['seaweed_algae']).time_to_degrade('saliva')[0]:.1f} s "
+          f"(model: {SeaweedFilmKinetics().saliva_dissolve()} s)")
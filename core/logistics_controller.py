@@ -3,38 +3,98 @@ LogisticsController-Pinnacle — Full Loop + Pyrolysis Recycle Integration
 MercyLogistics Pinnacle Ultramasterpiece — Jan 18 2026
 """
 
+import contextlib
+
 from core.gel_printer import GelPrinter
 from core.drone_pod import DronePod
 from core.robot_hand_off import RobotHandOff
 from core.pyrolysis_recycle import PyrolysisRecycle
-from core.starlink_drone_controller import StarlinkDroneController
+from core.fleet_dispatcher import FleetDispatcher
+from core.cycle_pipeline import CyclePipeline
+from core.energy_scheduler import EnergyScheduler
+from core.fleet_table import FleetTable
+from core.instrumentation import Instrumentation, shared_instruments
+from core.order_log import BOSS_DROP, CYCLE, DROP, OrderLog
 
 class LogisticsController:
-    def __init__(self):
+    def __init__(self, drone_fleet=None):
         self.printer = GelPrinter()
         self.drone = DronePod()
         self.robot = RobotHandOff()
         self.recycle = PyrolysisRecycle()
-        self.drone_fleet = StarlinkDroneController()
+        if drone_fleet is None:
+            # Sky link driver loaded only when no fleet is handed in — simulated fleets skip it
+            from core.starlink_drone_controller import StarlinkDroneController
+            drone_fleet = StarlinkDroneController()
+        self.drone_fleet = drone_fleet  # command_drop / telemetry_sync
+        self.order_log = None   # OrderLog — set by record_orders
     
     def full_cycle(self, flavor: str, vitamins: dict, destination: dict):
-        print_step = self.printer.print_sachet(flavor, vitamins)
-        drone_step = self.drone.deploy()
-        robot_step = self.robot.transfer("sachet-001")
-        recycle_step = self.recycle.close_loop()  # Auto reclaim on cycle
+        instruments = shared_instruments()
+        with self._recording(CYCLE, flavor, "", vitamins, destination), instruments.time("cycle.full"):
+            with instruments.time("cycle.print"):
+                print_step = self.printer.print_sachet(flavor, vitamins)
+            with instruments.time("cycle.fly"):
+                drone_step = self.drone.deploy()
+            with instruments.time("cycle.handoff"):
+                robot_step = self.robot.transfer("sachet-001")
+            with instruments.time("cycle.recycle"):
+                recycle_step = self.recycle.close_loop()  # Auto reclaim on cycle
+        instruments.count("cycle.completed")
         return f"Cycle complete: {print_step} → {drone_step} → {robot_step} → {recycle_step}"
     
+    def cycle_pipeline(self, workers: dict = None, queue_size: int = 64, processes=()) -> CyclePipeline:
+        """Staged full_cycle — many orders in flight, per-stage workers and metrics"""
+        return CyclePipeline(self, workers, queue_size, processes)
+    
     def mercy_gel_drop(self, player_id: str, destination: dict, flavor: str = "butter"):
-        status = self.drone_fleet.command_drop(0, destination, f"MercyGel-{flavor}")
-        # Trigger reclaim simulation on delivery
-        self.recycle.collect_fragment(f"gel_{player_id}")
+        instruments = shared_instruments()
+        with self._recording(DROP, flavor, player_id, None, destination):
+            with instruments.time("drop.latency"):
+                status = self.drone_fleet.command_drop(0, destination, f"MercyGel-{flavor}")
+            # Trigger reclaim simulation on delivery
+            with instruments.time("drop.reclaim"):
+                self.recycle.collect_fragment(f"gel_{player_id}")
+        instruments.count(f"drop.{flavor}")
         return f"{status} — {flavor} abundance delivered."
     
     def boss_reward_gel_drop(self, player_id: str, destination: dict, flavor: str = "butter"):
-        status = self.drone_fleet.command_drop(0, destination, f"MercyGel-{flavor}")
-        self.recycle.collect_fragment(f"boss_gel_{player_id}")
+        with self._recording(BOSS_DROP, flavor, player_id, None, destination):
+            status = self.drone_fleet.command_drop(0, destination, f"MercyGel-{flavor}")
+            self.recycle.collect_fragment(f"boss_gel_{player_id}")
         return f"{status} — boss reward {flavor} dispatched — joy restored."
     
+    def fleet_dispatcher(self, drone_count: int = 8, **kwargs) -> FleetDispatcher:
+        """Async dispatcher for event peaks — drops spread over the fleet, reclaim overlapped"""
+        return FleetDispatcher(self.drone_fleet, self.recycle, drone_count, **kwargs)
+    
+    def fleet_table(self, pods: int = 1, arms: int = 1) -> FleetTable:
+        """Array-backed pods and hand-off arms for fleet scale — views duck-type with DronePod/RobotHandOff"""
+        return FleetTable(pods, arms)
+    
+    def energy_scheduler(self, **kwargs) -> EnergyScheduler:
+        """Solar-paced printing and pyrolysis — feed it telemetry, jobs run in surplus windows"""
+        return EnergyScheduler(self.recycle, self.printer, **kwargs)
+    
+    def record_orders(self, log: OrderLog = None) -> OrderLog:
+        """Every cycle and drop from here on appended to log (in-memory OrderLog when None).
+        
+        A file-backed log writes whole segments — give it flush_s and call its flush_if_due() from
+        a periodic tick to bound what a crash loses (appends alone only check while orders keep
+        arriving), and close() it on shutdown.
+        """
+        self.order_log = log if log is not None else OrderLog()
+        return self.order_log
+    
+    def _recording(self, kind: int, flavor: str, player: str, vitamins: dict, destination: dict):
+        if self.order_log is None:
+            return contextlib.nullcontext()
+        return self.order_log.recording(kind, flavor, player, vitamins, destination)
+    
+    def instrumentation(self) -> Instrumentation:
+        """Shared timers and histograms — set_enabled(True) to record, persist(shard) to sync"""
+        return shared_instruments()
+    
     def reclaim_status(self):
         return self.recycle.status()
 
@@ -12,11 +12,19 @@ Mycelium composite exponential decay with full environmental + microbial factors
 - Pressure Gaussian peak 101 kPa (×1.0)
 - Microbial activity Gaussian synergy (temperature 20-30°C + humidity 70-90% → ×1.8 max)
 - Zero microplastic — full fungal + microbial metabolization
+- industrial_compost and reports memoized per parameter set (shared kinetics cache)
 """
 
 import math
 
-class MyceliumKinetics:
+import numpy as np
+
+from core.kinetics_cache import CachedKinetics, cached_kinetics
+
+# Column names accepted by the batch API (structured array fields or dict keys)
+ENVIRONMENT_FIELDS = ("temp_c", "rh_percent", "ph", "lux", "o2_percent", "pressure_kpa")
+
+class MyceliumKinetics(CachedKinetics):
     def __init__(self, initial_mass_g: float = 100.0,
                  ref_temp_c: float = 25.0,
                  ref_rh_percent: float = 90.0,
@@ -129,4 +137,91 @@ class MyceliumKinetics:
         t = -math.log(threshold_g / self.M0) / k
         return round(t, 1)
     
-    def industrial_compost(self, temp_c: float = 60.0, rh_percent: float = 95.0, ph: float = 7.0, lux: float = 50.0, o2_percent: float = 21.
+    @cached_kinetics
+    def industrial_compost(self, temp_c: float = 60.0, rh_percent: float = 95.0, ph: float = 7.0, lux: float = 50.0, o2_percent: float = 21.0, pressure_kpa: float = 101.3) -> float:
+        k = self.adjusted_rate(self.k_industrial_base, temp_c, rh_percent, ph, lux, o2_percent, pressure_kpa)
+        return self.time_to_degrade(k)
+    
+    # Batch API — NumPy arrays in, arrays out, same branches as the scalar methods.
+    # Every intermediate is computed in the scalar evaluation order, but np.exp / np.power may
+    # use SIMD kernels that differ from libm by 1 ulp. Tolerance (tests/test_mycelium_batch.py):
+    # factor and rate within 1e-12 relative of the scalar path; time_to_degrade rounded the way
+    # round() rounds, so it differs only where those ulps straddle a 0.05-day boundary — by 0.1.
+    
+    def combined_environment_factor_batch(self, temp_c, rh_percent, ph, lux, o2_percent, pressure_kpa) -> np.ndarray:
+        temp_c, rh_percent, ph, lux, o2_percent, pressure_kpa = np.broadcast_arrays(
+            *(np.asarray(v, dtype=np.float64) for v in (temp_c, rh_percent, ph, lux, o2_percent, pressure_kpa)))
+        
+        # Temperature — Q10 inside 5-45°C, flat 0.1 cutoff outside
+        cutoff = (temp_c < 5) | (temp_c > 45)
+        temperature = np.where(cutoff, 0.1, self.Q10 ** ((temp_c - self.T_ref) / 10.0))
+        
+        rh = np.clip(rh_percent, 0, 100)
+        humidity = 1.0 + self._gaussian(rh, self.humidity_peak, self.humidity_width) * (self.humidity_max_boost - 1.0)
+        
+        ph_c = np.clip(ph, 0, 14)
+        ph_f = 1.0 + self._gaussian(ph_c, self.ph_peak, self.ph_width) * (self.ph_max_boost - 1.0)
+        
+        # Light — UV inhibition above threshold, no clamp below
+        light = np.where(lux > self.uv_inhibition_threshold, 0.3,
+                         1.0 + self._gaussian(lux, self.light_peak, self.light_width) * (self.light_max_boost - 1.0))
+        
+        o2 = np.clip(o2_percent, 0, 100)
+        oxygen = 1.0 + self._gaussian(o2, self.oxygen_peak, self.oxygen_width) * (self.oxygen_max_boost - 1.0)
+        
+        pressure = np.clip(pressure_kpa, 50, 150)
+        pressure_f = 0.5 + self._gaussian(pressure, self.pressure_peak, self.pressure_width) * 0.5
+        
+        # Microbial synergy uses the unclamped readings, as in the scalar path
+        microbial = 1.0 + (self._gaussian(temp_c, self.microbial_temp_peak, self.microbial_temp_width) *
+                           self._gaussian(rh_percent, self.microbial_rh_peak, self.microbial_rh_width)) * (self.microbial_max_boost - 1.0)
+        
+        return temperature * humidity * ph_f * light * oxygen * pressure_f * microbial
+    
+    def adjusted_rate_batch(self, base_k, temp_c, rh_percent, ph, lux, o2_percent, pressure_kpa) -> np.ndarray:
+        factor = self.combined_environment_factor_batch(temp_c, rh_percent, ph, lux, o2_percent, pressure_kpa)
+        return np.asarray(base_k, dtype=np.float64) * factor
+    
+    def remaining_mass_batch(self, k, t_days) -> np.ndarray:
+        return self.M0 * np.exp(-np.asarray(k, dtype=np.float64) * np.asarray(t_days, dtype=np.float64))
+    
+    def time_to_degrade_batch(self, k, threshold_g: float = 5.0) -> np.ndarray:
+        k = np.asarray(k, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = -math.log(threshold_g / self.M0) / k
+        t = np.where(k == 0, np.inf, t)
+        return _round_half_like_python(t, 1)
+    
+    def evaluate_batch(self, readings, base_k: float = None, t_days=None, threshold_g: float = 5.0) -> dict:
+        """One pass over columnar readings (dict of arrays or structured array).
+        
+        Returns factor, rate and time_to_degrade arrays, plus remaining_mass when t_days is given.
+        """
+        if base_k is None:
+            base_k = self.k_industrial_base
+        columns = [readings[name] for name in ENVIRONMENT_FIELDS]
+        factor = self.combined_environment_factor_batch(*columns)
+        rate = np.asarray(base_k, dtype=np.float64) * factor
+        result = {
+            "factor": factor,
+            "rate": rate,
+            "time_to_degrade": self.time_to_degrade_batch(rate, threshold_g),
+        }
+        if t_days is not None:
+            result["remaining_mass"] = self.remaining_mass_batch(rate, t_days)
+        return result
+    
+    @staticmethod
+    def _gaussian(x: np.ndarray, peak: float, width: float) -> np.ndarray:
+        deviation = x - peak
+        return np.exp(-(deviation ** 2) / (2 * width ** 2))
+
+def _round_half_like_python(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """np.round, with near-tie elements re-rounded by round() so results match the scalar path."""
+    rounded = np.round(values, ndigits)
+    scaled = values * 10 ** ndigits
+    with np.errstate(invalid="ignore"):
+        near_tie = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_tie):
+        rounded.flat[i] = round(float(values.flat[i]), ndigits)
+    return rounded
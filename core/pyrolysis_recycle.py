@@ -10,60 +10,85 @@ Complete pyrolysis recycle with advanced RF-tag collection:
 - Grandma-safe material loop
 """
 
+import os
 import time
 import random
 import math
 
+import numpy as np
+
+from core.instrumentation import shared_instruments
+from core.tag_store import TagStore
+
 class PyrolysisRecycle:
-    def __init__(self, drone_count: int = 8):
+    def __init__(self, drone_count: int = 8, seed: int = None):
         self.collected_fragments = 0
-        self.tag_database = {}          # tag_id: purity_score
         self.filament_yield = 0.97      # 97% polymer back
         self.energy_per_100 = 0.7       # kWh
+        self.energy_used_kwh = 0.0      # metered over every batch processed
         self.purity_threshold = 99.9    # % safe reclaim
+        self.tag_database = TagStore(self.purity_threshold)  # tag_id → purity, pass mask
+        self.seed = seed                # set → reproducible tags/purities for benchmarks
+        self.rng = np.random.default_rng(seed)
         self.drone_count = drone_count
         self.sweep_grid_size = 100.0    # meters side
     
     def generate_tag(self, fragment_id: str) -> str:
         """Simulate encrypted RF-tag generation"""
-        tag = secrets.token_hex(8)
-        self.tag_database[tag] = {"id": fragment_id, "purity": random.uniform(99.5, 100.0)}
-        return tag
+        tag = int(self._tag_ids(1)[0])
+        self.tag_database.add(tag, self.rng.uniform(99.5, 100.0), fragment_id)
+        return f"{tag:016x}"
+    
+    def _tag_ids(self, n: int) -> np.ndarray:
+        # One bulk buffer — OS entropy in the field, seeded stream when reproducing runs
+        buffer = os.urandom(8 * n) if self.seed is None else self.rng.bytes(8 * n)
+        return np.frombuffer(buffer, dtype=np.uint64)
+    
+    def generate_tags(self, n: int) -> np.ndarray:
+        """Bulk RF-tag generation — n fragments tagged in one insert"""
+        tags = self._tag_ids(n)
+        purities = self.rng.uniform(99.5, 100.0, n)
+        self.tag_database.add_many(tags, purities, first_fragment=self.collected_fragments)
+        return tags
     
     def drone_sweep_simulation(self, area_coverage: float = 1.0):
         """Multi-drone coordinated grid sweep"""
-        fragments_found = int(50 * area_coverage * self.drone_count * random.uniform(0.9, 1.1))
-        for _ in range(fragments_found):
-            tag = self.generate_tag(f"frag_{self.collected_fragments}")
-            self.collected_fragments += 1
+        fragments_found = int(50 * area_coverage * self.drone_count * self.rng.uniform(0.9, 1.1))
+        self.generate_tags(fragments_found)
+        self.collected_fragments += fragments_found
         return f"Drone sweep complete — {fragments_found} fragments tagged/collected."
     
+    def collect_fragment(self, fragment_id: str) -> str:
+        """Delivery reclaim — tag one returned fragment"""
+        tag = self.generate_tag(fragment_id)
+        self.collected_fragments += 1
+        return tag
+    
     def verify_purity(self, tag: str) -> bool:
-        if tag in self.tag_database:
-            return self.tag_database[tag]["purity"] >= self.purity_threshold
-        return False
+        return self.tag_database.passes(tag)
     
     def process_batch(self, batch_size: int = 100):
         if self.collected_fragments < batch_size:
             return "Insufficient fragments — mercy waits."
         
-        valid_count = 0
-        for _ in range(batch_size):
-            # Simulate tag read + verify
-            tag = random.choice(list(self.tag_database.keys()))
-            if self.verify_purity(tag):
-                valid_count += 1
-            del self.tag_database[tag]
+        # Simulate tag read + verify — batch drawn and removed in one pass
+        passed = self.tag_database.pop_random(batch_size, self.rng)
+        valid_count = int(np.count_nonzero(passed))
+        instruments = shared_instruments()
+        instruments.observe("recycle.batch_size", len(passed))
+        instruments.observe("recycle.tags_processed", valid_count)
         
         reclaimed = valid_count * self.filament_yield
         energy_used = (valid_count / 100) * self.energy_per_100
+        self.energy_used_kwh += energy_used
         
-        self.collected_fragments -= batch_size
+        self.collected_fragments -= len(passed)  # fewer than batch_size when the tag store runs short
         return f"Batch processed — {valid_count} valid, {reclaimed:.1f} units filament reclaimed, {energy_used:.2f} kWh used."
     
     def close_loop(self):
-        sweep = self.drone_sweep_simulation()
-        process = self.process_batch()
+        with shared_instruments().time("recycle.close_loop"):
+            sweep = self.drone_sweep_simulation()
+            process = self.process_batch()
         return f"Pyrolysis loop closed — {sweep} → {process} — cradle-to-cradle eternal."
     
     def status(self):
@@ -4,16 +4,54 @@ MercyLogistics Pinnacle Ultramasterpiece — Jan 17 2026
 
 Nano-sensors in laminate — temperature, pressure, seal check
 Auto-report to controller — predictive heal
+Streaming ingest — every sachet in flight checked per batch of readings (SachetStream)
 """
 
+from core.sachet_stream import SachetStream
+
 class SachetIntegrity:
     def __init__(self):
         self.temp_range = (2, 8)    # °C safe zone
         self.pressure_tol = 0.1     # bar variance
         self.seal_check = True
+        self.sensors = None         # SachetStream once readings flow
+    
+    def stream(self, capacity: int = 1024, **kwargs) -> SachetStream:
+        """Columnar ingest for the fleet's nano-sensors — monitor() and predict() read its state"""
+        if self.sensors is None:
+            self.sensors = SachetStream(self, capacity, **kwargs)
+        return self.sensors
     
     def monitor(self, sachet_id: str):
-        return f"Sachet {sachet_id} integrity: temp OK, pressure stable, seal 100%."
+        slot = self.sensors.slot_of.get(sachet_id) if self.sensors is not None else None
+        if slot is None:
+            return f"Sachet {sachet_id} integrity: temp OK, pressure stable, seal 100%."
+        return f"Sachet {sachet_id} integrity: {self.sensors.describe(slot)}."
     
     def predict(self):
-        return "Predictive heal engaged — micro-tear sealed before breach."
+        if self.sensors is None:
+            return "Predictive heal engaged — micro-tear sealed before breach."
+        drifting = len(self.sensors.drifting())
+        return f"Predictive heal engaged — {drifting} sachets drifting toward breach, sealed before it."
+
+# Integration test
+if __name__ == "__main__":
+    import numpy as np
+    
+    integrity = SachetIntegrity()
+    sensors = integrity.stream()
+    slots = sensors.register(f"sachet-{i:03d}" for i in range(333))
+    rng = np.random.default_rng(42)
+    for tick in range(9):
+        temp = rng.normal(5.0, 0.5, len(slots))
+        pressure = rng.normal(1.0, 0.01, len(slots))
+        if tick >= 6:
+            temp[7] = 9.5          # cold chain slip
+            pressure[42] -= 0.3    # micro-tear
+        events = sensors.ingest(slots, tick * 0.25, temp, pressure)
+        for event in events:
+            print(f"t={event['t']:.2f}s {sensors.ids[event['slot']]}: flags {event['previous']} → {event['flags']}")
+    print(integrity.monitor("sachet-007"))
+    print(integrity.monitor("sachet-042"))
+    print(integrity.predict())
+    print(sensors.status())
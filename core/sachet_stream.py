@@ -0,0 +1,157 @@
+"""
+SachetStream-Pinnacle — Columnar Nano-Sensor Ingest + Breach Detection
+MercyLogistics Pinnacle Ultramasterpiece — Jan 19 2026
+
+Every sachet in flight, several readings a second:
+- Batched readings as columns — slot, time, temperature °C, pressure bar
+- Vectorized checks against SachetIntegrity.temp_range and pressure_tol
+- Per-sachet rolling state in flat arrays — last reading, EWMA pressure baseline, breach flags
+  (33 bytes a sachet with the batch-order scratch column, no dict per reading)
+- Breach events emitted on transitions only — a sachet that stays out of range reports once
+- Repeated slots inside one batch are applied in arrival order
+"""
+
+import numpy as np
+
+TEMP_LOW = 1
+TEMP_HIGH = 2
+PRESSURE = 4
+SENSOR = 8      # NaN reading — sensor or link fault
+
+EVENT_DTYPE = np.dtype([("slot", np.int64), ("t", np.float64), ("flags", np.uint8), ("previous", np.uint8),
+                        ("temp", np.float32), ("pressure", np.float32)])
+
+class SachetStream:
+    def __init__(self, integrity, capacity: int = 1024, baseline_alpha: float = 0.1):
+        self.integrity = integrity          # SachetIntegrity — thresholds read on every batch
+        self.baseline_alpha = baseline_alpha  # EWMA weight of an in-tolerance pressure reading
+        self.size = 0
+        self.ids = []                       # slot → sachet ID
+        self.slot_of = {}                   # sachet ID → slot
+        self.temp = np.full(capacity, np.nan, dtype=np.float32)
+        self.pressure = np.full(capacity, np.nan, dtype=np.float32)
+        self.baseline = np.full(capacity, np.nan, dtype=np.float32)
+        self.last_t = np.zeros(capacity, dtype=np.float64)
+        self.readings = np.zeros(capacity, dtype=np.uint32)
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+        self.ingested = 0
+        self.breaches = 0                   # transitions into a breach state
+        self._mark = np.zeros(capacity, dtype=np.int64)
+    
+    def __len__(self):
+        return self.size
+    
+    @property
+    def nbytes(self) -> int:
+        columns = ("temp", "pressure", "baseline", "last_t", "readings", "flags", "_mark")
+        return sum(getattr(self, name).nbytes for name in columns)
+    
+    def register(self, sachet_ids) -> np.ndarray:
+        """Slots for sachet IDs — new IDs appended; ingest takes slots, never strings"""
+        slots = []
+        for sachet_id in sachet_ids:
+            slot = self.slot_of.get(sachet_id)
+            if slot is None:
+                slot = self.slot_of[sachet_id] = len(self.ids)
+                self.ids.append(sachet_id)
+            slots.append(slot)
+        self._reserve(len(self.ids))
+        self.size = len(self.ids)
+        return np.asarray(slots, dtype=np.int64)
+    
+    def _reserve(self, needed: int):
+        capacity = len(self.flags)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name, fill in (("temp", np.nan), ("pressure", np.nan), ("baseline", np.nan), ("last_t", 0),
+                           ("readings", 0), ("flags", 0), ("_mark", 0)):
+            column = getattr(self, name)
+            grown = np.full(capacity, fill, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+    
+    def ingest(self, slots, t, temp, pressure) -> np.ndarray:
+        """One batch of readings — returns breach/clear events (EVENT_DTYPE) for state transitions"""
+        slots = np.asarray(slots, dtype=np.int64)
+        n = len(slots)
+        t, temp, pressure = (np.broadcast_to(np.asarray(c, dtype=dtype), (n,)) for c, dtype in
+                             ((t, np.float64), (temp, np.float32), (pressure, np.float32)))
+        if n and (slots.min() < 0 or slots.max() >= self.size):
+            raise IndexError("Reading for an unregistered sachet slot")
+        self.ingested += n
+        # One write survives per slot in the mark array — any row that lost is a repeated slot
+        order = np.arange(n)
+        self._mark[slots] = order
+        if (self._mark[slots] == order).all():
+            return self._apply(slots, t, temp, pressure)
+        rank = _occurrence_rank(slots)
+        events = [self._apply(slots[rank == r], t[rank == r], temp[rank == r], pressure[rank == r])
+                  for r in range(int(rank.max()) + 1)]
+        return np.concatenate(events)
+    
+    def _apply(self, slots, t, temp, pressure) -> np.ndarray:
+        low, high = self.integrity.temp_range
+        tolerance = self.integrity.pressure_tol
+        baseline = self.baseline[slots]
+        fresh = np.isnan(baseline)
+        baseline = np.where(fresh, pressure, baseline)  # first reading sets the baseline
+        flags = np.where(temp < low, TEMP_LOW, 0) | np.where(temp > high, TEMP_HIGH, 0)
+        within = np.abs(pressure - baseline) <= tolerance
+        flags |= np.where(within, 0, PRESSURE)
+        faulty = np.isnan(temp) | np.isnan(pressure)
+        flags = np.where(faulty, SENSOR, flags).astype(np.uint8)
+        # Baseline follows only healthy readings — a slow leak can't drag it along
+        healthy = within & ~faulty
+        self.baseline[slots] = np.where(healthy, baseline + self.baseline_alpha * (pressure - baseline), baseline)
+        self.temp[slots] = temp
+        self.pressure[slots] = pressure
+        self.last_t[slots] = t
+        self.readings[slots] += 1
+        previous = self.flags[slots]
+        self.flags[slots] = flags
+        changed = np.flatnonzero(flags != previous)
+        if not len(changed):
+            return np.empty(0, dtype=EVENT_DTYPE)
+        events = np.empty(len(changed), dtype=EVENT_DTYPE)
+        events["slot"] = slots[changed]
+        events["t"] = t[changed]
+        events["flags"] = flags[changed]
+        events["previous"] = previous[changed]
+        events["temp"] = temp[changed]
+        events["pressure"] = pressure[changed]
+        self.breaches += int(np.count_nonzero(previous[changed] == 0))
+        return events
+    
+    def breached(self) -> np.ndarray:
+        """Slots currently in any breach state"""
+        return np.flatnonzero(self.flags[:self.size])
+    
+    def drifting(self, fraction: float = 0.5) -> np.ndarray:
+        """Healthy slots whose pressure sits past fraction × tolerance from baseline — heal candidates"""
+        deviation = np.abs(self.pressure[:self.size] - self.baseline[:self.size])
+        with np.errstate(invalid="ignore"):
+            return np.flatnonzero((self.flags[:self.size] == 0) & (deviation > fraction * self.integrity.pressure_tol))
+    
+    def describe(self, slot: int) -> str:
+        flags = int(self.flags[slot])
+        if not self.readings[slot]:
+            return "no readings yet"
+        temp = "temp OK" if not flags & (TEMP_LOW | TEMP_HIGH) else f"temp {self.temp[slot]:.1f}°C out of range"
+        pressure = "pressure stable" if not flags & PRESSURE else f"pressure off baseline by {abs(self.pressure[slot] - self.baseline[slot]):.2f} bar"
+        return "sensor fault" if flags & SENSOR else f"{temp}, {pressure}"
+    
+    def status(self) -> str:
+        return (f"Sachet stream: {self.size} sachets ({self.nbytes / 1e6:.1f} MB), {self.ingested} readings, "
+                f"{len(self.breached())} in breach, {self.breaches} breaches seen — integrity eternal.")
+
+def _occurrence_rank(slots: np.ndarray) -> np.ndarray:
+    """0 for a slot's first reading in the batch, 1 for its second, ..."""
+    order = np.argsort(slots, kind="stable")
+    ordered = slots[order]
+    starts = np.r_[0, np.flatnonzero(ordered[1:] != ordered[:-1]) + 1]
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(slots)]))
+    rank = np.empty(len(slots), dtype=np.int64)
+    rank[order] = np.arange(len(slots)) - group_start
+    return rank
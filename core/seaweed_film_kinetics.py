@@ -6,11 +6,14 @@ Seaweed/algae film exponential decay model:
 - dM/dt = -kM → M(t) = M0 × exp(-kt)
 - k tuned per medium (water instant, saliva rapid, gastric fast, soil slow)
 - Zero residue — full metabolization/compost
+- Reports memoized per thickness + decay constants (shared kinetics cache)
 """
 
 import math
 
-class SeaweedFilmKinetics:
+from core.kinetics_cache import CachedKinetics, cached_kinetics
+
+class SeaweedFilmKinetics(CachedKinetics):
     def __init__(self, initial_thickness_mm: float = 0.2):
         self.M0 = initial_thickness_mm  # Initial thickness
         
@@ -43,6 +46,7 @@ class SeaweedFilmKinetics:
         # Soil in days
         return self.time_to_dissolve(self.k_soil)
     
+    @cached_kinetics
     def full_degradation_report(self) -> str:
         water = self.water_dissolve()
         saliva = self.saliva_dissolve()
@@ -0,0 +1,169 @@
+"""
+TagStore-Pinnacle — Compact RF-Tag Index for Pyrolysis Reclaim
+MercyLogistics Pinnacle Ultramasterpiece — Jan 19 2026
+
+Array-backed tag store:
+- 64-bit tag IDs, purity scores and fragment serials in parallel NumPy columns
+- Pass/fail mask precomputed against purity threshold on insert
+- Swap-remove slots — O(1) random draw and deletion, O(batch) bulk pops
+- Tag → slot dict built lazily on first single-tag lookup, bulk sweeps never pay for it
+- Hex-string tag API kept for single-tag callers
+- to_bytes / from_bytes — live columns packed little-endian, what a shard store persists
+"""
+
+import json
+import struct
+
+import numpy as np
+
+class TagStore:
+    def __init__(self, purity_threshold: float = 99.9, capacity: int = 1024):
+        self.purity_threshold = purity_threshold
+        self.size = 0
+        self.tags = np.empty(capacity, dtype=np.uint64)
+        self.purity = np.empty(capacity, dtype=np.float64)
+        self.fragments = np.empty(capacity, dtype=np.int64)  # fragment serial, -1 = labelled
+        self.passed = np.empty(capacity, dtype=bool)
+        self._slots = None  # tag → slot, built on first lookup
+        self.labels = {}   # tag → fragment_id for single-tag inserts
+    
+    def __len__(self):
+        return self.size
+    
+    def __contains__(self, tag):
+        return _tag_int(tag) in self.slots
+    
+    @property
+    def slots(self) -> dict:
+        if self._slots is None:
+            self._slots = dict(zip(self.tags[:self.size].tolist(), range(self.size)))
+        return self._slots
+    
+    def _reserve(self, extra: int):
+        needed = self.size + extra
+        capacity = len(self.tags)
+        if needed <= capacity:
+            return
+        capacity = max(capacity, 1)
+        while capacity < needed:
+            capacity *= 2
+        for name in ("tags", "purity", "fragments", "passed"):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+    
+    def add(self, tag, purity: float, fragment_id: str = None) -> int:
+        value = _tag_int(tag)
+        if not 0 <= value <= _TAG_MAX:
+            raise ValueError(f"RF tag must be a 64-bit hex string or unsigned int, got {tag!r}")
+        tag = value
+        self._reserve(1)
+        slot = self.size
+        self.tags[slot] = tag
+        self.purity[slot] = purity
+        self.fragments[slot] = -1
+        self.passed[slot] = purity >= self.purity_threshold
+        if self._slots is not None:
+            self._slots[tag] = slot
+        if fragment_id is not None:
+            self.labels[tag] = fragment_id
+        self.size += 1
+        return slot
+    
+    def add_many(self, tags: np.ndarray, purities: np.ndarray, first_fragment: int = 0):
+        """Bulk insert — one column copy per field, fragment serials numbered from first_fragment"""
+        n = len(tags)
+        self._reserve(n)
+        start, end = self.size, self.size + n
+        self.tags[start:end] = tags
+        self.purity[start:end] = purities
+        self.fragments[start:end] = np.arange(first_fragment, first_fragment + n)
+        self.passed[start:end] = purities >= self.purity_threshold
+        if self._slots is not None:
+            self._slots.update(zip(tags.tolist(), range(start, end)))
+        self.size = end
+    
+    def passes(self, tag) -> bool:
+        slot = self.slots.get(_tag_int(tag))
+        if slot is None:
+            return False
+        return bool(self.passed[slot])
+    
+    def fragment_id(self, tag) -> str:
+        tag = _tag_int(tag)
+        if tag in self.labels:
+            return self.labels[tag]
+        return f"frag_{self.fragments[self.slots[tag]]}"
+    
+    def remove(self, tag):
+        """Swap-remove — the last slot moves into the hole"""
+        tag = _tag_int(tag)
+        slot = self.slots.pop(tag)
+        self.labels.pop(tag, None)
+        last = self.size - 1
+        if slot != last:
+            for column in (self.tags, self.purity, self.fragments, self.passed):
+                column[slot] = column[last]
+            self.slots[int(self.tags[slot])] = slot
+        self.size = last
+    
+    def pop_random(self, count: int, rng: np.random.Generator) -> np.ndarray:
+        """Draw count distinct tags uniformly, remove them, return their pass/fail mask"""
+        count = min(count, self.size)
+        chosen = rng.choice(self.size, size=count, replace=False)
+        passed = self.passed[chosen].copy()
+        if self._slots is not None and 2 * count > self.size:
+            self._slots = None  # cheaper to rebuild on next lookup than to delete most keys
+        if self._slots is not None or self.labels:
+            for tag in self.tags[chosen].tolist():
+                if self._slots is not None:
+                    del self._slots[tag]
+                self.labels.pop(tag, None)
+        
+        # Fill holes below the new end with survivors from the tail
+        end = self.size - count
+        holes = chosen[chosen < end]
+        tail_alive = np.ones(count, dtype=bool)
+        tail_alive[chosen[chosen >= end] - end] = False
+        movers = end + np.flatnonzero(tail_alive)
+        for column in (self.tags, self.purity, self.fragments, self.passed):
+            column[holes] = column[movers]
+        if self._slots is not None:
+            self._slots.update(zip(self.tags[holes].tolist(), holes.tolist()))
+        self.size = end
+        return passed
+    
+    def to_bytes(self) -> bytes:
+        """Threshold, size and labels up front, then the live tag / purity / fragment columns"""
+        n = self.size
+        labels = json.dumps(sorted(self.labels.items())).encode()
+        return (_PACKED.pack(self.purity_threshold, n, len(labels)) + labels
+                + self.tags[:n].astype("<u8").tobytes()
+                + self.purity[:n].astype("<f8").tobytes()
+                + self.fragments[:n].astype("<i8").tobytes())
+    
+    @classmethod
+    def from_bytes(cls, data) -> "TagStore":
+        threshold, n, labels_len = _PACKED.unpack_from(data, 0)
+        pos = _PACKED.size
+        store = cls(threshold, capacity=max(n, 1))
+        store.labels = {tag: fragment_id for tag, fragment_id in json.loads(bytes(data[pos:pos + labels_len]))}
+        pos += labels_len
+        for name, dtype in (("tags", "<u8"), ("purity", "<f8"), ("fragments", "<i8")):
+            getattr(store, name)[:n] = np.frombuffer(data, dtype, n, pos)
+            pos += 8 * n
+        store.passed[:n] = store.purity[:n] >= threshold  # derived — not stored
+        store.size = n
+        return store
+
+_TAG_MAX = (1 << 64) - 1
+_PACKED = struct.Struct("<dQI")  # purity threshold, size, labels JSON length
+
+def _tag_int(tag) -> int:
+    if isinstance(tag, str):
+        try:
+            return int(tag, 16)
+        except ValueError:
+            return -1  # never a stored tag
+    return int(tag)
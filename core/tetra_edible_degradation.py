@@ -8,12 +8,15 @@ Tetra-edible laminate inner film degradation:
 - Zero residue — fully metabolized
 - Environmental fallback: soil microbes 72h
 - Grandma-safe — ISO 10993 biocompatible
+- Reports memoized per thickness + rates (shared kinetics cache)
 """
 
 import math
 import time
 
-class TetraEdibleDegradation:
+from core.kinetics_cache import CachedKinetics, cached_kinetics
+
+class TetraEdibleDegradation(CachedKinetics):
     def __init__(self, thickness_mm: float = 0.3):
         self.thickness = thickness_mm
         self.saliva_rate = 0.075   # mm/s dissolution in saliva
@@ -32,6 +35,7 @@ class TetraEdibleDegradation:
         days = self.thickness / self.microbial_rate
         return round(days, 1)  # ~72h = 3 days
     
+    @cached_kinetics
     def full_degradation_report(self) -> str:
         saliva = self.saliva_dissolve()
         gastric = self.gastric_dissolve()
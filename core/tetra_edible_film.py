@@ -8,8 +8,11 @@ Upgraded tetra-edible laminate:
 - Middle: nano-breath membrane — O2 block
 - Outer: mycelium-reinforced biopolymer — impact shield, compostable
 - Zero land use — ocean abundance
+- Layer stack evaluated as one degradation model (kinetics registry)
 """
 
+from core.kinetics_registry import default_registry
+
 class TetraEdibleFilm:
     def __init__(self):
         self.primary_material = "seaweed_algae"
@@ -18,12 +21,18 @@ class TetraEdibleFilm:
         self.dissolve_water = 1     # seconds instant
         self.edible = True
         self.compost_days = 30      # home compost
+        # Exposed face first — (registered material, thickness mm)
+        self.layers = [("mycelium_biopolymer", 0.5), ("tetra_edible", 0.3), ("seaweed_algae", self.thickness)]
     
     def dissolve(self, medium: str = "saliva"):
         if medium == "water":
             return f"Instant dissolve — mercy abundance released."
         return f"{self.dissolve_saliva}s complete — zero residue, joy restored."
     
+    def degradation_stack(self, mode: str = "series"):
+        """Whole laminate as one compiled model — time_to_degrade(medium, environments)"""
+        return default_registry().stack(self.layers, mode)
+    
     def status(self):
         return (f"Seaweed/Algae film active — edible, water-dissolvable, "
                 f"{self.compost_days} days home compost — ocean nurture eternal.")
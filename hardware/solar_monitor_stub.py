@@ -4,35 +4,54 @@ MercyOS Pinnacle Ultramasterpiece — Jan 17 2026
 
 Stub for Victron SmartSolar Bluetooth monitoring
 Integrates with shard status — reports power flow, battery health
+sample() feeds a TelemetryRing — history kept for aggregates and shard export
 """
 
 import time  # Placeholder — real impl uses ve.direct or Bluetooth
 
 class SolarMonitor:
-    def __init__(self):
+    def __init__(self, source=None):
+        self.source = source  # SolarSource — None keeps the placeholder reading
         self.panel_watts = 0
         self.battery_soc = 100  # %
         self.load_watts = 0
         self.trinity_interval = 42  # seconds
     
-    def read_status(self):
+    def poll(self):
+        if self.source is not None:
+            self.panel_watts, self.battery_soc, self.load_watts = self.source.read()
+            return
         # Placeholder — replace with actual Victron API
         self.panel_watts = 85   # simulated
         self.battery_soc = 98
         self.load_watts = 8
+    
+    def read_status(self):
+        self.poll()
         return {
             "panel": self.panel_watts,
             "battery": self.battery_soc,
             "load": self.load_watts
         }
     
+    def sample(self, ring, t: float = None) -> bool:
+        """Poll straight into a TelemetryRing — no status dict per reading"""
+        self.poll()
+        return ring.append(time.time() if t is None else t, self.panel_watts, self.battery_soc, self.load_watts)
+    
     def report(self):
         status = self.read_status()
-        return f"Solar flow: {status['panel']}W in → {status['battery']}% SOC → {status['load']}W MercyOS load."
+        return f"Solar flow: {status['panel']:.0f}W in → {status['battery']:.0f}% SOC → {status['load']:.0f}W MercyOS load."
 
-# Shard integration loop
+# Shard integration loop — 1 Hz history, report every trinity interval
 if __name__ == "__main__":
+    from hardware.telemetry_ring import TelemetryRing
+    
     monitor = SolarMonitor()
+    ring = TelemetryRing()
     while True:
+        for _ in range(monitor.trinity_interval):
+            monitor.sample(ring)
+            time.sleep(1)
         print(monitor.report())
-        time.sleep(monitor.trinity_interval)
+        print(ring.status())
@@ -0,0 +1,235 @@
+"""
+SolarSources-Pinnacle — Pluggable Charge Controller Sources + Async Poller
+MercyOS Pinnacle Ultramasterpiece — Jan 19 2026
+
+Several charge controllers per node, none of them blocking the lattice:
+- SolarSource — one controller; read() → (panel W, SOC %, load W)
+- SimulatedSource — seeded sun curve + link latency, stands in for VE.Direct / Bluetooth
+- ReplaySource — recorded field logs (CSV) played back as a device, paced by the recorded t column
+- AsyncSolarPoller — every device read concurrently each tick, per-device timeout,
+  ticks on absolute deadlines (no drift), one TelemetryRing per device
+- Blocking reads on the poller's own thread pool, one thread per device — a hung serial port
+  never starves the event loop's default executor, and never gets a second read stacked on it
+"""
+
+import abc
+import asyncio
+import bisect
+import csv
+import functools
+import math
+import random
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from hardware.telemetry_ring import TelemetryRing
+
+class SolarSource(abc.ABC):
+    """One charge controller — real readers implement read(), and override aread() when natively async"""
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    @abc.abstractmethod
+    def read(self) -> tuple:
+        """(panel W, battery SOC %, load W)"""
+    
+    async def aread(self, executor=None) -> tuple:
+        # Blocking serial / BLE reads run off the event loop — on the poller's pool when given one
+        return await asyncio.get_running_loop().run_in_executor(executor, self.read)
+    
+    def close(self):
+        pass
+
+class SimulatedSource(SolarSource):
+    def __init__(self, name: str = "sim-0", peak_w: float = 100.0, load_w: float = 8.0,
+                 capacity_wh: float = 640.0, latency_s: float = 0.0, jitter_s: float = 0.0,
+                 seed: int = 0, clock=time.time, blocking: bool = False):
+        super().__init__(name)
+        self.peak_w = peak_w            # clear-sky noon output
+        self.load_w = load_w            # MercyOS node draw
+        self.capacity_wh = capacity_wh  # 50 Ah × 12.8 V LiFePO4
+        self.latency_s = latency_s      # simulated link round trip
+        self.jitter_s = jitter_s
+        self.blocking = blocking        # sleep the latency on a pool thread, like a serial driver
+        self.rng = random.Random(seed)
+        self.clock = clock
+        self.soc = 98.0
+        self._last = None
+    
+    def _reading(self) -> tuple:
+        now = self.clock()
+        sun = max(0.0, math.sin((now % 86400) / 86400 * 2 * math.pi - math.pi / 2))
+        panel = max(0.0, self.peak_w * sun * self.rng.uniform(0.85, 1.0))
+        load = self.load_w * self.rng.uniform(0.9, 1.1)
+        if self._last is not None:
+            hours = min(now - self._last, 3600.0) / 3600
+            self.soc = min(100.0, max(0.0, self.soc + (panel - load) * hours / self.capacity_wh * 100))
+        self._last = now
+        return panel, self.soc, load
+    
+    def _delay(self) -> float:
+        return max(0.0, self.latency_s + self.rng.uniform(-self.jitter_s, self.jitter_s))
+    
+    def read(self) -> tuple:
+        time.sleep(self._delay())
+        return self._reading()
+    
+    async def aread(self, executor=None) -> tuple:
+        if self.blocking:
+            return await super().aread(executor)
+        await asyncio.sleep(self._delay())
+        return self._reading()
+
+class ReplaySource(SolarSource):
+    """CSV with t, panel, soc, load columns — a recorded controller replayed on its own timeline.
+    
+    Each read returns the row recorded at (elapsed since the first read) × speed past the first t,
+    so a 10 s log polled at 1 Hz repeats each reading ten times. speed=0 steps one row per read.
+    """
+    
+    def __init__(self, path: str, name: str = None, loop: bool = True, speed: float = 1.0, clock=time.monotonic):
+        super().__init__(name or path)
+        self.path = path
+        self.loop = loop    # restart at the top instead of raising EOFError
+        self.speed = speed  # recorded seconds per clock second
+        self.clock = clock
+        with open(path, newline="") as f:
+            records = [(float(r["t"]), float(r["panel"]), float(r["soc"]), float(r["load"])) for r in csv.DictReader(f)]
+        if not records:
+            raise ValueError(f"No readings in {path}")
+        self.times = [record[0] for record in records]
+        if any(b < a for a, b in zip(self.times, self.times[1:])):
+            raise ValueError(f"Timestamps in {path} go backwards — can't pace the replay")
+        self.rows = [record[1:] for record in records]
+        self.position = 0
+        self._started = None
+    
+    def read(self) -> tuple:
+        if not self.speed:
+            return self._step()
+        now = self.clock()
+        if self._started is None:
+            self._started = now
+        target = self.times[0] + (now - self._started) * self.speed
+        if target > self.times[-1]:
+            if not self.loop:
+                raise EOFError(f"Replay of {self.path} finished")
+            self._started, target = now, self.times[0]
+        self.position = bisect.bisect_right(self.times, target) - 1
+        return self.rows[self.position]
+    
+    def _step(self) -> tuple:
+        if self.position >= len(self.rows):
+            if not self.loop:
+                raise EOFError(f"Replay of {self.path} finished")
+            self.position = 0
+        row = self.rows[self.position]
+        self.position += 1
+        return row
+    
+    async def aread(self, executor=None) -> tuple:
+        return self.read()  # in memory — no thread hop
+    
+    @staticmethod
+    def record(path: str, readings):
+        """Write (t, panel, soc, load) rows — TelemetryRing.window() output or a live capture"""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("t", "panel", "soc", "load"))
+            writer.writerows(readings)
+
+class AsyncSolarPoller:
+    def __init__(self, sources, interval_s: float = 1.0, timeout_s: float = 0.5, ring_capacity: int = 7 * 86400):
+        self.sources = list(sources)
+        # One read in flight per device, so one thread each is enough — threads start on first use
+        self.executor = ThreadPoolExecutor(max(1, len(self.sources)), thread_name_prefix="solar-read")
+        self.interval_s = interval_s
+        self.timeout_s = timeout_s      # per device — a slow controller never delays the others
+        self.rings = {s.name: TelemetryRing(ring_capacity) for s in self.sources}
+        self.timeouts = {s.name: 0 for s in self.sources}
+        self.errors = {s.name: 0 for s in self.sources}
+        self.ticks = 0
+        self.missed_ticks = 0           # deadlines skipped after an overrun
+        self.cycle_latency = deque(maxlen=10_000)  # seconds, tick deadline → every device answered
+        self.tick_lag = deque(maxlen=10_000)       # seconds, tick deadline → poller awake
+        self._busy = set()              # devices whose last read hasn't returned
+        self._task = None
+    
+    def start(self):
+        self._task = asyncio.create_task(self.run())
+        return self._task
+    
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+    
+    def close(self):
+        """Release the read threads and the devices — reads still stuck in a driver are abandoned"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        for source in self.sources:
+            source.close()
+    
+    async def run(self, cycles: int = None):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        tick = 0
+        while cycles is None or tick < cycles:
+            deadline = start + tick * self.interval_s
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.tick_lag.append(loop.time() - deadline)
+            await self.poll_once(time.time())
+            self.cycle_latency.append(loop.time() - deadline)
+            self.ticks += 1
+            # Next deadline on the fixed grid — overruns skip ticks rather than drift
+            next_tick = max(tick + 1, math.ceil((loop.time() - start) / self.interval_s))
+            self.missed_ticks += next_tick - tick - 1
+            tick = next_tick
+    
+    async def poll_once(self, t: float = None) -> dict:
+        """One concurrent read of every device — {name: (panel, soc, load) or None}"""
+        t = time.time() if t is None else t
+        readings = await asyncio.gather(*(self._read(source) for source in self.sources))
+        result = {}
+        for source, reading in zip(self.sources, readings):
+            result[source.name] = reading
+            if reading is not None:
+                self.rings[source.name].append(t, *reading)
+        return result
+    
+    async def _read(self, source: SolarSource):
+        if source.name in self._busy:
+            self.timeouts[source.name] += 1  # still answering an earlier tick — don't stack another read
+            return None
+        self._busy.add(source.name)
+        task = asyncio.ensure_future(source.aread(self.executor))
+        task.add_done_callback(functools.partial(self._settled, source.name))
+        try:
+            # Shielded — a thread can't be cancelled, so the device stays busy until its read returns
+            return await asyncio.wait_for(asyncio.shield(task), self.timeout_s)
+        except asyncio.TimeoutError:
+            self.timeouts[source.name] += 1
+        except Exception:
+            self.errors[source.name] += 1
+        return None
+    
+    def _settled(self, name: str, task):
+        self._busy.discard(name)
+        if not task.cancelled():
+            task.exception()  # a late failure after a timeout is retrieved here, not logged as lost
+    
+    def totals(self) -> dict:
+        """Latest reading summed across devices — the node's combined power flow"""
+        latest = [ring.latest() for ring in self.rings.values() if len(ring)]
+        return {"panel": sum(r["panel"] for r in latest), "load": sum(r["load"] for r in latest),
+                "soc": sum(r["soc"] for r in latest) / len(latest) if latest else 0.0}
+    
+    def status(self) -> str:
+        lat = sorted(self.cycle_latency)
+        p50 = lat[len(lat) // 2] * 1000 if lat else 0.0
+        return (f"Solar poller: {len(self.sources)} controllers, {self.ticks} ticks, p50 cycle {p50:.1f} ms, "
+                f"{sum(self.timeouts.values())} timeouts, {self.missed_ticks} missed — sun flows.")
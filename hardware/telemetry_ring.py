@@ -0,0 +1,208 @@
+"""
+TelemetryRing-Pinnacle — Fixed-Size Solar Telemetry History
+MercyOS Pinnacle Ultramasterpiece — Jan 19 2026
+
+Keeps what SolarMonitor sees instead of printing it and forgetting:
+- Preallocated NumPy columns — time, panel W, SOC, load W — 9 bytes per sample
+  (one week of 1 Hz history ≈ 5.4 MB)
+- O(1) append into the ring, no allocation per sample
+- Rolling aggregates over any window — min / max / mean, energy in and out (Wh)
+- Bucketed downsampling for export to the shard
+"""
+
+import math
+
+import numpy as np
+
+WATT_SCALE = 10      # stored as deciwatts, 0 .. 6553.5 W
+SOC_SCALE = 2        # stored as half-percent, 0 .. 100 %
+TIME_SCALE = 10      # stored as deciseconds since the ring epoch, ~13 years of range
+MAX_WATTS = 65535 / WATT_SCALE
+MAX_TICKS = 0xFFFFFFFF  # uint32 deciseconds past the epoch
+
+COLUMNS = ("panel", "soc", "load")
+
+class TelemetryRing:
+    def __init__(self, capacity: int = 7 * 86400, epoch: float = None, max_gap_s: float = 126.0):
+        self.capacity = capacity
+        self.epoch = epoch          # first sample time unless given
+        self.max_gap_s = max_gap_s  # longer silences integrate as zero energy, not a straight line
+        self.t = np.zeros(capacity, dtype=np.uint32)
+        self.panel = np.zeros(capacity, dtype=np.uint16)
+        self.load = np.zeros(capacity, dtype=np.uint16)
+        self.soc = np.zeros(capacity, dtype=np.uint8)
+        self.head = 0               # next write slot
+        self.count = 0
+        self.dropped = 0            # out-of-order, out-of-range or NaN samples refused
+    
+    def __len__(self):
+        return self.count
+    
+    @property
+    def nbytes(self) -> int:
+        return self.t.nbytes + self.panel.nbytes + self.load.nbytes + self.soc.nbytes
+    
+    def append(self, t: float, panel_watts: float, soc: float, load_watts: float) -> bool:
+        """One sample into the ring — overwrites the oldest once full.
+        
+        A live feed never raises: NaN or infinite readings, samples before the epoch, past the
+        ring's time range or older than the newest are counted in dropped and return False.
+        """
+        if not all(math.isfinite(v) for v in (t, panel_watts, soc, load_watts)):
+            self.dropped += 1
+            return False
+        epoch = t if self.epoch is None else self.epoch
+        ticks = int((t - epoch) * TIME_SCALE)
+        i = self.head
+        if t < epoch or ticks > MAX_TICKS or (self.count and ticks < int(self.t[i - 1])):
+            self.dropped += 1
+            return False
+        self.epoch = epoch
+        self.t[i] = ticks
+        self.panel[i] = min(max(int(panel_watts * WATT_SCALE + 0.5), 0), 65535)
+        self.load[i] = min(max(int(load_watts * WATT_SCALE + 0.5), 0), 65535)
+        self.soc[i] = min(max(int(soc * SOC_SCALE + 0.5), 0), 100 * SOC_SCALE)
+        self.head = i + 1 if i + 1 < self.capacity else 0
+        if self.count < self.capacity:
+            self.count += 1
+        return True
+    
+    def extend(self, t, panel_watts, soc, load_watts) -> int:
+        """Bulk append — replayed logs, tests; returns samples written.
+        
+        Timestamps must be strictly increasing, no earlier than the epoch or the newest sample,
+        and watts within the stored range — a bad log raises ValueError before anything is written.
+        """
+        t = np.asarray(t, dtype=np.float64)
+        n = len(t)
+        if not n:
+            return 0
+        panel_watts, load_watts = np.asarray(panel_watts, dtype=np.float64), np.asarray(load_watts, dtype=np.float64)
+        epoch = float(t[0]) if self.epoch is None else self.epoch
+        if not t[0] >= epoch:
+            raise ValueError(f"Sample at t={t[0]} precedes the ring epoch {epoch}")
+        if n > 1 and not np.all(np.diff(t) > 0):
+            raise ValueError("Telemetry timestamps must be strictly increasing")
+        if self.count and (t[0] - epoch) * TIME_SCALE < int(self.t[self.head - 1]):
+            raise ValueError(f"Sample at t={t[0]} is older than the newest sample in the ring")
+        if (t[-1] - epoch) * TIME_SCALE > MAX_TICKS:
+            raise ValueError(f"Sample at t={t[-1]} is past the ring's time range — start a new epoch")
+        for name, watts in (("panel", panel_watts), ("load", load_watts)):
+            if not np.all(watts <= MAX_WATTS):
+                raise ValueError(f"{name} watts must be numbers at most {MAX_WATTS} W to fit the ring")
+        self.epoch = epoch
+        if n > self.capacity:
+            t, panel_watts, soc, load_watts = (np.asarray(c)[-self.capacity:] for c in (t, panel_watts, soc, load_watts))
+            n = self.capacity
+        slots = (self.head + np.arange(n)) % self.capacity
+        self.t[slots] = ((t - self.epoch) * TIME_SCALE).astype(np.uint32)
+        self.panel[slots] = np.clip(np.rint(panel_watts * WATT_SCALE), 0, 65535)  # negative noise → 0 W
+        self.load[slots] = np.clip(np.rint(load_watts * WATT_SCALE), 0, 65535)
+        self.soc[slots] = np.clip(np.rint(np.asarray(soc) * SOC_SCALE), 0, 100 * SOC_SCALE)
+        self.head = (self.head + n) % self.capacity
+        self.count = min(self.capacity, self.count + n)
+        return n
+    
+    def latest(self) -> dict:
+        if not self.count:
+            return {}
+        i = self.head - 1
+        return {"t": self.epoch + int(self.t[i]) / TIME_SCALE, "panel": int(self.panel[i]) / WATT_SCALE,
+                "soc": int(self.soc[i]) / SOC_SCALE, "load": int(self.load[i]) / WATT_SCALE}
+    
+    def _span(self, start: float = None, end: float = None) -> np.ndarray:
+        """Ring slots holding samples with start <= t <= end, oldest first"""
+        first = (self.head - self.count) % self.capacity
+        order = (first + np.arange(self.count)) % self.capacity if self.count < self.capacity or first else None
+        ticks = self.t[order] if order is not None else self.t
+        lo = 0 if start is None else int(np.searchsorted(ticks, (start - self.epoch) * TIME_SCALE, "left"))
+        hi = self.count if end is None else int(np.searchsorted(ticks, (end - self.epoch) * TIME_SCALE, "right"))
+        if order is not None:
+            return order[lo:hi]
+        return np.arange(lo, hi)
+    
+    def window(self, seconds: float = None, end: float = None):
+        """(t seconds, panel W, soc %, load W) arrays for the last `seconds` before end (default newest)"""
+        if not self.count:
+            empty = np.empty(0)
+            return empty, empty, empty, empty
+        if end is None:
+            end = self.epoch + int(self.t[self.head - 1]) / TIME_SCALE
+        slots = self._span(None if seconds is None else end - seconds, end)
+        t = self.epoch + self.t[slots] / TIME_SCALE
+        return (t, self.panel[slots] / WATT_SCALE, self.soc[slots] / SOC_SCALE, self.load[slots] / WATT_SCALE)
+    
+    def _energy_wh(self, t: np.ndarray, watts: np.ndarray) -> float:
+        if len(t) < 2:
+            return 0.0
+        dt = np.diff(t)
+        dt[dt > self.max_gap_s] = 0.0
+        return float(np.sum(dt * (watts[1:] + watts[:-1])) / 2 / 3600)
+    
+    def stats(self, seconds: float = None, end: float = None) -> dict:
+        """Rolling aggregates over the window — min/max/mean per column, energy in/out (Wh)"""
+        t, panel, soc, load = self.window(seconds, end)
+        result = {"samples": len(t), "span_s": float(t[-1] - t[0]) if len(t) else 0.0}
+        for name, column in zip(COLUMNS, (panel, soc, load)):
+            if len(column):
+                result[name] = {"min": float(column.min()), "max": float(column.max()), "mean": float(column.mean())}
+            else:
+                result[name] = {"min": 0.0, "max": 0.0, "mean": 0.0}
+        result["energy_in_wh"] = self._energy_wh(t, panel)
+        result["energy_out_wh"] = self._energy_wh(t, load)
+        return result
+    
+    def downsample(self, bucket_s: float = 60.0, seconds: float = None, end: float = None) -> dict:
+        """Per-bucket means (panel, load, soc), panel peak and energy in/out — arrays keyed by column"""
+        t, panel, soc, load = self.window(seconds, end)
+        if not len(t):
+            return {key: np.empty(0) for key in ("t", "panel", "panel_max", "soc", "load", "energy_in_wh", "energy_out_wh")}
+        bucket = np.floor((t - t[0]) / bucket_s).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        counts = np.diff(np.r_[starts, len(t)])
+        # Energy per sample interval, credited to the bucket where the interval starts
+        dt = np.diff(t, append=t[-1])
+        dt[dt > self.max_gap_s] = 0.0
+        next_panel = np.r_[panel[1:], panel[-1]]
+        next_load = np.r_[load[1:], load[-1]]
+        return {
+            "t": t[0] + bucket[starts] * bucket_s,
+            "panel": np.add.reduceat(panel, starts) / counts,
+            "panel_max": np.maximum.reduceat(panel, starts),
+            "soc": np.add.reduceat(soc, starts) / counts,
+            "load": np.add.reduceat(load, starts) / counts,
+            "energy_in_wh": np.add.reduceat(dt * (panel + next_panel) / 2, starts) / 3600,
+            "energy_out_wh": np.add.reduceat(dt * (load + next_load) / 2, starts) / 3600,
+        }
+    
+    def export(self, bucket_s: float = 333.0, seconds: float = None) -> dict:
+        """Downsampled history as plain lists — ready to set on the shard for Starlink sync"""
+        series = self.downsample(bucket_s, seconds)
+        return {"bucket_s": bucket_s,
+                **{key: np.round(values, 2).tolist() for key, values in series.items()}}
+    
+    def status(self) -> str:
+        s = self.stats(3600)
+        return (f"Telemetry: {self.count}/{self.capacity} samples ({self.nbytes / 1e6:.1f} MB), "
+                f"last hour {s['energy_in_wh']:.1f} Wh in / {s['energy_out_wh']:.1f} Wh out, "
+                f"SOC {s['soc']['min']:.0f}–{s['soc']['max']:.0f}%.")
+
+# Integration test
+if __name__ == "__main__":
+    import time
+    
+    ring = TelemetryRing(capacity=14 * 86400)
+    start = time.time() - 14 * 86400
+    t = start + np.arange(14 * 86400, dtype=np.float64)
+    sun = np.clip(np.sin((t % 86400) / 86400 * 2 * np.pi - np.pi / 2), 0, None)
+    t0 = time.perf_counter()
+    ring.extend(t, 100 * sun, 60 + 38 * sun, np.full(len(t), 8.0))
+    print(f"Two weeks of 1 Hz history in {ring.nbytes / 1e6:.1f} MB, loaded in {(time.perf_counter() - t0) * 1000:.0f} ms")
+    t0 = time.perf_counter()
+    for i in range(33_000):
+        ring.append(t[-1] + 1 + i, 85.0, 98.0, 8.0)
+    print(f"append: {(time.perf_counter() - t0) / 33_000 * 1e6:.2f} µs/sample")
+    print(ring.status())
+    day = ring.stats(86400)
+    print(f"Last day: {day['energy_in_wh']:.0f} Wh harvested, {day['energy_out_wh']:.0f} Wh used")
+    print(f"Export at 333 s buckets: {len(ring.export()['t'])} points")
@@ -0,0 +1,184 @@
+"""
+BurstScheduler-Pinnacle — Event-Driven Starlink Burst Scheduler
+MercyOS Pinnacle Ultramasterpiece — Jan 19 2026
+
+Non-blocking sync alongside the logistics loop:
+- SkyLink — link-up / link-down as asyncio events, no wall-clock polling
+- Offline changes coalesce in the shard dirty set — one re-index per window, not per change
+- Flush in priority order within the link window, paced to a bandwidth budget
+- Metrics: window usage, bytes on wire, sync lag (first unsynced change → replica in sync)
+"""
+
+import asyncio
+import math
+import time
+from shards.delta_sync import FRAME_REJECTED
+
+class SkyLink:
+    """Link state as events — real impl flips these from Starlink heartbeat callbacks"""
+    
+    def __init__(self):
+        self.online = False
+        self.window_ends = 0.0  # monotonic seconds
+        self._up = asyncio.Event()
+        self._down = asyncio.Event()
+        self._down.set()
+    
+    def link_up(self, window_s: float = math.inf):
+        self.online = True
+        self.window_ends = time.monotonic() + window_s
+        self._down.clear()
+        self._up.set()
+    
+    def link_down(self):
+        self.online = False
+        self._up.clear()
+        self._down.set()
+    
+    def window_remaining(self) -> float:
+        return max(0.0, self.window_ends - time.monotonic()) if self.online else 0.0
+    
+    async def wait_up(self):
+        await self._up.wait()
+    
+    async def wait_down(self):
+        await self._down.wait()
+
+class SimulatedSkyLink(SkyLink):
+    """Same intermittent pattern as StarlinkSync.is_online (30 s of every 120 s), as events"""
+    
+    def __init__(self, period_s: float = 120.0, window_s: float = 30.0):
+        super().__init__()
+        self.period_s = period_s
+        self.window_s = window_s
+    
+    async def run(self):
+        while True:
+            phase = time.time() % self.period_s
+            if phase < self.window_s:
+                self.link_up(self.window_s - phase)
+                await asyncio.sleep(self.window_s - phase)
+                self.link_down()
+                await asyncio.sleep(self.period_s - self.window_s)
+            else:
+                self.link_down()
+                await asyncio.sleep(self.period_s - phase)
+
+class BurstScheduler:
+    def __init__(self, sync, link: SkyLink, bandwidth_bps: float = 62_500.0, slice_s: float = 3.0,
+                 priority=("tyranny_gate", "logistics")):
+        self.sync = sync                    # StarlinkSync — index, endpoint, shard
+        self.link = link
+        self.bandwidth_bps = bandwidth_bps  # bytes/s granted to sync inside a window
+        self.slice_s = slice_s              # budget granularity — one frame per slice
+        self.priority = priority            # attributes flushed first, rest alphabetical
+        self.windows = 0
+        self.window_capacity_bytes = 0.0
+        self.window_used_bytes = 0
+        self.frames = 0
+        self.bytes_on_wire = 0
+        self.pending_since = None           # monotonic time of the first unsynced change
+        self.last_lag_s = 0.0
+        self.max_lag_s = 0.0
+        self._changed = asyncio.Event()
+        self._task = None
+    
+    def notify(self):
+        """Producers call after changing shard state — marks lag start, wakes an idle window"""
+        if self.pending_since is None:
+            self.pending_since = time.monotonic()
+        self._changed.set()
+    
+    def start(self):
+        self._task = asyncio.create_task(self.run())
+        return self._task
+    
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+    
+    async def run(self):
+        while True:
+            await self.link.wait_up()
+            await self._flush_window()
+    
+    async def _reindex(self):
+        for _ in self.sync.reindex_steps():
+            await asyncio.sleep(0)  # one attribute per turn — logistics loop keeps running
+        index = self.sync.index
+        if (index.dirty or index.removed) and self.pending_since is None:
+            self.pending_since = time.monotonic()
+    
+    async def _flush_window(self):
+        self.windows += 1
+        if math.isfinite(self.link.window_remaining()):
+            self.window_capacity_bytes += self.bandwidth_bps * self.link.window_remaining()
+        index = self.sync.index
+        while self.link.online:
+            self._changed.clear()
+            await self._reindex()
+            budget = int(self.bandwidth_bps * min(self.slice_s, self.link.window_remaining()))
+            if budget <= 0:
+                break
+            frame = index.take_delta(max_bytes=budget, order=self.priority)
+            if frame is None:
+                self._settle_lag()
+                await _first(self._changed.wait(), self.link.wait_down(), timeout=self.sync.ping_interval)
+                continue
+            endpoint = self.sync.endpoint
+            remote_root = None
+            if endpoint is not None:
+                try:
+                    remote_root = await asyncio.to_thread(endpoint.push, frame)
+                except (ConnectionError, *FRAME_REJECTED):
+                    index.mark_all_dirty()  # frame lost or rejected — full resend next slice
+                    await asyncio.sleep(self.slice_s)
+                    continue
+                index.ack()
+            self.frames += 1
+            self.bytes_on_wire += len(frame)
+            self.window_used_bytes += len(frame)
+            if not index.dirty:
+                if remote_root is not None and remote_root != index.root():
+                    index.mark_all_dirty()  # replica diverged — full resend
+                else:
+                    self.sync.last_sync = time.time()
+                    self._settle_lag()
+            await asyncio.sleep(len(frame) / self.bandwidth_bps)  # wire time at the budgeted rate
+    
+    def _settle_lag(self):
+        if self.pending_since is not None and not self.sync.index.dirty:
+            self.last_lag_s = time.monotonic() - self.pending_since
+            self.max_lag_s = max(self.max_lag_s, self.last_lag_s)
+            self.pending_since = None
+    
+    def metrics(self) -> dict:
+        lag = time.monotonic() - self.pending_since if self.pending_since is not None else 0.0
+        return {
+            "windows": self.windows,
+            "window_capacity_bytes": self.window_capacity_bytes,
+            "window_used_bytes": self.window_used_bytes,
+            "window_usage": self.window_used_bytes / self.window_capacity_bytes if self.window_capacity_bytes else 0.0,
+            "frames": self.frames,
+            "bytes_on_wire": self.bytes_on_wire,
+            "pending_bytes": self.sync.index.pending_bytes(),
+            "sync_lag_s": lag,
+            "last_lag_s": self.last_lag_s,
+            "max_lag_s": self.max_lag_s,
+        }
+    
+    def status(self) -> str:
+        m = self.metrics()
+        link = "sky open" if self.link.online else "sky silent"
+        return (f"Burst scheduler ({link}): {m['frames']} frames, {m['bytes_on_wire']} B sent, "
+                f"window use {m['window_usage']:.0%}, lag {m['sync_lag_s']:.1f}s — mercy intact.")
+
+async def _first(*aws, timeout: float = None):
+    """Wait for whichever awaitable finishes first, cancel the rest"""
+    tasks = [asyncio.ensure_future(a) for a in aws]
+    try:
+        await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
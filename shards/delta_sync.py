@@ -0,0 +1,264 @@
+"""
+DeltaSync-Pinnacle — Chunked Content-Hash Index for Starlink Burst Sync
+MercyOS Pinnacle Ultramasterpiece — Jan 19 2026
+
+Real delta sync over metered sky links:
+- Shard state split per attribute into content-defined chunks (rolling gear sum, NumPy)
+  — an insert moves one chunk boundary, not every fixed block after it
+- blake2b digest per chunk, two-level Merkle root: chunk digests → attribute node → shard root
+- Dirty chunk set kept incrementally — only changed attributes re-hashed, only chunks the
+  remote has never seen are shipped, zlib-compressed on the wire
+- Byte budgets honoured per frame — big attributes stream across several bursts
+- LoopbackEndpoint — in-process stand-in for the remote lattice
+"""
+
+import hashlib
+import json
+import struct
+import zlib
+
+import numpy as np
+
+DELTA_MAGIC = b"MSD2"
+OP_CHUNKS = 1     # new chunk bodies for a key
+OP_MANIFEST = 2   # complete digest list — replica assembles the attribute
+OP_REMOVE = 3
+FRAME_REJECTED = (KeyError, ValueError, struct.error, zlib.error)  # apply_delta — replica missing a chunk or frame garbled
+
+DIGEST_SIZE = 16
+WINDOW = 48       # rolling window, bytes
+
+# Fixed gear table — same boundaries on every node and every boot
+_GEAR = np.frombuffer(b"".join(hashlib.blake2b(bytes([i]), digest_size=8).digest() for i in range(256)),
+                      dtype=np.uint64)
+
+def chunk_digest(data) -> bytes:
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest()
+
+def chunk_boundaries(blob, average: int = 4096) -> list:
+    """Content-defined cut points (end offsets) — average size ≈ average, within [average/4, average*4]"""
+    n = len(blob)
+    if n == 0:
+        return []
+    low, high = average // 4, average * 4
+    if n <= low:
+        return [n]
+    data = np.frombuffer(blob, dtype=np.uint8)
+    rolling = np.cumsum(_GEAR[data])  # wraps mod 2^64, windowed difference stays exact
+    rolling[WINDOW:] -= rolling[:-WINDOW].copy()
+    mask = np.uint64(average - 1)  # average is a power of two
+    candidates = np.flatnonzero(((rolling >> np.uint64(16)) & mask) == 0) + 1
+    cuts, start = [], 0
+    for cut in candidates.tolist():
+        if cut - start < low:
+            continue
+        while cut - start > high:
+            start += high
+            cuts.append(start)
+        cuts.append(cut)
+        start = cut
+    while n - start > high:
+        start += high
+        cuts.append(start)
+    if start < n:
+        cuts.append(n)
+    return cuts
+
+def encode_value(value) -> bytes:
+    """Persisted form of one shard attribute — bytes-like kept raw, everything else canonical JSON"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    return json.dumps(value, sort_keys=True, default=repr).encode()
+
+def persisted_state(shard) -> dict:
+    return {name: value for name, value in vars(shard).items() if not name.startswith("_")}
+
+class ChunkIndex:
+    def __init__(self, chunk_size: int = 4096):
+        if chunk_size & (chunk_size - 1):
+            raise ValueError("chunk_size must be a power of two")
+        self.chunk_size = chunk_size  # average content-defined chunk
+        self.blobs = {}       # key → bytes
+        self.manifests = {}   # key → [chunk digest]
+        self.spans = {}       # key → {digest: (start, end)}
+        self.key_roots = {}   # key → attribute node hash
+        self.remote = {}      # key → digests the remote holds (last manifest + chunks sent since)
+        self.dirty = set()    # keys whose manifest the remote has not seen
+        self.removed = set()
+        self.unacked = set()  # removals framed but not yet confirmed by a successful push
+        self.pool = {}        # replica side — key → {digest: bytes} received ahead of a manifest
+        self._root = None
+    
+    def __len__(self):
+        return len(self.blobs)
+    
+    def update(self, key: str, blob: bytes) -> int:
+        """Re-index one attribute — returns how many chunks the remote is missing"""
+        if self.blobs.get(key) == blob:
+            return 0
+        blob = bytes(blob)
+        view = memoryview(blob)
+        ends = chunk_boundaries(blob, self.chunk_size)
+        manifest = [chunk_digest(view[start:end]) for start, end in zip([0] + ends, ends)]
+        self._install(key, manifest, blob, ends)
+        self.dirty.add(key)
+        self.removed.discard(key)
+        self.unacked.discard(key)
+        return len(self.dirty_chunks(key))
+    
+    def remove(self, key: str):
+        if key in self.blobs:
+            for table in (self.blobs, self.manifests, self.spans, self.key_roots):
+                del table[key]
+            self.dirty.discard(key)
+            self.removed.add(key)
+            self._root = None
+    
+    def dirty_chunks(self, key: str) -> set:
+        held = self.remote.get(key, ())
+        return {d for d in self.manifests[key] if d not in held}
+    
+    def mark_all_dirty(self):
+        """Full resend on next delta — after a root mismatch or a lost frame; unconfirmed removals go again"""
+        self.remote.clear()
+        self.dirty = set(self.blobs)
+        self.removed |= self.unacked
+        self.unacked.clear()
+    
+    def ack(self):
+        """The last frame reached the remote — its removals are applied there"""
+        self.unacked.clear()
+    
+    def root(self) -> str:
+        if self._root is None:
+            top = hashlib.blake2b(digest_size=32)
+            for key in sorted(self.key_roots):
+                top.update(self.key_roots[key])
+            self._root = top.hexdigest()
+        return self._root
+    
+    def pending_bytes(self, key: str = None) -> int:
+        keys = [key] if key is not None else self.dirty
+        total = 0
+        for k in keys:
+            spans = self.spans[k]
+            total += sum(spans[d][1] - spans[d][0] for d in self.dirty_chunks(k))
+        return total
+    
+    def take_delta(self, max_bytes: int = None, order=None):
+        """Encode pending chunks + manifests into one compressed frame — None when clean.
+        
+        order: key priority (remaining keys follow); max_bytes: raw chunk budget, the rest waits.
+        """
+        if not self.dirty and not self.removed:
+            return None
+        body = bytearray()
+        for key in self.removed:
+            raw = key.encode()
+            body += struct.pack("<BH", OP_REMOVE, len(raw)) + raw
+            self.remote.pop(key, None)
+        self.unacked |= self.removed
+        self.removed.clear()
+        keys = [k for k in (order or ()) if k in self.dirty]
+        keys += sorted(self.dirty.difference(keys))
+        budget = max_bytes
+        shipped = False   # one chunk always fits — a budget below the max chunk still makes progress
+        for key in keys:
+            blob, spans = self.blobs[key], self.spans[key]
+            held = self.remote.setdefault(key, set())
+            missing = [d for d in dict.fromkeys(self.manifests[key]) if d not in held]
+            sent = []
+            for digest in missing:
+                start, end = spans[digest]
+                if budget is not None and end - start > budget and shipped:
+                    break
+                sent.append(digest)
+                shipped = True
+                if budget is not None:
+                    budget = max(0, budget - (end - start))
+            raw = key.encode()
+            if sent:
+                body += struct.pack("<BHI", OP_CHUNKS, len(raw), len(sent)) + raw
+                for digest in sent:
+                    start, end = spans[digest]
+                    body += digest + struct.pack("<I", end - start) + blob[start:end]
+                held.update(sent)
+            if len(sent) < len(missing):
+                break  # budget spent — lower-priority keys wait for the next window
+            manifest = self.manifests[key]
+            body += struct.pack("<BHI", OP_MANIFEST, len(raw), len(manifest)) + raw + b"".join(manifest)
+            self.remote[key] = set(manifest)
+            self.dirty.discard(key)
+        if not body:
+            return None
+        return DELTA_MAGIC + zlib.compress(bytes(body), 6)
+    
+    def apply_delta(self, frame: bytes) -> str:
+        """Replica side — cache chunk bodies, assemble attributes on manifest, return the new root"""
+        if frame[:4] != DELTA_MAGIC:
+            raise ValueError("Not a MercyOS delta frame")
+        body = memoryview(zlib.decompress(frame[4:]))
+        pos = 0
+        while pos < len(body):
+            op = body[pos]
+            if op == OP_REMOVE:
+                (klen,) = struct.unpack_from("<H", body, pos + 1)
+                pos += 3
+                key = bytes(body[pos:pos + klen]).decode()
+                pos += klen
+                self.remove(key)
+                self.removed.discard(key)
+                self.pool.pop(key, None)
+                continue
+            _, klen, count = struct.unpack_from("<BHI", body, pos)
+            pos += 7
+            key = bytes(body[pos:pos + klen]).decode()
+            pos += klen
+            if op == OP_CHUNKS:
+                chunks = self.pool.setdefault(key, {})
+                for _ in range(count):
+                    digest = bytes(body[pos:pos + DIGEST_SIZE])
+                    (length,) = struct.unpack_from("<I", body, pos + DIGEST_SIZE)
+                    pos += DIGEST_SIZE + 4
+                    chunks[digest] = bytes(body[pos:pos + length])
+                    pos += length
+                continue
+            manifest = [bytes(body[pos + i * DIGEST_SIZE:pos + (i + 1) * DIGEST_SIZE]) for i in range(count)]
+            pos += count * DIGEST_SIZE
+            fresh = self.pool.pop(key, {})
+            old_blob, old_spans = self.blobs.get(key, b""), self.spans.get(key, {})
+            parts, ends, offset = [], [], 0
+            for digest in manifest:
+                if digest in fresh:
+                    part = fresh[digest]
+                else:
+                    start, end = old_spans[digest]
+                    part = old_blob[start:end]
+                parts.append(part)
+                offset += len(part)
+                ends.append(offset)
+            self._install(key, manifest, b"".join(parts), ends)
+        return self.root()
+    
+    def _install(self, key: str, manifest: list, blob: bytes, ends: list):
+        self.blobs[key] = blob
+        self.manifests[key] = manifest
+        self.spans[key] = dict(zip(manifest, zip([0] + ends, ends)))
+        self.key_roots[key] = hashlib.blake2b(key.encode() + b"".join(manifest), digest_size=16).digest()
+        self._root = None
+
+class LoopbackEndpoint:
+    """In-process stand-in for the remote Starlink endpoint — holds a replica index"""
+    
+    def __init__(self, chunk_size: int = 4096):
+        self.replica = ChunkIndex(chunk_size)
+        self.bytes_received = 0
+        self.frames = 0
+    
+    def push(self, frame: bytes) -> str:
+        self.bytes_received += len(frame)
+        self.frames += 1
+        return self.replica.apply_delta(frame)
+    
+    def root(self) -> str:
+        return self.replica.root()
@@ -0,0 +1,201 @@
+"""
+LazyLoader-Pinnacle — Fast-Boot Lazy Imports + Precompiled Voice Pack Cache
+MercyOS Pinnacle Ultramasterpiece — Jan 19 2026
+
+Cold boot on low-power field nodes:
+- LazyModule — import deferred to first attribute access
+- PackCache — voice + mythic pack modules marshaled into one file, mmap'd on first speak()
+- Entries stamped with source mtime + size — stale ones fall back to a normal import, then rebuild
+- Import hook leaves sys.meta_path once every packed module is loaded; read-only caches fall back too
+"""
+
+import importlib
+import importlib.machinery
+import importlib.util
+import marshal
+import mmap
+import os
+import struct
+import sys
+import threading
+
+PACK_MAGIC = b"MPK1"
+PACK_MODULES = ("voices.skins.eternal_warmth", "voices.mythic_lattice_pack")
+DEFAULT_PACK_PATH = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+                                 "mercyos", "voice_packs.mpk")
+
+_HEADER = struct.Struct("<4s4sI")       # pack magic, interpreter bytecode magic, entry count
+_ENTRY = struct.Struct("<HH?qqQQ")      # name len, origin len, is_pkg, mtime_ns, size, offset, length
+
+class LazyModule:
+    """Module proxy — the real import happens on first attribute access"""
+    
+    __slots__ = ("_name", "_module")
+    
+    def __init__(self, name: str):
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_module", None)
+    
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+    
+    def resolve(self):
+        if self._module is None:
+            object.__setattr__(self, "_module", importlib.import_module(self._name))
+        return self._module
+    
+    def __getattr__(self, attr):
+        return getattr(self.resolve(), attr)
+    
+    def __repr__(self):
+        return f"<LazyModule {self._name} ({'loaded' if self.loaded else 'deferred'})>"
+
+class PackCache:
+    """Single-file marshaled code cache for the pack modules, served to imports from an mmap.
+    
+    Duck-typed meta path finder + loader — importlib.abc alone costs ~30 ms of boot.
+    """
+    
+    def __init__(self, path: str = DEFAULT_PACK_PATH, modules=PACK_MODULES):
+        self.path = path
+        self.modules = tuple(modules)
+        self.entries = None     # name → (origin, is_pkg, mtime_ns, size, offset, length)
+        self.hits = 0           # modules executed straight from the cache
+        self.misses = 0         # stale entries left to the normal import system
+        self._map = None
+        self._lock = threading.Lock()
+    
+    def build(self) -> int:
+        """Compile the pack sources into the cache file — returns how many modules were packed"""
+        records = []
+        sources = [(name, *_source_of(name)) for name in self.modules]
+        for name, origin, is_pkg in sources:
+            if origin is None:
+                continue  # pack not shipped on this node
+            with open(origin, "rb") as f:
+                source = f.read()
+            stat = os.stat(origin)
+            code = marshal.dumps(compile(source, origin, "exec", dont_inherit=True))
+            records.append((name.encode(), origin.encode(), is_pkg, stat.st_mtime_ns, stat.st_size, code))
+        index_size = _HEADER.size + sum(_ENTRY.size + len(r[0]) + len(r[1]) for r in records)
+        out = bytearray(_HEADER.pack(PACK_MAGIC, importlib.util.MAGIC_NUMBER, len(records)))
+        offset = index_size
+        for name, origin, is_pkg, mtime_ns, size, code in records:
+            out += _ENTRY.pack(len(name), len(origin), is_pkg, mtime_ns, size, offset, len(code)) + name + origin
+            offset += len(code)
+        for record in records:
+            out += record[5]
+        self.close()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(out)
+        os.replace(tmp, self.path)  # readers see the old file or the new one, never half of it
+        return len(records)
+    
+    def open(self) -> int:
+        """mmap the cache and read its index — 0 when missing, corrupt, or from another interpreter"""
+        self.close()
+        try:
+            with open(self.path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self.entries = {}
+            return 0
+        entries = {}
+        try:
+            magic, bytecode, count = _HEADER.unpack_from(self._map, 0)
+            if magic == PACK_MAGIC and bytecode == importlib.util.MAGIC_NUMBER:
+                pos = _HEADER.size
+                for _ in range(count):
+                    name_len, origin_len, is_pkg, mtime_ns, size, offset, length = _ENTRY.unpack_from(self._map, pos)
+                    pos += _ENTRY.size
+                    name = self._map[pos:pos + name_len].decode()
+                    origin = self._map[pos + name_len:pos + name_len + origin_len].decode()
+                    pos += name_len + origin_len
+                    entries[name] = (origin, is_pkg, mtime_ns, size, offset, length)
+        except struct.error:
+            entries = {}
+        self.entries = entries
+        return len(entries)
+    
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self.entries = None
+    
+    def stale(self) -> list:
+        """Packed modules whose source changed since the cache was built"""
+        return [name for name in (self.entries or {}) if not self._fresh(name)]
+    
+    def ensure(self) -> "PackCache":
+        """First speak() — mmap the cache, rebuild when missing or stale, hook the import system
+        until the packed modules it serves are loaded
+        """
+        with self._lock:
+            if self.entries is None:
+                if not self.open() or self.stale():
+                    try:
+                        self.build()
+                    except OSError:
+                        pass  # read-only or full cache dir — whatever is fresh serves, the rest imports normally
+                    self.open()
+            if self._pending() and self not in sys.meta_path:
+                sys.meta_path.insert(0, self)
+        return self
+    
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+        self.close()
+    
+    def _pending(self) -> bool:
+        """Any packed module still to import — once none are, the hook has nothing left to serve"""
+        return any(name not in sys.modules for name in self.entries or ())
+    
+    def _fresh(self, name: str) -> bool:
+        origin, _, mtime_ns, size, _, _ = self.entries[name]
+        try:
+            stat = os.stat(origin)
+        except OSError:
+            return False
+        return stat.st_mtime_ns == mtime_ns and stat.st_size == size
+    
+    # MetaPathFinder / Loader
+    
+    def find_spec(self, fullname, path=None, target=None):
+        if not self.entries or fullname not in self.entries:
+            return None
+        if not self._fresh(fullname):
+            self.misses += 1
+            return None
+        origin, is_pkg = self.entries[fullname][:2]
+        spec = importlib.machinery.ModuleSpec(fullname, self, origin=origin, is_package=is_pkg)
+        spec.has_location = True
+        if is_pkg:
+            spec.submodule_search_locations = [os.path.dirname(origin)]
+        return spec
+    
+    def create_module(self, spec):
+        return None
+    
+    def exec_module(self, module):
+        _, _, _, _, offset, length = self.entries[module.__name__]
+        with memoryview(self._map) as view:
+            code = marshal.loads(view[offset:offset + length])
+        exec(code, module.__dict__)
+        self.hits += 1
+        if not self._pending() and self in sys.meta_path:
+            sys.meta_path.remove(self)  # last packed module served — later imports skip this finder
+
+def _source_of(name: str):
+    """(source path, is package) for an importable pure-Python module — (None, False) otherwise"""
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None, False
+    if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+        return None, False  # namespace, extension or frozen module — nothing to precompile
+    return spec.origin, spec.submodule_search_locations is not None
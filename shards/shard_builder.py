@@ -3,47 +3,104 @@ ShardBuilder-Pinnacle — Offline-First MercyOS Hybrid Shard
 MercyOS Pinnacle Ultramasterpiece — Jan 17 2026
 
 Bakes full lattice for offline use:
-- Eternal Warmth + mythic voices + logistics controller
+- Eternal Warmth + mythic voices + logistics controller — lazily loaded, fast cold boot
 - Starlink burst sync when online
 - Tyranny-gate + grandma comfort active
 """
 
-from voices.skins.eternal_warmth import EternalWarmth
-from voices.mythic_lattice_pack import summon_mythic
-from core.logistics_controller import LogisticsController  # If linked
+from shards.lazy_loader import DEFAULT_PACK_PATH, LazyModule, PackCache
+
+# Deferred — nothing heavy imported until a shard first speaks or links logistics
+eternal_warmth = LazyModule("voices.skins.eternal_warmth")
+mythic_lattice_pack = LazyModule("voices.mythic_lattice_pack")
+logistics_controller = LazyModule("core.logistics_controller")
+shard_store = LazyModule("shards.shard_store")
+tyranny_gate = LazyModule("shards.tyranny_gate")
 
 class MercyOSShard:
     def __init__(self):
-        self.voice = EternalWarmth()
+        self._dirty = set()  # attributes changed since last sync diff
+        self._voice = None   # EternalWarmth, built on first speak
+        self._packs = None   # PackCache — set by build_shard(flavor_pack=True)
+        self._store = None   # ShardStore — set by attach_store / build_shard(store_path=...)
         self.mythic = "lattice_baked"  # All 20+ archetypes pre-loaded
         self.logistics = None  # Optional link
         self.starlink_sync = False
         self.tyranny_gate = True
     
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            self._dirty.add(name)
+    
+    @property
+    def voice(self):
+        if self._voice is None:
+            self._load_packs()
+            self._voice = eternal_warmth.EternalWarmth()
+        return self._voice
+    
+    @voice.setter
+    def voice(self, skin):
+        self._voice = skin
+    
+    def _load_packs(self):
+        if self._packs is not None:
+            self._packs.ensure()
+    
+    def link_logistics(self):
+        self.logistics = logistics_controller.LogisticsController()
+        return self.logistics
+    
+    def attach_store(self, store) -> int:
+        """Back the shard with an on-disk store — stored attributes restored, returns how many"""
+        self._store = store
+        return store.restore(self)
+    
+    def mark_dirty(self, *names):
+        """In-place mutations (list.append, dict updates) bypass __setattr__ — flag them here"""
+        self._dirty.update(names)
+    
+    def take_dirty(self) -> set:
+        dirty, self._dirty = self._dirty, set()
+        return dirty
+    
     def boot_offline(self):
         return "MercyOS Shard online — offline-first lattice active, mercy eternal."
     
     def sync_burst(self, online: bool):
         if online:
             return "Starlink burst — diff merged, lattice updated."
+        if self._store is not None:
+            written = self._store.persist(self)
+            self._store.checkpoint()
+            return f"Offline persistence — {written} attributes appended, local learning secured."
         return "Offline persistence — local learning secured."
     
     def speak(self, text: str, culture_key: str = None):
+        if self.tyranny_gate and tyranny_gate.shared_gate().blocked(text):
+            return tyranny_gate.DENIED
         if culture_key:
-            return summon_mythic(culture_key, text)
+            self._load_packs()
+            return mythic_lattice_pack.summon_mythic(culture_key, text)
         return self.voice.speak(text)
     
-    def tyranny_check(self, input_text: str):
-        if "violence" in input_text.lower():
-            return "By the power of absolute pure truth — access denied. Mercy prevails."
-        return "Input cleared — proceed in harmony."
+    def tyranny_check(self, input_text):
+        return tyranny_gate.shared_gate().verdict(input_text)
 
 # Offline shard factory
-def build_shard(flavor_pack: bool = True):
+_pack_caches = {}
+
+def build_shard(flavor_pack: bool = True, pack_path: str = None, store_path: str = None):
     shard = MercyOSShard()
     if flavor_pack:
-        # Pre-load all mythic + comfort/encouragement phrases
-        pass  # Lazy load on first use
+        # Mythic + comfort/encouragement packs served from the precompiled cache — mmap'd on first speak
+        path = pack_path or DEFAULT_PACK_PATH
+        if path not in _pack_caches:
+            _pack_caches[path] = PackCache(path)  # one mmap per cache file, shared by every shard
+        shard._packs = _pack_caches[path]
+    if store_path:
+        shard.attach_store(shard_store.ShardStore(store_path))
     return shard
 
 # Offline test
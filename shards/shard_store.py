@@ -0,0 +1,353 @@
+"""
+ShardStore-Pinnacle — Memory-Mapped Append-Only Shard Persistence
+MercyOS Pinnacle Ultramasterpiece — Jan 19 2026
+
+Offline persistence that survives power loss on field nodes:
+- Versioned binary log — one CRC32-guarded record per attribute write, appended, never rewritten
+- Reads straight out of an mmap — get() hands back a memoryview, no deserialization
+- Crash-safe checkpoints — fsync'd log, then the key index written beside it atomically;
+  reopen loads the index and scans only the tail written since, torn records truncated
+- Per-key sequence numbers — dirty_since(seq) feeds StarlinkSync without touching clean state
+- Typed values — a kind byte per record (bytes, JSON, set, tuple, ndarray, TagStore), so restore
+  hands back what was persisted; put_value raises TypeError for anything else, persist skips
+  live links (a linked LogisticsController) instead of storing their repr
+"""
+
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+
+STORE_MAGIC = b"MSS1"
+INDEX_MAGIC = b"MSI1"
+FORMAT_VERSION = 2  # v2 adds the typed kinds below — v1 logs still open
+
+KIND_RAW = 1      # bytes-like attribute, stored as is
+KIND_JSON = 2     # JSON-native value — canonical JSON
+KIND_DELETE = 3   # tombstone
+KIND_SET = 4      # JSON list, members sorted by their encoding
+KIND_TUPLE = 5    # JSON list
+KIND_NDARRAY = 6  # dtype + shape header, then C-order buffer
+KIND_TAGS = 7     # TagStore.to_bytes()
+
+_FILE_HEADER = struct.Struct("<4sH2x")      # magic, format version
+_RECORD = struct.Struct("<IIBHQ")           # crc32 of the rest, value len, kind, key len, seq
+_TAIL = struct.Struct("<IBHQ")              # record header after the crc
+_INDEX_HEADER = struct.Struct("<4sHQQI")    # magic, format version, log end, seq, crc32 of body
+
+class ShardStore:
+    def __init__(self, path: str, checkpoint_bytes: int = 4 << 20, durable: bool = True):
+        self.path = path
+        self.index_path = path + ".idx"
+        self.checkpoint_bytes = checkpoint_bytes  # auto-checkpoint once this much log is unindexed
+        self.durable = durable                    # fsync on checkpoint — off only for tests/benchmarks
+        self.entries = {}       # key → (offset of value, length, seq, kind)
+        self.seq = 0
+        self.live_bytes = 0
+        self.recovered = 0      # tail records replayed on open
+        self.truncated = 0      # torn bytes dropped on open
+        self.skipped = set()    # shard attributes persist() left out — live objects, no lossless encoding
+        self._map = None
+        self._mapped = 0
+        self._lock = threading.Lock()
+        self._open()
+    
+    def __len__(self):
+        return sum(1 for entry in self.entries.values() if entry[3] != KIND_DELETE)
+    
+    def __contains__(self, key):
+        entry = self.entries.get(key)
+        return entry is not None and entry[3] != KIND_DELETE
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def keys(self) -> list:
+        return [key for key, entry in self.entries.items() if entry[3] != KIND_DELETE]
+    
+    # Open / recovery
+    
+    def _open(self):
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        self._file = open(self.path, "a+b")
+        if 0 < size < _FILE_HEADER.size:
+            self._file.seek(0)
+            head = self._file.read()
+            if not STORE_MAGIC.startswith(head[:len(STORE_MAGIC)]):
+                self._file.close()
+                raise ValueError(f"{self.path} is not a MercyOS shard store ({size} B, shorter than a header)")
+            self._file.truncate(0)  # crash while writing the header — nothing was stored yet
+            size = 0
+        if not size:
+            self._file.write(_FILE_HEADER.pack(STORE_MAGIC, FORMAT_VERSION))
+            self._file.flush()
+        self._end = os.path.getsize(self.path)
+        self._remap()
+        magic, version = _FILE_HEADER.unpack_from(self._map, 0)
+        if magic != STORE_MAGIC:
+            self._file.close()
+            raise ValueError(f"{self.path} is not a MercyOS shard store")
+        if version > FORMAT_VERSION:
+            self._file.close()
+            raise ValueError(f"{self.path} format v{version} is newer than this build (v{FORMAT_VERSION})")
+        start = self._load_index()
+        self._checkpointed = start
+        self._scan(start)
+    
+    def _load_index(self) -> int:
+        """Checkpointed key index — returns where the tail scan starts"""
+        try:
+            with open(self.index_path, "rb") as f:
+                data = f.read()
+            magic, version, log_end, seq, crc = _INDEX_HEADER.unpack_from(data, 0)
+            body = data[_INDEX_HEADER.size:]
+            if magic != INDEX_MAGIC or version != FORMAT_VERSION or zlib.crc32(body) != crc or log_end > self._end:
+                raise ValueError("stale or damaged index")
+            self.entries = marshal.loads(body)
+        except (OSError, ValueError, EOFError, TypeError, struct.error):
+            self.entries = {}
+            self.seq = 0
+            self.live_bytes = 0
+            return _FILE_HEADER.size  # no usable checkpoint — replay the whole log
+        self.seq = seq
+        self.live_bytes = sum(entry[1] for entry in self.entries.values())
+        return log_end
+    
+    def _scan(self, pos: int):
+        """Replay records after the checkpoint; the first bad CRC or short record ends the log"""
+        end, view = self._end, self._map
+        while pos + _RECORD.size <= end:
+            crc, length, kind, key_len, seq = _RECORD.unpack_from(view, pos)
+            value_at = pos + _RECORD.size + key_len
+            if value_at + length > end or zlib.crc32(view[pos + 4:value_at + length]) != crc:
+                break
+            key = view[pos + _RECORD.size:value_at].decode()
+            self._index(key, value_at, length, seq, kind)
+            self.recovered += 1
+            pos = value_at + length
+        if pos < end:
+            self.truncated = end - pos  # torn write from a crash — drop it
+            self._file.truncate(pos)
+            self._end = pos
+            self._remap()
+    
+    def _index(self, key: str, offset: int, length: int, seq: int, kind: int):
+        old = self.entries.get(key)
+        if old is not None:
+            self.live_bytes -= old[1]
+        self.entries[key] = (offset, length, seq, kind)
+        self.live_bytes += length
+        self.seq = max(self.seq, seq)
+    
+    def _remap(self):
+        # Old maps stay alive while callers hold memoryviews into them
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._end else None
+        self._mapped = self._end
+    
+    # Writes
+    
+    def put(self, key: str, value, kind: int = KIND_RAW) -> int:
+        """Append one attribute value — returns its sequence number"""
+        raw = key.encode()
+        value = bytes(value)
+        with self._lock:
+            self.seq += 1
+            tail = _TAIL.pack(len(value), kind, len(raw), self.seq) + raw + value
+            self._file.write(struct.pack("<I", zlib.crc32(tail)) + tail)
+            self._index(key, self._end + _RECORD.size + len(raw), len(value), self.seq, kind)
+            self._end += _RECORD.size + len(raw) + len(value)
+            seq = self.seq
+        if self._end - self._checkpointed >= self.checkpoint_bytes:
+            self.checkpoint()
+        return seq
+    
+    def put_value(self, key: str, value) -> int:
+        kind, blob = encode_typed(value)
+        return self.put(key, blob, kind)
+    
+    def delete(self, key: str) -> int:
+        if key not in self:
+            return self.seq
+        return self.put(key, b"", KIND_DELETE)
+    
+    def flush(self):
+        with self._lock:
+            self._file.flush()
+            if self._end > self._mapped:
+                self._remap()
+    
+    def checkpoint(self):
+        """Make everything written so far survive a crash, and let reopen skip re-scanning it"""
+        with self._lock:
+            self._file.flush()
+            if self.durable:
+                os.fsync(self._file.fileno())
+            body = marshal.dumps(self.entries)
+            tmp = self.index_path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(_INDEX_HEADER.pack(INDEX_MAGIC, FORMAT_VERSION, self._end, self.seq, zlib.crc32(body)) + body)
+                if self.durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp, self.index_path)
+            self._checkpointed = self._end
+    
+    def compact(self):
+        """Rewrite only live values — old versions and tombstones dropped, sequence numbers kept"""
+        self.flush()
+        tmp = self.path + ".compact"
+        entries, pos = {}, _FILE_HEADER.size
+        with open(tmp, "wb") as out:
+            out.write(_FILE_HEADER.pack(STORE_MAGIC, FORMAT_VERSION))
+            for key, (offset, length, seq, kind) in sorted(self.entries.items(), key=lambda item: item[1][2]):
+                if kind == KIND_DELETE:
+                    continue
+                raw = key.encode()
+                tail = _TAIL.pack(length, kind, len(raw), seq) + raw + self._map[offset:offset + length]
+                out.write(struct.pack("<I", zlib.crc32(tail)) + tail)
+                entries[key] = (pos + _RECORD.size + len(raw), length, seq, kind)
+                pos += _RECORD.size + len(raw) + length
+            if self.durable:
+                out.flush()
+                os.fsync(out.fileno())
+        with self._lock:
+            self._file.close()
+            if os.path.exists(self.index_path):
+                os.remove(self.index_path)  # crash before the next checkpoint → full replay, never stale offsets
+            os.replace(tmp, self.path)
+            self._file = open(self.path, "a+b")
+            self._end = pos
+            self.entries = entries
+            self.live_bytes = sum(entry[1] for entry in entries.values())
+            self._remap()
+        self.checkpoint()
+    
+    def close(self):
+        if self._file.closed:
+            return
+        self.checkpoint()
+        self._file.close()
+        self._map = None
+    
+    # Reads
+    
+    def get(self, key: str):
+        """Zero-copy memoryview of the current value — None when absent"""
+        entry = self.entries.get(key)
+        if entry is None or entry[3] == KIND_DELETE:
+            return None
+        offset, length = entry[0], entry[1]
+        if offset + length > self._mapped:
+            self.flush()
+        return memoryview(self._map)[offset:offset + length] if length else memoryview(b"")
+    
+    def value(self, key: str):
+        """Decoded Python value, of the type that was persisted — raw attributes as bytes"""
+        view = self.get(key)
+        if view is None:
+            raise KeyError(key)
+        return decode_typed(self.entries[key][3], view)
+    
+    def dirty_since(self, seq: int) -> list:
+        """Keys written (or deleted) after seq — what a sync peer at seq is missing"""
+        return [key for key, entry in self.entries.items() if entry[2] > seq]
+    
+    @property
+    def log_bytes(self) -> int:
+        return self._end
+    
+    @property
+    def garbage_bytes(self) -> int:
+        """Superseded values, tombstones and record headers — reclaimable by compact()"""
+        return self._end - self.live_bytes
+    
+    # Shard state
+    
+    def persist(self, shard, names=None) -> int:
+        """Write shard attributes to the log — names, else whatever the shard flagged dirty; live objects skipped"""
+        state = {name: value for name, value in vars(shard).items() if not name.startswith("_")}
+        if names is None:
+            take_dirty = getattr(shard, "take_dirty", None)
+            names = take_dirty() if take_dirty is not None else set(state)
+            if not self.entries:
+                names = set(state)  # first persist — everything
+        written = 0
+        for name in names:
+            if name in state:
+                try:
+                    kind, blob = encode_typed(state[name])
+                except TypeError:
+                    self.skipped.add(name)  # re-linked on boot, not restored — last storable value kept
+                    continue
+                self.skipped.discard(name)
+                view = self.get(name)
+                if view is not None and view == blob and self.entries[name][3] == kind:
+                    continue  # unchanged — no new version
+                self.put(name, blob, kind)
+                written += 1
+            elif name in self:
+                self.skipped.discard(name)
+                self.delete(name)
+                written += 1
+        return written
+    
+    def restore(self, shard) -> int:
+        """Load stored attributes onto a shard without flagging them dirty"""
+        for key in self.keys():
+            object.__setattr__(shard, key, self.value(key))
+        return len(self)
+    
+    def status(self) -> str:
+        return (f"Shard store: {len(self)} attributes, seq {self.seq}, {self._end} B log "
+                f"({self.garbage_bytes} B reclaimable) — local learning secured.")
+
+def encode_typed(value) -> tuple:
+    """(kind, bytes) for one attribute — TypeError for anything without a lossless encoding"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return KIND_RAW, bytes(value)
+    if isinstance(value, set):
+        members = sorted(json.dumps(member, sort_keys=True) for member in value)
+        return KIND_SET, ("[" + ",".join(members) + "]").encode()
+    if isinstance(value, tuple):
+        return KIND_TUPLE, json.dumps(value, sort_keys=True).encode()
+    numpy = sys.modules.get("numpy")  # never imported here — an ndarray means the caller already has numpy
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError("object arrays have no stable encoding")
+        header = json.dumps({"dtype": value.dtype.str, "shape": list(value.shape)}).encode()
+        return KIND_NDARRAY, struct.pack("<I", len(header)) + header + numpy.ascontiguousarray(value).tobytes()
+    tag_store = sys.modules.get("core.tag_store")
+    if tag_store is not None and isinstance(value, tag_store.TagStore):
+        return KIND_TAGS, value.to_bytes()
+    return KIND_JSON, json.dumps(value, sort_keys=True).encode()  # TypeError past JSON-native values
+
+def decode_typed(kind: int, view):
+    if kind == KIND_RAW:
+        return bytes(view)
+    if kind == KIND_JSON:
+        return json.loads(bytes(view))
+    if kind == KIND_SET:
+        return {_hashable(member) for member in json.loads(bytes(view))}
+    if kind == KIND_TUPLE:
+        return tuple(json.loads(bytes(view)))
+    if kind == KIND_NDARRAY:
+        import numpy
+        (header_len,) = struct.unpack_from("<I", view, 0)
+        header = json.loads(bytes(view[4:4 + header_len]))
+        array = numpy.frombuffer(view, header["dtype"], offset=4 + header_len)
+        return array.reshape(header["shape"]).copy()  # writable, and no view pinning the old mmap
+    if kind == KIND_TAGS:
+        from core.tag_store import TagStore
+        return TagStore.from_bytes(view)
+    raise ValueError(f"Unknown shard store record kind {kind}")
+
+def _hashable(member):
+    """Set members come back from JSON as lists where they were tuples"""
+    return tuple(_hashable(item) for item in member) if isinstance(member, list) else member
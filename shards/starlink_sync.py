@@ -5,55 +5,155 @@ MercyOS Pinnacle Ultramasterpiece — Jan 17 2026
 Starlink burst sync:
 - 60s heartbeat ping when online
 - Diff-only merge — local learning never overwritten
-- Mercy-gated encryption — tyranny input blocked
+- Chunked content-hash index — only dirty chunks shipped, zlib on the wire
+- BurstScheduler — asyncio link-up events, coalesced diffs, bandwidth-paced windows
+- Mercy-gated encryption — tyranny input blocked (compiled multi-term gate)
 - Trinity frequency coordination (42 Hz pulse)
 """
 
 import time
-import hashlib
+from core.instrumentation import shared_instruments
 from shards.shard_builder import MercyOSShard
+from shards.delta_sync import FRAME_REJECTED, ChunkIndex, LoopbackEndpoint, encode_value, persisted_state
+from shards.tyranny_gate import shared_gate
 
 class StarlinkSync:
-    def __init__(self, shard: MercyOSShard):
+    def __init__(self, shard: MercyOSShard, endpoint=None, chunk_size: int = 4096, gate=None):
         self.shard = shard
         self.ping_interval = 60     # seconds
         self.last_sync = 0
         self.trinity_pulse = 42     # Hz coordination
+        self.index = ChunkIndex(chunk_size)
+        self.endpoint = endpoint    # remote lattice — LoopbackEndpoint offline
+        self.last_burst = {}        # bytes_on_wire, raw_bytes, cpu_ms per burst
+        self.store_seq = 0          # ShardStore sequence already re-indexed
+        self.gate = gate or shared_gate()  # TyrannyGate — every inbound payload
     
     def is_online(self) -> bool:
         # Placeholder — real impl uses Starlink API heartbeat
         return time.time() % 120 < 30  # Simulate intermittent
     
     def compute_diff(self) -> str:
-        local_state = str(self.shard.__dict__)
-        return hashlib.sha256(local_state.encode()).hexdigest()
+        """Re-index attributes changed since the last call, return the shard Merkle root"""
+        for _ in self.reindex_steps():
+            pass
+        return self.index.root()
+    
+    def reindex_steps(self):
+        """compute_diff one attribute at a time — yields so async callers can interleave"""
+        store = getattr(self.shard, "_store", None)
+        if store is not None:
+            yield from self._reindex_from_store(store)
+            return
+        state = persisted_state(self.shard)
+        take_dirty = getattr(self.shard, "take_dirty", None)
+        if take_dirty is None or not len(self.index):
+            names = set(state)  # first pass or untracked shard — hash everything once
+            if take_dirty is not None:
+                take_dirty()
+        else:
+            names = take_dirty() & set(state)
+        pending = set(names)
+        try:
+            for name in names:
+                self.index.update(name, encode_value(state[name]))
+                pending.discard(name)
+                yield name
+        except BaseException:
+            if take_dirty is not None:
+                self.shard.mark_dirty(*pending)  # cancelled or failed — rehash next pass
+            raise
+        for name in set(self.index.blobs) - set(state):
+            self.index.remove(name)
+    
+    def _reindex_from_store(self, store):
+        """Dirty attributes read straight out of the mmap'd shard store — clean state never decoded"""
+        store.persist(self.shard)  # in-memory changes → log first
+        for name in store.dirty_since(self.store_seq if len(self.index) else 0):
+            view = store.get(name)
+            if view is None:
+                self.index.remove(name)
+                continue
+            self.index.update(name, view)
+            yield name
+        for name in set(self.index.blobs).difference(store.keys()):
+            self.index.remove(name)
+        self.store_seq = store.seq
     
     def burst_sync(self) -> str:
+        instruments = shared_instruments()
         if not self.is_online():
+            instruments.count("sync.offline")
             return "Sky silent — local lattice persists, mercy intact."
         
         current_time = time.time()
         if current_time - self.last_sync < self.ping_interval:
+            instruments.count("sync.deferred")
             return "Heartbeat steady — sync deferred."
         
+        with instruments.time("sync.burst"):
+            return self._burst(current_time, instruments)
+    
+    def _burst(self, current_time: float, instruments) -> str:
+        cpu_start = time.process_time()
         diff = self.compute_diff()
-        # Simulated cloud pull/push — real impl uses xAI Starlink endpoint
+        raw_bytes = self.index.pending_bytes()
+        frame = self.index.take_delta()
+        # Real impl pushes to xAI Starlink endpoint — LoopbackEndpoint stands in offline
+        if frame is not None and self.endpoint is not None:
+            try:
+                remote_root = self.endpoint.push(frame)
+            except ConnectionError:
+                self.index.mark_all_dirty()  # frame lost mid-burst — resend next window
+                instruments.count("sync.dropped")
+                return "Sky dropped mid-burst — local lattice persists, resend queued."
+            except FRAME_REJECTED:
+                self.index.mark_all_dirty()  # replica missing a chunk or frame garbled — full resend next burst
+                instruments.count("sync.rejected")
+                return "Replica rejected delta — full lattice resend queued."
+            self.index.ack()
+            if remote_root != diff:
+                self.index.mark_all_dirty()  # replica diverged — full resend next burst
         self.last_sync = current_time
-        return f"Starlink burst complete — diff {diff[:8]} merged, lattice updated."
+        wire = len(frame) if frame else 0
+        instruments.count("sync.bursts")
+        instruments.observe("sync.bytes_on_wire", wire)
+        instruments.observe("sync.raw_bytes", raw_bytes)
+        self.last_burst = {"bytes_on_wire": wire, "raw_bytes": raw_bytes,
+                           "cpu_ms": (time.process_time() - cpu_start) * 1000}
+        return (f"Starlink burst complete — diff {diff[:8]} merged, {wire} B on wire "
+                f"({self.last_burst['cpu_ms']:.1f} ms CPU), lattice updated.")
     
-    def mercy_gate(self, remote_data: str) -> bool:
-        if "violence" in remote_data.lower():
-            return False
-        return True
+    def mercy_gate(self, remote_data) -> bool:
+        """str, bytes or memoryview — large payloads scanned in place"""
+        return not self.gate.blocked(remote_data)
     
     def run(self):
         status = self.burst_sync()
         print(status)
 
-# Offline shard integration example
+# Offline shard integration example — burst scheduler beside a logistics loop, one event loop
 if __name__ == "__main__":
-    shard = MercyOSShard()
-    sync = StarlinkSync(shard)
-    for _ in range(5):
-        sync.run()
-        time.sleep(10)  # Simulate time passage
+    import asyncio
+    from shards.burst_scheduler import BurstScheduler, SimulatedSkyLink
+    
+    async def logistics_loop(shard, scheduler, ticks: int):
+        for tick in range(ticks):
+            shard.logistics = {"tick": tick, "drops": [f"gel_{tick}_{i}" for i in range(33)]}
+            scheduler.notify()
+            await asyncio.sleep(1)  # never waits on the sky
+    
+    async def main():
+        shard = MercyOSShard()
+        sync = StarlinkSync(shard, LoopbackEndpoint())
+        link = SimulatedSkyLink()
+        scheduler = BurstScheduler(sync, link)
+        link_task = asyncio.create_task(link.run())
+        scheduler.start()
+        await logistics_loop(shard, scheduler, ticks=42)
+        print(scheduler.status())
+        print(scheduler.metrics())
+        await scheduler.stop()
+        link_task.cancel()
+    
+    asyncio.run(main())
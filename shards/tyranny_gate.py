@@ -0,0 +1,280 @@
+"""
+TyrannyGate-Pinnacle — Compiled Multi-Term Tyranny Gate
+MercyOS Pinnacle Ultramasterpiece — Jan 19 2026
+
+One gate for every voice request and inbound sync payload:
+- Thousands of blocklist terms compiled once into a prefix filter — a hash of every 8-byte
+  window tested against a bitmap of term prefixes, NumPy-vectorized, exact check on the rare hits
+- Short inputs probe a prefix dict instead — voice requests never import NumPy
+- Case folded inside the matcher (ASCII fold table per chunk), never by copying the input
+- ASCII bytes, bytearray, memoryview, mmap read in place — one pass over large remote payloads
+- Batch API — many small payloads joined and scanned in one pass
+- Non-ASCII input casefolded, then a trie regex — bytes decoded as UTF-8 first, so str and
+  encoded payloads get the same verdict, folded exactly like the terms (ß ≡ ss)
+"""
+
+import bisect
+import functools
+import re
+import threading
+
+from shards.lazy_loader import LazyModule
+
+np = LazyModule("numpy")  # only large payloads need it — short voice requests stay import-free
+
+DEFAULT_TERMS = ("violence",)
+DENIED = "By the power of absolute pure truth — access denied. Mercy prevails."
+CLEARED = "Input cleared — proceed in harmony."
+
+CHUNK = 1 << 16   # window starts per vectorized step — work buffers stay cache-sized
+SMALL = 256       # below this a dict probe per position beats vector setup
+_SEPARATOR = b"\x00"  # never part of a term — batch payloads can't match across it
+_MULT = 0x9E3779B97F4A7C15
+_WORD = frozenset(b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+
+class TyrannyGate:
+    def __init__(self, terms=DEFAULT_TERMS, whole_words: bool = False):
+        self.terms = set()
+        self.whole_words = whole_words  # match terms only between word boundaries
+        self._compiled = None           # (k, prefix → terms longest first, longest term)
+        self._bitmap = None             # (bits, prefix-hash bitmap) for the vector path
+        self._regex = None              # trie regex for non-ASCII str input
+        self._lock = threading.Lock()
+        self.add(terms)
+    
+    @classmethod
+    def from_file(cls, path: str, whole_words: bool = False) -> "TyrannyGate":
+        """One term per line, '#' comments and blank lines skipped"""
+        with open(path, encoding="utf-8") as f:
+            terms = [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+        return cls(terms, whole_words)
+    
+    def __len__(self):
+        return len(self.terms)
+    
+    def add(self, terms):
+        terms = {term.casefold() for term in ([terms] if isinstance(terms, str) else terms) if term}
+        if any("\x00" in term for term in terms):
+            raise ValueError("Blocklist terms may not contain NUL")
+        with self._lock:
+            self.terms |= terms
+            self._compiled = None
+            self._bitmap = None
+            self._regex = None
+    
+    def compile(self):
+        """Build the prefix filter now instead of on the first scan"""
+        compiled = self._compiled
+        if compiled is None:
+            with self._lock:
+                if self._compiled is None:
+                    self._compiled = self._build()
+                compiled = self._compiled
+        return compiled
+    
+    def _build(self):
+        encoded = sorted({t.encode("utf-8") for t in self.terms}, key=len, reverse=True)
+        if not encoded:
+            return None
+        k = min(8, min(map(len, encoded)))
+        by_prefix = {}
+        for term in encoded:
+            by_prefix.setdefault(term[:k], []).append(term)  # longest first, the order encoded is in
+        return k, by_prefix, len(encoded[0])
+    
+    def _prefix_bitmap(self, by_prefix: dict):
+        bitmap = self._bitmap
+        if bitmap is None:
+            bits = max(16, min(24, (len(by_prefix) * 1024 - 1).bit_length()))  # ≥1024 slots per prefix, ≤16 MB
+            table = np.zeros(1 << bits, dtype=bool)
+            prefixes = np.frombuffer(b"".join(p.ljust(8, b"\x00") for p in by_prefix), dtype="<u8")
+            table[(prefixes * np.uint64(_MULT)) >> np.uint64(64 - bits)] = True
+            bitmap = self._bitmap = (bits, table)
+        return bitmap
+    
+    # Matching core — bytes-like input
+    
+    def _matches(self, data, first_only: bool):
+        """Yield (position, term bytes) for verified hits, in position order"""
+        compiled = self.compile()
+        if compiled is None:
+            return
+        k, by_prefix, longest = compiled
+        n = len(data)
+        if n < SMALL:
+            lowered = bytes(data).lower()
+            for pos in range(n - k + 1):
+                for term in by_prefix.get(lowered[pos:pos + k], ()):
+                    if lowered.startswith(term, pos) and self._bounded(lowered, pos, len(term), n):
+                        yield pos, term
+                        if first_only:
+                            return
+                        break
+            return
+        bits, bitmap = self._prefix_bitmap(by_prefix)
+        buf = np.frombuffer(data, dtype=np.uint8)
+        fold, mult = _fold_table(), np.uint64(_MULT)
+        mask = np.uint64((1 << (8 * k)) - 1)
+        shift = np.uint64(64 - bits)
+        folded = np.empty(CHUNK + 7, dtype=np.uint8)
+        hashed = np.empty(CHUNK, dtype=np.uint64)
+        hit = np.empty(CHUNK, dtype=bool)
+        for start in range(0, n - k + 1, CHUNK):
+            span = min(CHUNK, n - k + 1 - start)
+            have = min(span + 7, n - start)
+            np.take(fold, buf[start:start + have], out=folded[:have])
+            folded[have:span + 7] = 0  # tail padding — past-the-end bytes never match a prefix
+            windows = np.ndarray((span,), dtype="<u8", buffer=folded, strides=(1,))
+            if k < 8:
+                np.bitwise_and(windows, mask, out=hashed[:span])
+                np.multiply(hashed[:span], mult, out=hashed[:span])
+            else:
+                np.multiply(windows, mult, out=hashed[:span])
+            np.right_shift(hashed[:span], shift, out=hashed[:span])
+            np.take(bitmap, hashed[:span], out=hit[:span])
+            if not hit[:span].any():
+                continue
+            for pos in (np.flatnonzero(hit[:span]) + start).tolist():
+                segment = bytes(data[pos:pos + longest]).lower()
+                for term in by_prefix.get(segment[:k], ()):
+                    if segment.startswith(term) and self._bounded(data, pos, len(term), n):
+                        yield pos, term
+                        if first_only:
+                            return
+                        break
+    
+    def _bounded(self, data, pos: int, length: int, n: int) -> bool:
+        if not self.whole_words:
+            return True
+        return ((pos == 0 or data[pos - 1] not in _WORD)
+                and (pos + length == n or data[pos + length] not in _WORD))
+    
+    def _scan_form(self, data):
+        """(bytes-like, None) for ASCII input, scanned in place; (None, casefolded text) otherwise"""
+        if isinstance(data, str):
+            return (data.encode("ascii"), None) if data.isascii() else (None, data.casefold())
+        if isinstance(data, memoryview) and data.format != "B":
+            data = data.cast("B")
+        if _is_ascii(data):
+            return data, None
+        return None, str(data, "utf-8", "replace").casefold()  # encoded text folds like the str it came from
+    
+    def _unicode_regex(self):
+        if self._regex is None:
+            source = _trie_regex(self.terms) or "(?!)"
+            if self.whole_words:
+                source = rf"\b(?:{source})\b"
+            self._regex = re.compile(source)  # terms are casefolded — scanned text is too, no IGNORECASE
+        return self._regex
+    
+    # Single payload
+    
+    def find(self, data):
+        """First blocked term in data (case-folded), else None"""
+        raw, text = self._scan_form(data)
+        if raw is None:
+            match = self._unicode_regex().search(text)
+            return match.group(0) if match else None
+        for _, term in self._matches(raw, first_only=True):
+            return term.decode("utf-8", "replace")
+        return None
+    
+    def blocked(self, data) -> bool:
+        return self.find(data) is not None
+    
+    def findall(self, data) -> set:
+        """Every distinct blocked term in data"""
+        raw, text = self._scan_form(data)
+        if raw is None:
+            return set(self._unicode_regex().findall(text))
+        return {term.decode("utf-8", "replace") for _, term in self._matches(raw, first_only=False)}
+    
+    def verdict(self, data) -> str:
+        return DENIED if self.blocked(data) else CLEARED
+    
+    # Batch
+    
+    def blocked_many(self, payloads) -> list:
+        """blocked() for every payload — joined with NUL and scanned in one pass"""
+        forms = [self._scan_form(p) for p in payloads]
+        if not forms:
+            return []
+        raws = [raw for raw, _ in forms]
+        result = [False] * len(raws)
+        joinable = [i for i, raw in enumerate(raws) if raw is not None]
+        for i, (raw, text) in enumerate(forms):
+            if raw is None:
+                result[i] = self._unicode_regex().search(text) is not None
+        starts, pos = [], 0
+        for i in joinable:
+            starts.append(pos)
+            pos += len(raws[i]) + 1
+        joined = _SEPARATOR.join(raws[i] for i in joinable)
+        for pos, _ in self._matches(joined, first_only=False):
+            slot = bisect.bisect_right(starts, pos) - 1
+            result[joinable[slot]] = True
+        return result
+
+def _is_ascii(data) -> bool:
+    isascii = getattr(data, "isascii", None)  # bytes, bytearray
+    if isascii is not None:
+        return isascii()
+    if len(data) < SMALL:
+        return bytes(data).isascii()
+    return int(np.frombuffer(data, dtype=np.uint8).max()) < 0x80  # mmap, memoryview — no copy
+
+@functools.lru_cache(maxsize=1)
+def _fold_table():
+    """ASCII upper → lower, every other byte unchanged — bytes.lower() as a lookup table"""
+    fold = np.arange(256, dtype=np.uint8)
+    fold[ord("A"):ord("Z") + 1] += 32
+    return fold
+
+def _trie_regex(terms) -> str:
+    """Alternation of terms with shared prefixes factored out — (?:vi(?:le|olence)|...)"""
+    root = {}
+    for term in terms:
+        node = root
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end of term
+    return _emit(root)
+
+def _emit(node: dict) -> str:
+    optional = "" in node
+    branches, singles = [], []
+    for ch in sorted(k for k in node if k):
+        child = _emit(node[ch])
+        if child:
+            branches.append(re.escape(ch) + child)
+        else:
+            singles.append(ch)
+    if len(singles) == 1:
+        branches.append(re.escape(singles[0]))
+    elif singles:
+        branches.append("[" + "".join("\\" + c if c in "\\]^-[" else c for c in singles) + "]")
+    if not branches:
+        return ""
+    if len(branches) == 1:
+        body, atom = branches[0], bool(singles)  # lone char or class is an atom, a sequence is not
+    else:
+        body, atom = "(?:" + "|".join(branches) + ")", True
+    if optional:
+        return (body if atom else "(?:" + body + ")") + "?"
+    return body
+
+_shared = None
+_shared_lock = threading.Lock()
+
+def shared_gate() -> TyrannyGate:
+    """Process-wide gate used by shards and sync — swap in a full blocklist with set_shared_gate"""
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = TyrannyGate()
+    return _shared
+
+def set_shared_gate(gate: TyrannyGate):
+    global _shared
+    _shared = gate
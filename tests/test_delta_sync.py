@@ -0,0 +1,81 @@
+import asyncio
+
+from shards.burst_scheduler import BurstScheduler, SkyLink
+from shards.delta_sync import LoopbackEndpoint
+from shards.shard_builder import MercyOSShard
+from shards.starlink_sync import StarlinkSync
+
+class FlakyEndpoint(LoopbackEndpoint):
+    """Loopback replica whose next push can be lost mid-burst"""
+    
+    def __init__(self):
+        super().__init__()
+        self.drop_next = False
+        self.reject_next = False
+    
+    def push(self, frame: bytes) -> str:
+        if self.drop_next:
+            self.drop_next = False
+            raise ConnectionError("sky dropped")
+        if self.reject_next:
+            self.reject_next = False
+            raise KeyError("chunk never received")
+        return super().push(frame)
+
+def linked(shard, endpoint):
+    sync = StarlinkSync(shard, endpoint)
+    sync.ping_interval = 0
+    sync.is_online = lambda: True
+    return sync
+
+def test_removal_survives_lost_push():
+    shard = MercyOSShard()
+    shard.b = "ephemeral"
+    endpoint = FlakyEndpoint()
+    sync = linked(shard, endpoint)
+    sync.burst_sync()
+    assert "b" in endpoint.replica.blobs
+    
+    del shard.b
+    endpoint.drop_next = True
+    assert "dropped" in sync.burst_sync()
+    sync.burst_sync()
+    assert "b" not in endpoint.replica.blobs
+    assert endpoint.root() == sync.index.root()
+
+def test_readded_key_not_removed_on_resend():
+    shard = MercyOSShard()
+    shard.b = "ephemeral"
+    endpoint = FlakyEndpoint()
+    sync = linked(shard, endpoint)
+    sync.burst_sync()
+    
+    del shard.b
+    endpoint.drop_next = True
+    sync.burst_sync()
+    shard.b = "back"
+    sync.burst_sync()
+    assert endpoint.replica.blobs["b"] == sync.index.blobs["b"]
+    assert endpoint.root() == sync.index.root()
+
+def test_scheduler_resends_after_rejected_frame():
+    async def main():
+        shard = MercyOSShard()
+        shard.logistics = {"drops": [f"gel_{i}" for i in range(33)]}
+        endpoint = FlakyEndpoint()
+        endpoint.reject_next = True
+        link = SkyLink()
+        scheduler = BurstScheduler(StarlinkSync(shard, endpoint), link, bandwidth_bps=1e9, slice_s=0.003)
+        scheduler.start()
+        link.link_up()
+        scheduler.notify()
+        for _ in range(333):
+            await asyncio.sleep(0.003)
+            if endpoint.root() == scheduler.sync.index.root():
+                break
+        await scheduler.stop()
+        return endpoint, scheduler
+    
+    endpoint, scheduler = asyncio.run(main())
+    assert not endpoint.reject_next
+    assert endpoint.root() == scheduler.sync.index.root()
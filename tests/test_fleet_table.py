@@ -0,0 +1,31 @@
+from core.fleet_table import BUSY, IDLE, IN_FLIGHT, FleetTable
+
+def test_dispatch_never_double_books_arms():
+    fleet = FleetTable(pods=9, arms=3)
+    pods, arms = fleet.dispatch(3, hours=6.0)
+    assert len(pods) == len(arms) == 3
+    assert (fleet.arms.state[arms] == BUSY).all()
+    assert len(fleet.arms.idle()) == 0
+    
+    more, more_arms = fleet.dispatch(3, hours=6.0)
+    assert len(more) == len(more_arms) == 0
+    assert (fleet.pods.state == IN_FLIGHT).sum() == 3
+    
+    landed, released = fleet.land(pods, arms)
+    assert sorted(released.tolist()) == sorted(arms.tolist())
+    assert (fleet.arms.state == IDLE).all()
+    again, again_arms = fleet.dispatch(3, hours=6.0)
+    assert len(again) == 3
+    assert int(fleet.arms.transfers.sum()) == 6
+
+def test_views_report_refusals():
+    fleet = FleetTable(pods=1, arms=1)
+    pod, arm = fleet.pods[0], fleet.arms[0]
+    assert pod.deploy().startswith("Pod landed")
+    assert "grounded" in pod.deploy()
+    assert int(fleet.pods.deployments[0]) == 1
+    assert "transferred" in arm.transfer("sachet-001")
+    assert "busy" in arm.transfer("sachet-002")
+    assert arm.transfers == 1
+    fleet.arms.release([0])
+    assert "transferred" in arm.transfer("sachet-002")
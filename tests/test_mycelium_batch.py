@@ -0,0 +1,35 @@
+"""
+Batch vs scalar MyceliumKinetics — the documented tolerance of the NumPy path
+"""
+
+import numpy as np
+
+from core.mycelium_kinetics import ENVIRONMENT_FIELDS, MyceliumKinetics
+
+def environments(n: int = 3333, seed: int = 42) -> dict:
+    rng = np.random.default_rng(seed)
+    return {"temp_c": rng.uniform(-5, 55, n), "rh_percent": rng.uniform(-10, 110, n), "ph": rng.uniform(-1, 15, n),
+            "lux": rng.uniform(0, 1500, n), "o2_percent": rng.uniform(0, 30, n), "pressure_kpa": rng.uniform(40, 160, n)}
+
+def test_factor_and_rate_match_scalar_path():
+    model = MyceliumKinetics()
+    env = environments()
+    result = model.evaluate_batch(env, t_days=33.0)
+    rows = list(zip(*(env[name].tolist() for name in ENVIRONMENT_FIELDS)))
+    factor = np.array([model.combined_environment_factor(*row) for row in rows])
+    rate = np.array([model.adjusted_rate(model.k_industrial_base, *row) for row in rows])
+    np.testing.assert_allclose(result["factor"], factor, rtol=1e-12, atol=0)
+    np.testing.assert_allclose(result["rate"], rate, rtol=1e-12, atol=0)
+    np.testing.assert_allclose(result["remaining_mass"], [model.remaining_mass(k, 33.0) for k in rate], rtol=1e-12)
+
+def test_time_to_degrade_matches_scalar_rounding():
+    model = MyceliumKinetics()
+    rate = model.evaluate_batch(environments())["rate"]
+    batch = model.time_to_degrade_batch(rate)
+    scalar = np.array([model.time_to_degrade(k) for k in rate.tolist()])
+    assert np.all(np.abs(batch - scalar) <= 0.1 + 1e-9)
+    assert np.mean(batch == scalar) > 0.999
+
+def test_time_to_degrade_zero_rate_is_infinite():
+    model = MyceliumKinetics()
+    assert model.time_to_degrade_batch(np.array([0.0, 0.1]))[0] == np.inf
@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from benchmarks.stand_ins import SimulatedDroneController
+from core.logistics_controller import LogisticsController
+from core.order_log import BOSS_DROP, CYCLE, DROP, FAILED, OrderLog, OrderReplay
+
+TORONTO = {"lat": 43.65, "lng": -79.38}
+
+def controller():
+    return LogisticsController(drone_fleet=SimulatedDroneController(latency_s=0.0, jitter_s=0.0))
+
+def test_record_and_replay_through_controller(tmp_path):
+    path = str(tmp_path / "orders.mol")
+    recorder = controller()
+    log = recorder.record_orders(OrderLog(path, segment_rows=4))
+    for i in range(3):
+        recorder.full_cycle("butter", {"D3": 333}, TORONTO)
+        recorder.mercy_gel_drop(f"player{i}", TORONTO, "gravy")
+    recorder.boss_reward_gel_drop("player0", TORONTO)
+    log.close()
+    
+    log = OrderLog(path)
+    assert len(log) == 7
+    assert {kind: group["orders"] for kind, group in log.aggregate("kind").items()} == {
+        "cycle": 3, "drop": 3, "boss_drop": 1}
+    
+    replayer = controller()
+    report = OrderReplay(log).to_controller(replayer)
+    assert report["replayed"] == 7 and report["failed"] == 0
+    assert replayer.drone_fleet.drops == 4
+    
+    cycles = OrderReplay(log, kinds=[CYCLE]).to_controller(controller())
+    assert cycles["replayed"] == 3
+
+def test_replay_into_recording_controller_stops():
+    c = controller()
+    log = c.record_orders(OrderLog(segment_rows=3))
+    for _ in range(8):
+        c.full_cycle("butter", {"D3": 333}, TORONTO)
+    report = OrderReplay(log).to_controller(c)
+    assert report["replayed"] == 8
+    assert len(log) == 16  # the replay is recorded, not replayed again
+
+def test_aggregate_labels_plain_columns_by_value():
+    log = OrderLog()
+    log.append(10.0, DROP, "butter", outcome=FAILED)
+    log.append(20.0, BOSS_DROP, "butter")
+    assert set(log.aggregate("outcome", bucket_s=3600.0)) == {0, 1}
+    assert set(log.aggregate("time", bucket_s=15.0)) == {0.0, 15.0}
+
+def test_flush_interval_seals_partial_segment(tmp_path):
+    path = str(tmp_path / "orders.mol")
+    log = OrderLog(path, flush_s=0.0)
+    log.append(1.0, CYCLE, "butter")
+    log.append(2.0, CYCLE, "butter")
+    assert len(OrderLog(path)) >= 1  # on disk before close — a crash keeps it
+
+def test_flush_if_due_seals_idle_tail(tmp_path):
+    path = str(tmp_path / "orders.mol")
+    log = OrderLog(path, flush_s=0.03)
+    log.append(1.0, CYCLE, "butter")
+    assert not log.flush_if_due()
+    assert len(OrderLog(path)) == 0
+    time.sleep(0.033)
+    assert log.flush_if_due()
+    assert len(OrderLog(path)) == 1
+    assert not log.flush_if_due()  # nothing buffered
+
+def test_short_header(tmp_path):
+    torn = tmp_path / "torn.mol"
+    torn.write_bytes(b"MO")
+    log = OrderLog(str(torn))
+    log.append(1.0, CYCLE, "butter")
+    log.close()
+    assert len(OrderLog(str(torn))) == 1
+    foreign = tmp_path / "foreign.mol"
+    foreign.write_bytes(b"{}")
+    with pytest.raises(ValueError, match="Not an order log"):
+        OrderLog(str(foreign))
@@ -0,0 +1,96 @@
+import os
+
+import numpy as np
+import pytest
+
+from core.logistics_controller import LogisticsController
+from core.tag_store import TagStore
+from shards.shard_builder import MercyOSShard, build_shard
+from shards.shard_store import ShardStore
+
+def crash(store):
+    """Log flushed, no closing checkpoint — what a power cut leaves behind"""
+    store.flush()
+    store._file.close()
+
+def test_reopen_after_crash_replays_tail(tmp_path):
+    path = str(tmp_path / "shard.log")
+    store = ShardStore(path, durable=False)
+    store.put_value("history", [1.5, 2.5])
+    store.checkpoint()
+    store.put_value("history", [1.5, 2.5, 3.5])
+    store.put_value("mythic", "lattice_baked")
+    crash(store)
+    
+    store = ShardStore(path, durable=False)
+    assert store.recovered == 2
+    assert store.truncated == 0
+    assert store.value("history") == [1.5, 2.5, 3.5]
+    assert store.value("mythic") == "lattice_baked"
+    store.close()
+
+def test_torn_tail_truncated(tmp_path):
+    path = str(tmp_path / "shard.log")
+    store = ShardStore(path, durable=False)
+    store.put_value("kept", {"a": 1})
+    store.put_value("torn", list(range(99)))
+    crash(store)
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 7)
+    
+    store = ShardStore(path, durable=False)
+    assert store.truncated > 0
+    assert store.value("kept") == {"a": 1}
+    assert "torn" not in store
+    store.put_value("after", 3)  # appends land after the cut, not behind garbage
+    crash(store)
+    assert ShardStore(path, durable=False).value("after") == 3
+
+def test_short_header(tmp_path):
+    torn = tmp_path / "torn.log"
+    torn.write_bytes(b"MSS")
+    store = ShardStore(str(torn), durable=False)
+    assert len(store) == 0
+    store.close()
+    foreign = tmp_path / "foreign.log"
+    foreign.write_bytes(b"{}\n")
+    with pytest.raises(ValueError, match="not a MercyOS shard store"):
+        ShardStore(str(foreign))
+
+def test_typed_values_round_trip(tmp_path):
+    path = str(tmp_path / "shard.log")
+    tags = TagStore()
+    tags.add("00ff", 99.95, "frag_a")
+    tags.add_many(np.array([7, 8], dtype=np.uint64), np.array([50.0, 100.0]), first_fragment=3)
+    shard = MercyOSShard()
+    shard.seen = {(1, 2), (3, 4)}
+    shard.origin = (43.65, -79.38)
+    shard.levels = np.arange(6, dtype=np.float32).reshape(2, 3)
+    shard.tags = tags
+    shard.raw = b"\x00\x01"
+    store = ShardStore(path, durable=False)
+    store.persist(shard)
+    store.close()
+    
+    restored = MercyOSShard()
+    ShardStore(path, durable=False).restore(restored)
+    assert restored.seen == {(1, 2), (3, 4)}
+    assert restored.origin == (43.65, -79.38)
+    assert restored.levels.dtype == np.float32 and np.array_equal(restored.levels, shard.levels)
+    assert restored.raw == b"\x00\x01"
+    assert len(restored.tags) == 3
+    assert restored.tags.fragment_id("00ff") == "frag_a"
+    assert restored.tags.passes(8) and not restored.tags.passes(7)
+
+def test_unencodable_value_raises(tmp_path):
+    store = ShardStore(str(tmp_path / "shard.log"), durable=False)
+    with pytest.raises(TypeError):
+        store.put_value("logistics", object())
+
+def test_linked_logistics_skipped_on_persist(tmp_path):
+    shard = build_shard(flavor_pack=False, store_path=str(tmp_path / "shard.log"))
+    shard.logistics = LogisticsController(drone_fleet=object())  # link_logistics without the sky driver
+    assert "Offline persistence" in shard.sync_burst(False)
+    assert shard._store.skipped == {"logistics"}
+    assert "logistics" not in shard._store
+    assert shard._store.value("mythic") == "lattice_baked"
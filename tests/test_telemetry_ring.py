@@ -0,0 +1,20 @@
+from hardware.telemetry_ring import TelemetryRing
+
+def test_append_drops_bad_samples():
+    ring = TelemetryRing(capacity=33, epoch=1000.0)
+    assert ring.append(1000.0, 120.0, 66.0, 42.0)
+    assert not ring.append(1001.0, float("nan"), 66.0, 42.0)
+    assert not ring.append(1002.0, 120.0, float("nan"), 42.0)
+    assert not ring.append(float("nan"), 120.0, 66.0, 42.0)
+    assert not ring.append(999.0, 120.0, 66.0, 42.0)              # before the epoch
+    assert not ring.append(1000.0 + 2 ** 32, 120.0, 66.0, 42.0)   # past the uint32 decisecond range
+    assert ring.append(1003.0, 120.0, 66.0, 42.0)
+    assert ring.dropped == 5
+    assert len(ring) == 2
+
+def test_nan_first_sample_leaves_epoch_unset():
+    ring = TelemetryRing(capacity=33)
+    assert not ring.append(float("nan"), 120.0, 66.0, 42.0)
+    assert ring.epoch is None
+    assert ring.append(33.0, 120.0, 66.0, 42.0)
+    assert ring.latest()["t"] == 33.0
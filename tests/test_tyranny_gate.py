@@ -0,0 +1,29 @@
+import mmap
+
+from shards.tyranny_gate import TyrannyGate
+
+def gate():
+    return TyrannyGate(["Гнёт", "straße", "violence"])
+
+def test_str_and_bytes_verdicts_match():
+    g = gate()
+    for text in ("ГНЁТ", "Straße", "STRASSE", "no violence", "harmony"):
+        expected = g.blocked(text)
+        assert g.blocked(text.encode()) == expected
+        assert g.blocked(bytearray(text.encode())) == expected
+        assert g.blocked(memoryview(text.encode())) == expected
+    assert g.blocked("ГНЁТ")
+    assert g.blocked("Straße".encode())
+    assert not g.blocked("harmony".encode())
+
+def test_blocked_many_mixed_encodings():
+    g = gate()
+    payloads = ["ГНЁТ".encode(), "Straße".encode(), "mercy", "Гнёт", b"calm", "VIOLENCE".encode()]
+    assert g.blocked_many(payloads) == [True, True, False, True, False, True]
+
+def test_large_non_ascii_mmap(tmp_path):
+    path = tmp_path / "payload.bin"
+    path.write_bytes(("мир " * 333 + "ГНЁТ").encode())
+    g = gate()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        assert g.find(view) == "гнёт"